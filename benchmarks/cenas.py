@@ -0,0 +1,67 @@
+"""
+Cenas reprodutíveis para os benchmarks. Cada cena recebe um GerenciadorJogo
+já reiniciado (com relógio virtual) e povoa as suas listas de entidades com
+as classes reais de `entidades.py` (por `adicionar_entidades`, para valer
+também no backend SoA). O `random` deve ser semeado antes.
+"""
+import math
+import random
+from config import *
+from entidades import Asteroide, OvniX, OvniCruz, NaveFantasma, EstadoFantasma, pool_projeteis
+from vetor import Vetor2D
+import relogio
+
+
+def _posicao_aleatoria() -> Vetor2D:
+    return Vetor2D(random.uniform(0, LARGURA_TELA), random.uniform(0, ALTURA_TELA))
+
+
+def asteroides(jogo, por_tamanho: int = 20):
+    jogo.limpar_entidades("asteroides")
+    for tamanho in Asteroide.TAMANHOS:
+        jogo.adicionar_entidades("asteroides", [Asteroide(_posicao_aleatoria(), tamanho) for _ in range(por_tamanho)])
+
+
+def rajada_projeteis(jogo, quantidade: int = 300):
+    """Leque de projéteis saindo do centro, como vários tiros triplos seguidos."""
+    centro = jogo.get_nave().get_posicao()
+    for i in range(quantidade):
+        direcao = Vetor2D(0, -1).rotacionar(2 * math.pi * i / quantidade)
+        jogo.adicionar_entidades("projeteis", (pool_projeteis.obter(centro + direcao * (20 + i % 40), direcao * VELOCIDADE_PROJETIL),))
+
+
+def ovnis_atirando(jogo, quantidade: int = 6):
+    """OVNIs lentos espalhados pela tela, com o cooldown de tiro já vencido."""
+    for i in range(quantidade):
+        classe = OvniX if i % 2 == 0 else OvniCruz
+        ovni = classe(_posicao_aleatoria(), Vetor2D(0.1 if i % 3 else -0.1, 0))
+        ovni._OVNI__ultimo_tiro_tempo_ms = relogio.get_ticks() - COOLDOWN_TIRO_OVNI_MS - 1
+        jogo.adicionar_entidades("ovnis", (ovni,))
+
+
+def fantasma_ativo(jogo):
+    """Uma NaveFantasma visível, carregando o disparo contra a nave."""
+    fantasma = NaveFantasma()
+    fantasma.set_estado(EstadoFantasma.CARREGANDO)
+    fantasma.set_ativo(True)
+    fantasma.set_posicao(Vetor2D(LARGURA_TELA * 0.25, ALTURA_TELA * 0.25))
+    fantasma.set_tempo_proxima_acao(relogio.get_ticks() + DURACAO_FANTASMA_CARREGANDO_MS)
+    fantasma.set_alvo_disparo(jogo.get_nave().get_posicao().copia())
+    jogo.limpar_entidades("fantasmas")
+    jogo.adicionar_entidades("fantasmas", (fantasma,))
+
+
+def completa(jogo):
+    asteroides(jogo)
+    rajada_projeteis(jogo)
+    ovnis_atirando(jogo)
+    fantasma_ativo(jogo)
+
+
+CENAS = {
+    "asteroides": asteroides,
+    "rajada_projeteis": lambda jogo: (asteroides(jogo, 5), rajada_projeteis(jogo)),
+    "ovnis": lambda jogo: (asteroides(jogo, 5), ovnis_atirando(jogo)),
+    "fantasma": lambda jogo: (asteroides(jogo, 5), fantasma_ativo(jogo)),
+    "completa": completa,
+}
@@ -0,0 +1,138 @@
+"""
+Mede, frame a frame, o custo de cada fase do jogo em cenas fixas:
+
+    python benchmarks/executar.py [--frames N] [--aquecimento N] [--backend objetos|numpy] [--comparar]
+
+Cada execução é anexada (uma linha JSON) ao histórico, junto com o commit
+atual, para que regressões possam ser comparadas entre commits.
+"""
+import argparse
+import datetime
+import json
+import os
+import pathlib
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+RAIZ = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from config import *
+from gerenciador import GerenciadorJogo, FundoEstrelado
+from relogio import RelogioVirtual
+from cenas import CENAS
+
+ARQUIVO_HISTORICO = RAIZ / "benchmarks" / "historico.jsonl"
+FASES = ("atualizar_objetos", "checar_colisoes", "desenhar_entidades", "fundo_estrelado")
+
+
+def _resumo(amostras_ms: list[float]) -> dict:
+    ordenadas = sorted(amostras_ms)
+    return {"media_ms": round(statistics.fmean(ordenadas), 4),
+            "p50_ms": round(ordenadas[len(ordenadas) // 2], 4),
+            "p95_ms": round(ordenadas[min(len(ordenadas) - 1, int(len(ordenadas) * 0.95))], 4),
+            "max_ms": round(ordenadas[-1], 4)}
+
+
+def medir_cena(nome: str, tela: pygame.Surface, frames: int, backend: str, semente: int = 42, aquecimento: int = 5) -> dict:
+    """
+    Mede `frames` frames da cena. Os `aquecimento` primeiros frames rodam sem
+    medição: neles são montadas as camadas do fundo estrelado e preenchidos
+    os caches de rotação e de texto, custos que não se repetem no jogo.
+    """
+    random.seed(semente)
+    relogio_virtual = RelogioVirtual(10_000)
+    jogo = GerenciadorJogo(tela, None, None, backend, relogio_virtual, arquivo_trace=None, semente=semente)
+    jogo.reiniciar_jogo_completo(apagar_save=False)
+    jogo.get_nave().set_invulneravel_fim(10 ** 12)  # a nave não morre durante a medição
+    # Os pools são globais ao processo: zerados aqui, os números são só desta cena
+    jogo.zerar_estatisticas_pools()
+    CENAS[nome](jogo)
+    fundo = FundoEstrelado()
+    dt = 1 / FPS
+    amostras = {fase: [] for fase in FASES}
+    relogio_ms = time.perf_counter
+    for frame in range(aquecimento + frames):
+        relogio_virtual.avancar(dt * 1000)
+        t0 = relogio_ms()
+        jogo._atualizar_objetos(dt)
+        t1 = relogio_ms()
+        jogo._checar_colisoes()
+        t2 = relogio_ms()
+        tela.fill(PRETO)
+        jogo._desenhar_entidades()
+        t3 = relogio_ms()
+        fundo.atualizar(dt); fundo.desenhar(tela)
+        t4 = relogio_ms()
+        if frame < aquecimento: continue
+        for fase, inicio, fim in zip(FASES, (t0, t1, t2, t3), (t1, t2, t3, t4)):
+            amostras[fase].append((fim - inicio) * 1000)
+    contagens = {lista: len(entidades) for lista, entidades in jogo.get_listas_entidades().items()}
+    pools = jogo.get_estatisticas_pools()
+    # Devolve os tiros da cena aos pools; senão a próxima cena os contaria como em uso
+    jogo.reiniciar_jogo_completo(apagar_save=False)
+    return {"fases": {fase: _resumo(valores) for fase, valores in amostras.items()}, "entidades_no_fim": contagens,
+            "pools": pools}
+
+
+def _commit_atual() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=RAIZ, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "desconhecido"
+
+
+def _ultimo_registro(backend: str):
+    if not ARQUIVO_HISTORICO.exists(): return None
+    ultimo = None
+    with open(ARQUIVO_HISTORICO, "r") as f:
+        for linha in f:
+            try: registro = json.loads(linha)
+            except json.JSONDecodeError: continue
+            if registro.get("backend") == backend: ultimo = registro
+    return ultimo
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks por fase do loop do jogo")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--aquecimento", type=int, default=5, help="frames rodados antes de começar a medir")
+    parser.add_argument("--backend", choices=("objetos", "numpy"), default=BACKEND_ENTIDADES)
+    parser.add_argument("--cenas", nargs="*", choices=sorted(CENAS), default=list(CENAS))
+    parser.add_argument("--comparar", action="store_true", help="mostra a variação em relação à última execução do histórico")
+    parser.add_argument("--nao-salvar", action="store_true", help="não grava a execução no histórico")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    tela = pygame.display.set_mode((LARGURA_TELA, ALTURA_TELA))
+    anterior = _ultimo_registro(args.backend) if args.comparar else None
+
+    registro = {"data": datetime.datetime.now().isoformat(timespec="seconds"), "commit": _commit_atual(), "backend": args.backend,
+                "frames": args.frames, "aquecimento": args.aquecimento, "python": platform.python_version(), "pygame": pygame.version.ver, "cenas": {}}
+    for nome in args.cenas:
+        resultado = medir_cena(nome, tela, args.frames, args.backend, aquecimento=args.aquecimento)
+        registro["cenas"][nome] = resultado
+        print(f"\n== {nome} ==  entidades no fim: {resultado['entidades_no_fim']}")
+        for fase, resumo in resultado["fases"].items():
+            linha = f"  {fase:<20} média {resumo['media_ms']:8.3f} ms   p95 {resumo['p95_ms']:8.3f} ms   máx {resumo['max_ms']:8.3f} ms"
+            base = anterior and anterior["cenas"].get(nome, {}).get("fases", {}).get(fase)
+            if base and base["media_ms"] > 0:
+                linha += f"   ({(resumo['media_ms'] / base['media_ms'] - 1) * 100:+6.1f}% vs {anterior['commit']})"
+            print(linha)
+        print("  pools: " + ", ".join(f"{nome} pico {p['pico_em_uso']} (criados {p['criados']}, reaproveitados {p['reaproveitados']})" for nome, p in resultado["pools"].items()))
+
+    if not args.nao_salvar:
+        with open(ARQUIVO_HISTORICO, "a") as f: f.write(json.dumps(registro) + "\n")
+        print(f"\nResultados anexados a {ARQUIVO_HISTORICO.relative_to(RAIZ)}")
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+from typing import Sequence
+import pygame
+
+
+class GradeEspacial:
+    """
+    Broadphase de colisões por hash espacial uniforme.
+
+    Cada objeto é registrado em todas as células que o seu `rect` toca, então
+    dois objetos cujos rects se sobrepõem sempre dividem ao menos uma célula:
+    os candidatos devolvidos contêm todos os pares que `GameObject.colide_com`
+    aceitaria. As células ficam num dicionário, o que cobre naturalmente a
+    margem fora da tela (de -raio até a borda + raio) usada pelo wrap-around
+    de `GameObject.atualizar`. Como `colide_com` não testa através da borda,
+    a grade também não "dobra" as coordenadas.
+
+    Os objetos são identificados pelo índice na sequência passada a
+    `construir`, e os resultados saem sempre em ordem crescente, para que o
+    chamador percorra os candidatos na mesma ordem do laço força-bruta.
+    """
+    def __init__(self, tamanho_celula: float):
+        self.__tamanho_celula = max(1, int(tamanho_celula))
+        self.__celulas: dict[tuple[int, int], list[int]] = {}
+        self.__objetos: Sequence = ()
+
+    def get_tamanho_celula(self) -> int: return self.__tamanho_celula
+    def get_num_celulas(self) -> int: return len(self.__celulas)
+
+    def __faixa_celulas(self, rect: pygame.Rect) -> tuple[range, range]:
+        t = self.__tamanho_celula
+        return range(rect.left // t, (rect.right - 1) // t + 1), range(rect.top // t, (rect.bottom - 1) // t + 1)
+
+    def construir(self, objetos: Sequence) -> None:
+        """Refaz a grade com os objetos ativos que possuem rect."""
+        self.__objetos = objetos
+        self.__celulas = celulas = {}
+        for indice, obj in enumerate(objetos):
+            rect = obj.get_rect()
+            if rect is None or not obj.is_ativo(): continue
+            faixa_x, faixa_y = self.__faixa_celulas(rect)
+            for cx in faixa_x:
+                for cy in faixa_y:
+                    celula = celulas.get((cx, cy))
+                    if celula is None: celulas[(cx, cy)] = [indice]
+                    else: celula.append(indice)
+
+    def candidatos(self, rect: pygame.Rect) -> list[int]:
+        """Índices (ordenados) dos objetos cujo rect intercepta `rect`."""
+        encontrados = set()
+        faixa_x, faixa_y = self.__faixa_celulas(rect)
+        for cx in faixa_x:
+            for cy in faixa_y:
+                celula = self.__celulas.get((cx, cy))
+                if celula: encontrados.update(celula)
+        objetos = self.__objetos
+        return sorted(i for i in encontrados if rect.colliderect(objetos[i].get_rect()))
+
+    def pares_candidatos(self) -> list[tuple[int, int]]:
+        """Pares (i, j), i < j, com rects sobrepostos, em ordem lexicográfica."""
+        pares = set()
+        objetos = self.__objetos
+        for celula in self.__celulas.values():
+            n = len(celula)
+            if n < 2: continue
+            for a in range(n):
+                i = celula[a]
+                rect_i = objetos[i].get_rect()
+                for b in range(a + 1, n):
+                    j = celula[b]
+                    if rect_i.colliderect(objetos[j].get_rect()): pares.add((i, j))
+        return sorted(pares)
+
+
+def _teste_estresse():
+    """Compara a grade com o laço O(n²) em cenas com milhares de asteroides."""
+    import os
+    import random
+    import time
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    from config import LARGURA_TELA, ALTURA_TELA
+    from entidades import Asteroide
+    from vetor import Vetor2D
+
+    random.seed(1234)
+    tamanho_celula = 2 * max(raio for raio, _ in Asteroide.TAMANHOS.values())
+    print(f"{'N':>6} {'pares':>7} {'grade (ms)':>11} {'n² (ms)':>9}")
+    for n in (250, 500, 1000, 2000, 4000):
+        # A área cresce junto com N para manter a densidade constante
+        escala = (n / 250) ** 0.5
+        asteroides = [Asteroide(Vetor2D(random.uniform(0, LARGURA_TELA * escala), random.uniform(0, ALTURA_TELA * escala)), random.choice(list(Asteroide.TAMANHOS))) for _ in range(n)]
+        inicio = time.perf_counter()
+        grade = GradeEspacial(tamanho_celula)
+        grade.construir(asteroides)
+        pares_grade = [(i, j) for i, j in grade.pares_candidatos() if asteroides[i].colide_com(asteroides[j])]
+        tempo_grade = (time.perf_counter() - inicio) * 1000
+        tempo_bruto = float("nan")
+        if n <= 2000:
+            inicio = time.perf_counter()
+            pares_bruto = [(i, j) for i in range(n) for j in range(i + 1, n) if asteroides[i].colide_com(asteroides[j])]
+            tempo_bruto = (time.perf_counter() - inicio) * 1000
+            assert pares_grade == pares_bruto, "A grade divergiu do laço força-bruta"
+        print(f"{n:>6} {len(pares_grade):>7} {tempo_grade:>11.2f} {tempo_bruto:>9.2f}")
+
+
+if __name__ == '__main__':
+    _teste_estresse()
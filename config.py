@@ -20,7 +20,7 @@ COR_PROJETIL_OVNI = VERMELHO
 # Configurações da Tela
 LARGURA_TELA = 800
 ALTURA_TELA = 600
-FPS = 60
+FPS = 60  # também a unidade das constantes "por frame" abaixo (giro, atrito, vida dos tiros)
 TITULO_JOGO = "Asteroids UFV-CRP"
 
 # Nave
@@ -67,30 +67,95 @@ VELOCIDADE_LASER_FANTASMA = 12
 # Timings em milissegundos (1000ms = 1s)
 DURACAO_FANTASMA_CARREGANDO_MS = 2500
 DURACAO_FANTASMA_INVISIVEL_MS = 4000
+MENSAGENS_DEPURACAO_FANTASMA = True  # imprime as transições de estado da nave fantasma
+AVISO_SOM_FANTASMA_MS = 1500       # o loop 'fantasma_invisivel' toca neste trecho final antes de ele aparecer
 DURACAO_LASER_FANTASMA_MS = 250     
 COR_FANTASMA = (180, 0, 255)       # Roxo
 COR_FANTASMA_CARREGANDO = BRANCO   # Cor do indicador de carga
 COR_FANTASMA_LASER = (255, 0, 220) # Rosa choque
 
 
+# Backend de atualização de asteroides/projéteis: "objetos" ou "numpy" (SoA, requer NumPy)
+BACKEND_ENTIDADES = "objetos"
+
+# Perfilador de frames (F3 mostra o overlay). O trace (.csv ou .json) é gravado ao sair de cada partida; None desativa
+TECLA_OVERLAY_PERFIL = "f3"
+ARQUIVO_TRACE_PERFIL = os.path.join("perfil", "trace_frames.csv")
+
+# Renderização por retângulos sujos (opcional): acima desta fração da tela
+# alterada no frame, um flip completo é usado no lugar de display.update
+RENDERIZACAO_SUJA = False
+LIMITE_AREA_SUJA = 0.5
+
+# Simulação em pipeline (opcional): a lógica do frame seguinte roda numa
+# thread enquanto o frame atual é desenhado, com um frame de atraso na tela
+SIMULACAO_EM_PARALELO = False
+
+# Física em passo fixo: a simulação avança TAXA_FISICA passos por segundo,
+# independente da taxa de desenho, e o desenho interpola entre os dois
+# últimos passos. 0 volta ao passo variável (o delta do clock a cada frame).
+# Com a máquina atrasada, no máximo MAX_PASSOS_FISICA_POR_FRAME passos são
+# recuperados por frame; o resto do atraso é descartado (o jogo desacelera).
+TAXA_FISICA = 60
+LIMITE_FPS_RENDERIZACAO = FPS
+MAX_PASSOS_FISICA_POR_FRAME = 5
+
+# Pools de tiros e lasers: quantos objetos livres cada pool guarda no máximo
+TAMANHO_MAXIMO_POOL = 512
+
+# Atlas de rotação (quantos ângulos distintos por volta completa)
+PASSOS_ROTACAO_ATLAS = 360
+# Quadros de rotação são gerados sob demanda (cada um uma vez só). True gera todos no
+# pré-carregamento do menu: ~36 MB, a maior parte de sprites que a partida pode nem usar
+PRE_CARREGAR_QUADROS_ROTACAO = False
+
+
 # Fundo Estrelado
 NUM_ESTRELAS_LENTAS = 50
 NUM_ESTRELAS_RAPIDAS = 30
 VELOCIDADE_ESTRELAS_LENTA = 1
 VELOCIDADE_ESTRELAS_RAPIDA = 3
+# Camadas de parallax, de trás para frente: (número de estrelas, velocidade, raio, cor).
+# Cada camada é pré-renderizada uma vez, então o número de estrelas não pesa no frame.
+CAMADAS_ESTRELAS = (
+    (NUM_ESTRELAS_LENTAS, VELOCIDADE_ESTRELAS_LENTA, 1, (150, 150, 150)),
+    (NUM_ESTRELAS_RAPIDAS, VELOCIDADE_ESTRELAS_RAPIDA, 2, COR_ESTRELA),
+)
 
 # Sons
 VOLUME_MUSICA_PADRAO = 0.5
 VOLUME_SFX_PADRAO = 0.7
 
 
+# Canais reservados do mixer por categoria de efeito sonoro (ver mixer_eventos.py)
+CANAIS_POR_CATEGORIA_SOM = {"tiros": 2, "explosoes": 3, "inimigos": 2, "ambiente": 2}
+# Efeitos decodificados já no pré-carregamento; os demais só no primeiro uso
+SONS_PRE_CARREGADOS = ("tiro", "explosao_asteroide", "explosao_nave")
+# Loops longos: ficam em memória só comprimidos e são decodificados apenas enquanto tocam
+SONS_EM_FLUXO = ("ovni_movendo", "fantasma_invisivel")
+
 # Power-up Tiro Triplo
 DURACAO_TIRO_TRIPLO_SEGUNDOS = 15
 ANGULO_TIRO_TRIPLO_GRAUS = 20
 
 # Arquivos
-ARQUIVO_HIGH_SCORES = "high_scores.json"
-ARQUIVO_SAVE_GAME = "savegame.json"
+ARQUIVO_HIGH_SCORES = "high_scores.json"  # formato antigo, importado uma vez pelo ranking
+ARQUIVO_RANKING_DB = "high_scores.db"
+TAMANHO_TOP_RANKING = 10
+TAMANHO_PAGINA_RANKING = 10
+# Onde o ranking fica: "sqlite" ou "diario" (snapshot + diário só de acréscimos; também usado se faltar o sqlite3)
+BACKEND_RANKING = "sqlite"
+ARQUIVO_RANKING_SNAPSHOT = "high_scores.snapshot.json"
+ARQUIVO_RANKING_DIARIO = "high_scores.diario"
+LOTE_FSYNC_RANKING = 16  # fsync a cada tantos scores novos...
+INTERVALO_FSYNC_RANKING_SEGUNDOS = 2.0  # ...ou quando o último fsync ficou para trás há este tempo
+LIMITE_COMPACTACAO_RANKING = 500  # linhas no diário antes de dobrá-lo num snapshot novo
+ARQUIVO_SAVE_GAME = "savegame.sav"
+ARQUIVO_SAVE_GAME_JSON = "savegame.json"  # formato antigo, ainda lido para migração
+# Autosave: um anel de pontos de restauração, gravado a cada intervalo de jogo
+INTERVALO_AUTOSAVE_SEGUNDOS = 30
+NUM_PONTOS_RESTAURACAO = 5
+DIRETORIO_AUTOSAVE = "autosaves"
 
 
 # --- Assets (usando os caminhos absolutos para a estrutura assets/images e assets/sounds) ---
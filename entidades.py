@@ -1,19 +1,51 @@
-from typing import Optional
+from typing import Callable, Optional
+import os
 import pygame
 import math
 import random
 from enum import Enum, auto
 from config import *
 from vetor import Vetor2D
+import relogio
+from recursos import recursos
+from rotacao import AtlasRotacao, get_atlas
+from pool import PoolObjetos
+import soa
 
 CLASSE_MAP = {}
 
+# --- Imagens substitutas, usadas quando o arquivo do sprite não pode ser lido ---
+def _fallback_nave() -> pygame.Surface:
+    return pygame.Surface((30, 30), pygame.SRCALPHA)
+
+def _fallback_projetil() -> pygame.Surface:
+    imagem = pygame.Surface((5, 10), pygame.SRCALPHA)
+    pygame.draw.rect(imagem, BRANCO, (0, 0, 5, 10))
+    return imagem
+
+def _fallback_asteroide(raio: int) -> pygame.Surface:
+    imagem = pygame.Surface((raio * 2, raio * 2), pygame.SRCALPHA)
+    pygame.draw.circle(imagem, CINZA_CLARO, (raio, raio), raio, 1)
+    return imagem
+
+def _fallback_ovni_projetil() -> pygame.Surface:
+    imagem = pygame.Surface((8, 8), pygame.SRCALPHA)
+    pygame.draw.circle(imagem, VERMELHO, (4, 4), 4)
+    return imagem
+
+def _fallback_laser_fantasma() -> pygame.Surface:
+    imagem = pygame.Surface((4, 12), pygame.SRCALPHA)
+    pygame.draw.rect(imagem, COR_FANTASMA_LASER, (0, 0, 4, 12))
+    return imagem
+
 class GameObject:
     def __init__(self, posicao: Vetor2D, velocidade: Vetor2D, raio: float):
         self.__posicao = posicao
         self.__velocidade = velocidade
         self.__raio = raio
         self.__ativo = True
+        # Centro do rect antes do último passo de física, para o desenho interpolar entre os dois passos
+        self.__centro_anterior: Optional[tuple[int, int]] = None
         self.image: pygame.Surface | None = None
         self.rect: pygame.Rect | None = None
         self.mask: pygame.mask.Mask | None = None
@@ -24,35 +56,52 @@ class GameObject:
     def is_ativo(self) -> bool: return self.__ativo
     def get_rect(self) -> Optional[pygame.Rect]: return self.rect
 
-    def set_posicao(self, nova_posicao: Vetor2D): self.__posicao = nova_posicao
+    def set_posicao(self, nova_posicao: Vetor2D):
+        self.__posicao = nova_posicao
+        self.__centro_anterior = None  # teleporte (respawn, reúso do pool): nada a interpolar
     def set_velocidade(self, nova_velocidade: Vetor2D): self.__velocidade = nova_velocidade
     def set_ativo(self, estado: bool): self.__ativo = estado
 
+    def deslocar(self, deslocamento: Vetor2D, escala: float = 1.0) -> None:
+        """Empurra o objeto (pos += deslocamento * escala), sem contar como teleporte."""
+        self.__posicao.iadd_escalado(deslocamento, escala)
+
     def atualizar(self, delta_tempo: float) -> None:
-        # Pega os valores atuais usando os getters
-        posicao_atual = self.get_posicao()
-        velocidade_atual = self.get_velocidade()
         raio = self.get_raio()
 
-        # Calcula a nova posição em uma nova variável
-        nova_posicao = posicao_atual + velocidade_atual * delta_tempo * FPS
-        
-        # Atribui a nova posição de volta ao objeto usando o setter
-        self.set_posicao(nova_posicao)
-        
-        # A lógica de "wrap-around" agora usa a nova posição
-        if nova_posicao.get_x() < -raio: nova_posicao.set_x(LARGURA_TELA + raio)
-        elif nova_posicao.get_x() > LARGURA_TELA + raio: nova_posicao.set_x(-raio)
-        if nova_posicao.get_y() < -raio: nova_posicao.set_y(ALTURA_TELA + raio)
-        elif nova_posicao.get_y() > ALTURA_TELA + raio: nova_posicao.set_y(-raio)
+        # Move a posição in-place (pos += vel * dt * FPS) e aplica o "wrap-around",
+        # sem alocar vetores intermediários
+        posicao = self.__posicao
+        posicao.iadd_escalado(self.__velocidade, delta_tempo * FPS)
+        posicao.envolver(-raio, LARGURA_TELA + raio, -raio, ALTURA_TELA + raio)
 
         # Atualiza a posição do retângulo do sprite
         if self.rect:
-            self.rect.center = nova_posicao.para_tupla()
-
-    def desenhar(self, tela: pygame.Surface) -> None:
+            self.rect.center = (int(posicao.x), int(posicao.y))
+
+    def guardar_estado_anterior(self) -> None:
+        self.__centro_anterior = self.rect.center if self.rect else None
+
+    def get_centro_anterior(self) -> Optional[tuple[int, int]]: return self.__centro_anterior
+
+    def get_deslocamento_interpolado(self, alfa: float) -> tuple[int, int]:
+        """
+        Quanto deslocar o sprite para desenhá-lo a `alfa` (0 a 1) do caminho
+        entre o passo de física anterior e o atual. Um salto maior que meia
+        tela é o wrap-around, que não é interpolado.
+        """
+        if alfa >= 1: return 0, 0
+        anterior, rect = self.get_centro_anterior(), self.rect
+        if anterior is None or not rect: return 0, 0
+        dx, dy = anterior[0] - rect.centerx, anterior[1] - rect.centery
+        if abs(dx) > LARGURA_TELA / 2 or abs(dy) > ALTURA_TELA / 2: return 0, 0
+        return round(dx * (1 - alfa)), round(dy * (1 - alfa))
+
+    def desenhar(self, tela: pygame.Surface, alfa: float = 1.0) -> Optional[pygame.Rect]:
+        """Desenha o objeto e devolve a área da tela que foi alterada (None se nada foi desenhado)."""
         if self.is_ativo() and self.image and self.rect:
-            tela.blit(self.image, self.rect)
+            return tela.blit(self.image, self.rect.move(self.get_deslocamento_interpolado(alfa)))
+        return None
 
     def colide_com(self, outro_objeto: 'GameObject') -> bool:
         if not self.is_ativo() or not outro_objeto.is_ativo(): return False
@@ -72,20 +121,111 @@ class GameObject:
     def restaurar_estado_base(self, data: dict):
         self.set_ativo(data.get("ativo", True))
 
+class EntidadeSoA(GameObject):
+    """
+    GameObject cujo estado pode morar numa vaga de um `soa.BlocoSoA` (backend
+    "numpy"). Enquanto vinculada, posição, velocidade e centro do rect são
+    lidos e escritos direto nas colunas do bloco; `get_posicao` e
+    `get_velocidade` devolvem cópias, então mudanças passam pelos setters ou
+    por `deslocar`. Quem a move é o `soa.ArmazemSoA`, não `atualizar`. Ao ser
+    desativada, a entidade sai do bloco e volta a guardar o próprio estado.
+    Desvinculada, comporta-se como um GameObject.
+    """
+    def __init__(self, posicao: Vetor2D, velocidade: Vetor2D, raio: float):
+        self.__bloco: Optional['soa.BlocoSoA'] = None
+        self.__vaga = -1
+        self.__rect: Optional[pygame.Rect] = None
+        super().__init__(posicao, velocidade, raio)
+
+    def get_bloco_soa(self) -> Optional['soa.BlocoSoA']: return self.__bloco
+    def get_vaga_soa(self) -> int: return self.__vaga
+    def set_vaga_soa(self, vaga: int): self.__vaga = vaga
+
+    def vincular_soa(self, bloco: 'soa.BlocoSoA', vaga: int) -> None:
+        """Copia o estado para a vaga do bloco, que passa a ser a fonte da verdade (chamado pelo bloco)."""
+        d, posicao, velocidade = bloco.dados, GameObject.get_posicao(self), GameObject.get_velocidade(self)
+        d[soa.X, vaga], d[soa.Y, vaga], d[soa.VX, vaga], d[soa.VY, vaga] = posicao.x, posicao.y, velocidade.x, velocidade.y
+        d[soa.RAIO, vaga] = self.get_raio()
+        d[soa.CX, vaga], d[soa.CY, vaga] = self.__rect.center
+        # Círculo que cobre o rect de qualquer rotação da imagem (+ folga do arredondamento do rotate)
+        largura, altura = self.original_image.get_size()
+        d[soa.ENVOLVENTE, vaga] = (largura + altura) / 2 + 3
+        self.__bloco, self.__vaga = bloco, vaga
+
+    def desvincular_soa(self) -> None:
+        """Traz o estado da vaga de volta para o objeto (chamado pelo bloco)."""
+        d, vaga = self.__bloco.dados, self.__vaga
+        rect = self.rect
+        GameObject.set_posicao(self, Vetor2D(d[soa.X, vaga], d[soa.Y, vaga]))
+        GameObject.set_velocidade(self, Vetor2D(d[soa.VX, vaga], d[soa.VY, vaga]))
+        self.__bloco, self.__vaga, self.__rect = None, -1, rect
+
+    def get_posicao(self) -> Vetor2D:
+        if self.__bloco is None: return GameObject.get_posicao(self)
+        d, vaga = self.__bloco.dados, self.__vaga
+        return Vetor2D(d[soa.X, vaga], d[soa.Y, vaga])
+
+    def get_velocidade(self) -> Vetor2D:
+        if self.__bloco is None: return GameObject.get_velocidade(self)
+        d, vaga = self.__bloco.dados, self.__vaga
+        return Vetor2D(d[soa.VX, vaga], d[soa.VY, vaga])
+
+    def set_posicao(self, nova_posicao: Vetor2D):
+        if self.__bloco is None: return GameObject.set_posicao(self, nova_posicao)
+        d, vaga = self.__bloco.dados, self.__vaga
+        d[soa.X, vaga], d[soa.Y, vaga] = nova_posicao.x, nova_posicao.y
+        d[soa.TEM_ANTERIOR, vaga] = 0
+
+    def set_velocidade(self, nova_velocidade: Vetor2D):
+        if self.__bloco is None: return GameObject.set_velocidade(self, nova_velocidade)
+        d, vaga = self.__bloco.dados, self.__vaga
+        d[soa.VX, vaga], d[soa.VY, vaga] = nova_velocidade.x, nova_velocidade.y
+
+    def set_ativo(self, estado: bool):
+        if not estado and self.__bloco is not None: self.__bloco.remover(self.__vaga)
+        GameObject.set_ativo(self, estado)
+
+    def deslocar(self, deslocamento: Vetor2D, escala: float = 1.0) -> None:
+        if self.__bloco is None: return GameObject.deslocar(self, deslocamento, escala)
+        d, vaga = self.__bloco.dados, self.__vaga
+        d[soa.X, vaga] += deslocamento.x * escala
+        d[soa.Y, vaga] += deslocamento.y * escala
+
+    @property
+    def rect(self) -> Optional[pygame.Rect]:
+        if self.__bloco is None: return self.__rect
+        d, vaga = self.__bloco.dados, self.__vaga
+        return self.image.get_rect(center=(int(d[soa.CX, vaga]), int(d[soa.CY, vaga])))
+
+    @rect.setter
+    def rect(self, rect: Optional[pygame.Rect]):
+        if self.__bloco is None: self.__rect = rect
+        else: self.__bloco.dados[soa.CX, self.__vaga], self.__bloco.dados[soa.CY, self.__vaga] = rect.center
+
+    def guardar_estado_anterior(self) -> None:
+        if self.__bloco is None: return GameObject.guardar_estado_anterior(self)
+        d, vaga = self.__bloco.dados, self.__vaga
+        d[soa.CX_ANTERIOR, vaga], d[soa.CY_ANTERIOR, vaga], d[soa.TEM_ANTERIOR, vaga] = d[soa.CX, vaga], d[soa.CY, vaga], 1
+
+    def get_centro_anterior(self) -> Optional[tuple[int, int]]:
+        if self.__bloco is None: return GameObject.get_centro_anterior(self)
+        d, vaga = self.__bloco.dados, self.__vaga
+        return (int(d[soa.CX_ANTERIOR, vaga]), int(d[soa.CY_ANTERIOR, vaga])) if d[soa.TEM_ANTERIOR, vaga] else None
+
+def desenhar_fogo_motor(tela: pygame.Surface, vertices: list[tuple[float, float]]) -> pygame.Rect:
+    return pygame.draw.polygon(tela, VERMELHO, vertices, 0)
+
 class Nave(GameObject):
     def __init__(self, posicao: Vetor2D):
         super().__init__(posicao, Vetor2D(), 15)
         self.__angulo_graus = 0.0
         self.__rotacionando_esquerda, self.__rotacionando_direita, self.__acelerando = False, False, False
         self.__ultimo_tiro_tempo, self.__tem_tiro_triplo, self.__tempo_fim_tiro_triplo, self.__tempo_invulneravel_fim = 0, False, 0, 0
-        try:
-            self.original_image = pygame.image.load(IMAGEM_NAVE).convert_alpha()
-        except pygame.error:
-            self.original_image = pygame.Surface((self.get_raio() * 2, self.get_raio() * 2), pygame.SRCALPHA)
+        self.original_image = recursos.get_imagem(IMAGEM_NAVE, _fallback_nave)
+        self.__atlas = get_atlas(self.original_image)
 
-        self.image = self.original_image
+        self.image, self.mask = self.__atlas.get_quadro(0)
         self.rect = self.image.get_rect(center=self.get_posicao().para_tupla())
-        self.mask = pygame.mask.from_surface(self.image)
 
     def get_angulo(self) -> float: return self.__angulo_graus
     def set_angulo(self, angulo: float): self.__angulo_graus = angulo
@@ -98,54 +238,66 @@ class Nave(GameObject):
     def tem_tiro_triplo(self) -> bool: return self.__tem_tiro_triplo
     def set_tem_tiro_triplo(self, estado: bool): self.__tem_tiro_triplo = estado
     def set_tempo_fim_tiro_triplo(self, tempo: int): self.__tempo_fim_tiro_triplo = tempo
-    def is_invulneravel(self) -> bool: return pygame.time.get_ticks() < self.get_invulneravel_fim()
-
-    def desenhar(self, tela: pygame.Surface) -> None:
-        if not self.is_ativo(): return
-        if self.is_invulneravel() and (pygame.time.get_ticks() // 100) % 2 == 0: return
-        super().desenhar(tela)
-        if self.__acelerando:
-            angulo_rad = math.radians(self.get_angulo())
-            pos, raio = self.get_posicao(), self.get_raio()
-            tras, esq, dir_ = Vetor2D(0, raio * 1.2).rotacionar(angulo_rad), Vetor2D(-raio * 0.3, raio * 0.8).rotacionar(angulo_rad), Vetor2D(raio * 0.3, raio * 0.8).rotacionar(angulo_rad)
-            fogo = [(pos + tras).para_tupla(), (pos + esq).para_tupla(), (pos + dir_).para_tupla()]
-            pygame.draw.polygon(tela, VERMELHO, fogo, 0)
+    def is_invulneravel(self) -> bool: return relogio.get_ticks() < self.get_invulneravel_fim()
+
+    def is_visivel(self) -> bool:
+        # Invulnerável, a nave pisca a cada 100 ms
+        return self.is_ativo() and not (self.is_invulneravel() and (relogio.get_ticks() // 100) % 2 == 0)
+
+    def get_fogo_motor(self, alfa: float = 1.0) -> Optional[list[tuple[float, float]]]:
+        """Vértices da chama do motor, ou None quando a nave não está acelerando."""
+        if not self.__acelerando: return None
+        angulo_rad = math.radians(self.get_angulo())
+        pos, raio = self.get_posicao() + Vetor2D(*self.get_deslocamento_interpolado(alfa)), self.get_raio()
+        tras, esq, dir_ = Vetor2D(0, raio * 1.2).rotacionar(angulo_rad), Vetor2D(-raio * 0.3, raio * 0.8).rotacionar(angulo_rad), Vetor2D(raio * 0.3, raio * 0.8).rotacionar(angulo_rad)
+        return [(pos + tras).para_tupla(), (pos + esq).para_tupla(), (pos + dir_).para_tupla()]
+
+    def desenhar(self, tela: pygame.Surface, alfa: float = 1.0) -> Optional[pygame.Rect]:
+        if not self.is_visivel(): return None
+        area = super().desenhar(tela, alfa)
+        fogo = self.get_fogo_motor(alfa)
+        if fogo:
+            area_fogo = desenhar_fogo_motor(tela, fogo)
+            area = area.union(area_fogo) if area else area_fogo
+        return area
 
     def atualizar(self, delta_tempo: float) -> None:
-        if self.tem_tiro_triplo() and pygame.time.get_ticks() >= self.__tempo_fim_tiro_triplo: self.set_tem_tiro_triplo(False)
-        if self.__rotacionando_esquerda: self.set_angulo(self.get_angulo() - VELOCIDADE_ROTACAO_NAVE)
-        if self.__rotacionando_direita: self.set_angulo(self.get_angulo() + VELOCIDADE_ROTACAO_NAVE)
+        if self.tem_tiro_triplo() and relogio.get_ticks() >= self.__tempo_fim_tiro_triplo: self.set_tem_tiro_triplo(False)
+        # Giro, aceleração e atrito estão em "por frame a FPS": escalados pelo tamanho do passo
+        passo = delta_tempo * FPS
+        if self.__rotacionando_esquerda: self.set_angulo(self.get_angulo() - VELOCIDADE_ROTACAO_NAVE * passo)
+        if self.__rotacionando_direita: self.set_angulo(self.get_angulo() + VELOCIDADE_ROTACAO_NAVE * passo)
+        velocidade = self.get_velocidade()
         if self.__acelerando:
             angulo_rad = math.radians(self.get_angulo() - 90)
-            direcao = Vetor2D(math.cos(angulo_rad), math.sin(angulo_rad))
-            self.set_velocidade(self.get_velocidade() + direcao * ACELERACAO_NAVE)
-        self.set_velocidade(self.get_velocidade() * FRICCAO_NAVE)
-        self.image = pygame.transform.rotate(self.original_image, -self.get_angulo())
+            velocidade.x += math.cos(angulo_rad) * ACELERACAO_NAVE * passo
+            velocidade.y += math.sin(angulo_rad) * ACELERACAO_NAVE * passo
+        velocidade.imul(FRICCAO_NAVE ** passo)
+        self.image, self.mask = self.__atlas.get_quadro(-self.get_angulo())
         self.rect = self.image.get_rect(center=self.get_posicao().para_tupla())
-        self.mask = pygame.mask.from_surface(self.image)
         super().atualizar(delta_tempo)
 
     def atirar(self) -> list['Projetil']:
-        tempo_atual = pygame.time.get_ticks()
+        tempo_atual = relogio.get_ticks()
         if tempo_atual - self.__ultimo_tiro_tempo <= COOLDOWN_TIRO: return []
         self.__ultimo_tiro_tempo = tempo_atual
         angulo_rad = math.radians(self.get_angulo() - 90)
         direcao = Vetor2D(math.cos(angulo_rad), math.sin(angulo_rad))
         pos = self.get_posicao() + direcao * self.get_raio()
         vel = direcao * VELOCIDADE_PROJETIL + self.get_velocidade()
-        projeteis = [Projetil(pos, vel)]
+        projeteis = [pool_projeteis.obter(pos, vel)]
         if self.tem_tiro_triplo() and tempo_atual < self.__tempo_fim_tiro_triplo:
             for offset in [-ANGULO_TIRO_TRIPLO_GRAUS, ANGULO_TIRO_TRIPLO_GRAUS]:
                 d = direcao.rotacionar(math.radians(offset))
-                projeteis.append(Projetil(self.get_posicao() + d * self.get_raio(), d * VELOCIDADE_PROJETIL + self.get_velocidade()))
+                projeteis.append(pool_projeteis.obter(self.get_posicao() + d * self.get_raio(), d * VELOCIDADE_PROJETIL + self.get_velocidade()))
         return projeteis
 
     def ativar_tiro_triplo(self, duracao_segundos: int) -> None:
-        if self.is_ativo(): self.set_tem_tiro_triplo(True); self.set_tempo_fim_tiro_triplo(pygame.time.get_ticks() + duracao_segundos * 1000)
+        if self.is_ativo(): self.set_tem_tiro_triplo(True); self.set_tempo_fim_tiro_triplo(relogio.get_ticks() + duracao_segundos * 1000)
     
     def to_dict(self) -> dict:  
         data = self.to_dict_base()
-        data.update({"angulo_graus": self.get_angulo(), "tem_tiro_triplo": self.tem_tiro_triplo(), "tempo_fim_tiro_triplo_restante_ms": max(0, self.__tempo_fim_tiro_triplo - pygame.time.get_ticks()) if self.tem_tiro_triplo() else 0, "invulneravel_fim_restante_ms": max(0, self.get_invulneravel_fim() - pygame.time.get_ticks())})
+        data.update({"angulo_graus": self.get_angulo(), "tem_tiro_triplo": self.tem_tiro_triplo(), "tempo_fim_tiro_triplo_restante_ms": max(0, self.__tempo_fim_tiro_triplo - relogio.get_ticks()) if self.tem_tiro_triplo() else 0, "invulneravel_fim_restante_ms": max(0, self.get_invulneravel_fim() - relogio.get_ticks())})
         return data
 
     @classmethod
@@ -153,34 +305,52 @@ class Nave(GameObject):
         obj = cls(Vetor2D.from_dict(data["posicao"]))
         obj.set_velocidade(Vetor2D.from_dict(data["velocidade"])); obj.restaurar_estado_base(data); obj.set_angulo(data.get("angulo_graus", 0.0))
         obj.set_tem_tiro_triplo(data.get("tem_tiro_triplo", False))
-        if obj.tem_tiro_triplo(): obj.set_tempo_fim_tiro_triplo(pygame.time.get_ticks() + data.get("tempo_fim_tiro_triplo_restante_ms", 0))
+        if obj.tem_tiro_triplo(): obj.set_tempo_fim_tiro_triplo(relogio.get_ticks() + data.get("tempo_fim_tiro_triplo_restante_ms", 0))
         tempo_inv_restante = data.get("invulneravel_fim_restante_ms", 0)
-        if tempo_inv_restante > 0: obj.set_invulneravel_fim(pygame.time.get_ticks() + tempo_inv_restante)
+        if tempo_inv_restante > 0: obj.set_invulneravel_fim(relogio.get_ticks() + tempo_inv_restante)
         return obj
 
-class Projetil(GameObject):
+class Projetil(EntidadeSoA):
     def __init__(self, posicao: Vetor2D, velocidade: Vetor2D):
         super().__init__(posicao, velocidade, 3)
+        self.original_image = recursos.get_imagem(IMAGEM_PROJETIL_JOGADOR, _fallback_projetil)
+        self.__atlas = get_atlas(self.original_image)
+        self.reiniciar(posicao, velocidade)
+
+    def reiniciar(self, posicao: Vetor2D, velocidade: Vetor2D) -> None:
+        """Recoloca o projétil em jogo com nova posição e velocidade (usado pelo pool)."""
+        self.set_posicao(posicao); self.set_velocidade(velocidade); self.set_ativo(True)
         self.__frames_vividos = 0
-        try:
-            self.original_image = pygame.image.load(IMAGEM_PROJETIL_JOGADOR).convert_alpha()
-        except pygame.error:
-            self.original_image = pygame.Surface((5, 10), pygame.SRCALPHA)
-            pygame.draw.rect(self.original_image, BRANCO, (0, 0, 5, 10))
         angulo = math.degrees(math.atan2(-velocidade.get_y(), velocidade.get_x())) + 90
-        
-        self.image = pygame.transform.rotate(self.original_image, -angulo)
+        self.image, self.mask = self.__atlas.get_quadro(-angulo)
         self.rect = self.image.get_rect(center=posicao.para_tupla())
-        self.mask = pygame.mask.from_surface(self.image)
+
+    def get_frames_vividos(self) -> float:
+        bloco = self.get_bloco_soa()
+        return self.__frames_vividos if bloco is None else float(bloco.dados[soa.VIDA, self.get_vaga_soa()])
+
+    def set_frames_vividos(self, frames: float):
+        bloco = self.get_bloco_soa()
+        if bloco is None: self.__frames_vividos = frames
+        else: bloco.dados[soa.VIDA, self.get_vaga_soa()] = frames
+
+    def vincular_soa(self, bloco: 'soa.BlocoSoA', vaga: int) -> None:
+        bloco.dados[soa.VIDA, vaga] = self.__frames_vividos
+        super().vincular_soa(bloco, vaga)
+
+    def desvincular_soa(self) -> None:
+        self.__frames_vividos = float(self.get_bloco_soa().dados[soa.VIDA, self.get_vaga_soa()])
+        super().desvincular_soa()
 
     def atualizar(self, delta_tempo: float) -> None:
-        super().atualizar(delta_tempo); self.__frames_vividos += 1
+        # Vida contada em frames a FPS, mesmo com outra taxa de física
+        super().atualizar(delta_tempo); self.__frames_vividos += delta_tempo * FPS
         if self.__frames_vividos > DURACAO_PROJETIL: self.set_ativo(False)
 
     def to_dict(self) -> dict:
         """Converte o estado do Projétil para um dicionário salvável."""
         data = self.to_dict_base()
-        data["frames_vividos"] = self.__frames_vividos
+        data["frames_vividos"] = int(self.get_frames_vividos())  # o save guarda frames inteiros: perde no máximo a fração de um frame
         return data
 
     @classmethod
@@ -196,33 +366,71 @@ class Projetil(GameObject):
         return obj
 
 
-class Asteroide(GameObject):
+class Asteroide(EntidadeSoA):
     TAMANHOS = {"grande": (35, PONTOS_ASTEROIDE_GRANDE), "medio": (25, PONTOS_ASTEROIDE_MEDIO), "pequeno": (12, PONTOS_ASTEROIDE_PEQUENO)}
-    def __init__(self, posicao: Vetor2D, tamanho_str="grande", velocidade: Vetor2D = None):
+    IMAGENS = {"grande": IMAGEM_ASTEROIDE_GRANDE, "medio": IMAGEM_ASTEROIDE_MEDIO, "pequeno": IMAGEM_ASTEROIDE_PEQUENO}
+    FALLBACKS = {tamanho: (lambda r=raio: _fallback_asteroide(r)) for tamanho, (raio, _) in TAMANHOS.items()}
+    def __init__(self, posicao: Vetor2D, tamanho_str="grande", velocidade: Vetor2D = None, rng: Optional[random.Random] = None):
         raio, pontos = self.TAMANHOS[tamanho_str]
-        vel = velocidade if velocidade is not None else Vetor2D(random.uniform(VEL_MIN_ASTEROIDE, VEL_MAX_ASTEROIDE) * random.choice([-1, 1]), random.uniform(VEL_MIN_ASTEROIDE, VEL_MAX_ASTEROIDE) * random.choice([-1, 1]))
+        # Sem um gerador da partida, usa o módulo random global
+        self.__rng = rng = rng if rng is not None else random
+        vel = velocidade if velocidade is not None else Vetor2D(rng.uniform(VEL_MIN_ASTEROIDE, VEL_MAX_ASTEROIDE) * rng.choice([-1, 1]), rng.uniform(VEL_MIN_ASTEROIDE, VEL_MAX_ASTEROIDE) * rng.choice([-1, 1]))
         super().__init__(posicao, vel, raio)
-        self.__tamanho_str, self.__pontos, self.__angulo_rotacao, self.__velocidade_rotacao = tamanho_str, pontos, random.uniform(0, 360), random.uniform(-1, 1)
-        
-        imagem_path = {"grande": IMAGEM_ASTEROIDE_GRANDE, "medio": IMAGEM_ASTEROIDE_MEDIO, "pequeno": IMAGEM_ASTEROIDE_PEQUENO}[tamanho_str]
-        try:
-            self.original_image = pygame.image.load(imagem_path).convert_alpha()
-        except pygame.error:
-            self.original_image = pygame.Surface((raio * 2, raio * 2), pygame.SRCALPHA)
-            pygame.draw.circle(self.original_image, CINZA_CLARO, (raio, raio), raio, 1)
+        self.__tamanho_str, self.__pontos, self.__angulo_rotacao, self.__velocidade_rotacao = tamanho_str, pontos, rng.uniform(0, 360), rng.uniform(-1, 1)
         
-        self.image = self.original_image
+        self.original_image = recursos.get_imagem(self.IMAGENS[tamanho_str], self.FALLBACKS[tamanho_str])
+        self.__atlas = get_atlas(self.original_image)
+        self.__quadro = 0
+        self.image, self.mask = self.__atlas.get_quadro_indice(0)
         self.rect = self.image.get_rect(center=posicao.para_tupla())
-        self.mask = pygame.mask.from_surface(self.image)
 
     def get_tamanho_str(self) -> str: return self.__tamanho_str
     def get_pontos(self) -> int: return self.__pontos
+    def get_velocidade_rotacao(self) -> float: return self.__velocidade_rotacao
+    def get_atlas(self) -> AtlasRotacao: return self.__atlas
+
+    def get_angulo_rotacao(self) -> float:
+        bloco = self.get_bloco_soa()
+        return self.__angulo_rotacao if bloco is None else float(bloco.dados[soa.ANGULO, self.get_vaga_soa()])
+
+    def set_angulo_rotacao(self, angulo: float):
+        bloco = self.get_bloco_soa()
+        if bloco is None: self.__angulo_rotacao = angulo
+        else: bloco.dados[soa.ANGULO, self.get_vaga_soa()] = angulo
+
+    # Vinculado a um bloco, o quadro do atlas (imagem e máscara) vem da coluna QUADRO
+    @property
+    def image(self) -> Optional[pygame.Surface]:
+        bloco = self.get_bloco_soa()
+        return self.__image if bloco is None else self.__atlas.get_quadro_indice(int(bloco.dados[soa.QUADRO, self.get_vaga_soa()]))[0]
+
+    @image.setter
+    def image(self, imagem: Optional[pygame.Surface]): self.__image = imagem
+
+    @property
+    def mask(self) -> Optional[pygame.mask.Mask]:
+        bloco = self.get_bloco_soa()
+        return self.__mask if bloco is None else self.__atlas.get_quadro_indice(int(bloco.dados[soa.QUADRO, self.get_vaga_soa()]))[1]
+
+    @mask.setter
+    def mask(self, mascara: Optional[pygame.mask.Mask]): self.__mask = mascara
+
+    def vincular_soa(self, bloco: 'soa.BlocoSoA', vaga: int) -> None:
+        d = bloco.dados
+        d[soa.ANGULO, vaga], d[soa.VEL_ANGULAR, vaga], d[soa.QUADRO, vaga] = self.__angulo_rotacao, self.__velocidade_rotacao, self.__quadro
+        super().vincular_soa(bloco, vaga)
+
+    def desvincular_soa(self) -> None:
+        d, vaga = self.get_bloco_soa().dados, self.get_vaga_soa()
+        self.__angulo_rotacao, self.__quadro = float(d[soa.ANGULO, vaga]), int(d[soa.QUADRO, vaga])
+        self.__image, self.__mask = self.__atlas.get_quadro_indice(self.__quadro)
+        super().desvincular_soa()
 
     def atualizar(self, delta_tempo: float) -> None:
-        self.__angulo_rotacao = (self.__angulo_rotacao + self.__velocidade_rotacao) % 360
-        self.image = pygame.transform.rotate(self.original_image, self.__angulo_rotacao)
+        self.__angulo_rotacao = (self.__angulo_rotacao + self.__velocidade_rotacao * (delta_tempo * FPS)) % 360
+        self.__quadro = self.__atlas.indice_para(self.__angulo_rotacao)
+        self.image, self.mask = self.__atlas.get_quadro_indice(self.__quadro)
         self.rect = self.image.get_rect(center=self.get_posicao().para_tupla())
-        self.mask = pygame.mask.from_surface(self.image)
         super().atualizar(delta_tempo)
 
     def dividir(self) -> list['Asteroide']:
@@ -232,12 +440,12 @@ class Asteroide(GameObject):
         novos = []
         for i in range(2):
             vel_base = self.get_velocidade()
-            if vel_base.magnitude() < 0.1: vel_base = Vetor2D(random.uniform(-0.5, 0.5), random.uniform(-0.5, 0.5))
+            if vel_base.magnitude() < 0.1: vel_base = Vetor2D(self.__rng.uniform(-0.5, 0.5), self.__rng.uniform(-0.5, 0.5))
             offset_dir = vel_base.normalizar().rotacionar(math.radians(90))
             offset = offset_dir * (self.get_raio() / 1.5) * (1 if i == 0 else -1)
             pos_frag = self.get_posicao() + offset
-            vel_frag = vel_base.rotacionar(math.radians(random.uniform(20, 50) * (1 if i == 0 else -1)))
-            novos.append(Asteroide(pos_frag, proximo_tamanho, vel_frag))
+            vel_frag = vel_base.rotacionar(math.radians(self.__rng.uniform(20, 50) * (1 if i == 0 else -1)))
+            novos.append(Asteroide(pos_frag, proximo_tamanho, vel_frag, self.__rng))
         return novos
 
     def to_dict(self) -> dict:
@@ -246,7 +454,7 @@ class Asteroide(GameObject):
         data.update({
             "tamanho_str": self.get_tamanho_str(),
             "pontos": self.get_pontos(),
-            "angulo_rotacao": self.__angulo_rotacao,
+            "angulo_rotacao": self.get_angulo_rotacao(),
             "velocidade_rotacao": self.__velocidade_rotacao
         })
         return data
@@ -271,26 +479,25 @@ class Asteroide(GameObject):
 class OVNIProjetil(GameObject):
     def __init__(self, posicao: Vetor2D, velocidade: Vetor2D, imagem_path: str):
         super().__init__(posicao, velocidade, 4)
-        self.__tempo_criacao = pygame.time.get_ticks()
+        self.reiniciar(posicao, velocidade, imagem_path)
+
+    def reiniciar(self, posicao: Vetor2D, velocidade: Vetor2D, imagem_path: str) -> None:
+        self.set_posicao(posicao); self.set_velocidade(velocidade); self.set_ativo(True)
+        self.__tempo_criacao = relogio.get_ticks()
         self.__imagem_path = imagem_path
-        try:
-            self.original_image = pygame.image.load(self.__imagem_path).convert_alpha()
-        except pygame.error:
-            self.original_image = pygame.Surface((8, 8), pygame.SRCALPHA)
-            pygame.draw.circle(self.original_image, VERMELHO, (4, 4), 4)
+        self.original_image = recursos.get_imagem(self.__imagem_path, _fallback_ovni_projetil)
         angulo = math.degrees(math.atan2(-velocidade.get_y(), velocidade.get_x())) + 90
-        self.image = pygame.transform.rotate(self.original_image, -angulo)
+        self.image, self.mask = get_atlas(self.original_image).get_quadro(-angulo)
         self.rect = self.image.get_rect(center=posicao.para_tupla())
-        self.mask = pygame.mask.from_surface(self.image)
 
     def atualizar(self, delta_tempo: float) -> None:
         super().atualizar(delta_tempo)
-        if pygame.time.get_ticks() - self.__tempo_criacao > 3000:
+        if relogio.get_ticks() - self.__tempo_criacao > 3000:
             self.set_ativo(False)
 
     def to_dict(self) -> dict:
         data = self.to_dict_base()
-        data["tempo_criacao_relativo_ms"] = pygame.time.get_ticks() - self.__tempo_criacao
+        data["tempo_criacao_relativo_ms"] = relogio.get_ticks() - self.__tempo_criacao
         data["imagem_path"] = self.__imagem_path
         return data
 
@@ -298,17 +505,18 @@ class OVNIProjetil(GameObject):
     def from_dict(cls, data: dict) -> 'OVNIProjetil':
         obj = cls(Vetor2D.from_dict(data["posicao"]), Vetor2D.from_dict(data["velocidade"]), data["imagem_path"])
         obj.restaurar_estado_base(data)
-        obj.__tempo_criacao = pygame.time.get_ticks() - data.get("tempo_criacao_relativo_ms", 0)
+        obj.__tempo_criacao = relogio.get_ticks() - data.get("tempo_criacao_relativo_ms", 0)
         return obj
 
 
 class OVNI(GameObject):
-    def __init__(self, imagem_path: str, posicao: Optional[Vetor2D] = None, velocidade: Optional[Vetor2D] = None):
+    def __init__(self, imagem_path: str, posicao: Optional[Vetor2D] = None, velocidade: Optional[Vetor2D] = None, rng: Optional[random.Random] = None):
         raio_ovni = 20
         if posicao is None or velocidade is None:
-            direcao = random.choice([-1, 1])
+            rng = rng if rng is not None else random
+            direcao = rng.choice([-1, 1])
             pos_x = -raio_ovni if direcao == 1 else LARGURA_TELA + raio_ovni
-            pos_y = random.uniform(ALTURA_TELA * 0.1, ALTURA_TELA * 0.6)
+            pos_y = rng.uniform(ALTURA_TELA * 0.1, ALTURA_TELA * 0.6)
             posicao_final = Vetor2D(pos_x, pos_y)
             velocidade_final = Vetor2D(VELOCIDADE_OVNI * direcao, 0)
         else:
@@ -317,14 +525,12 @@ class OVNI(GameObject):
         super().__init__(posicao_final, velocidade_final, raio_ovni)
         
         self.__direcao_horizontal = 1 if self.get_velocidade().get_x() > 0 else -1
-        self.__ultimo_tiro_tempo_ms = pygame.time.get_ticks()
+        self.__ultimo_tiro_tempo_ms = relogio.get_ticks()
         
-        try:
-            self.image = pygame.image.load(imagem_path).convert_alpha()
+        self.image = recursos.get_imagem(imagem_path)
+        if self.image:
             self.rect = self.image.get_rect(center=self.get_posicao().para_tupla())
-            self.mask = pygame.mask.from_surface(self.image)
-        except pygame.error:
-            self.image, self.rect, self.mask = None, None, None
+            self.mask = recursos.get_mascara(self.image)
 
     def atualizar(self, delta_tempo: float) -> None:
         super().atualizar(delta_tempo)
@@ -338,7 +544,7 @@ class OVNI(GameObject):
 
     def to_dict(self) -> dict:
         data = self.to_dict_base()
-        data.update({"ultimo_tiro_tempo_ms_relativo": max(0, pygame.time.get_ticks() - self.__ultimo_tiro_tempo_ms)})
+        data.update({"ultimo_tiro_tempo_ms_relativo": max(0, relogio.get_ticks() - self.__ultimo_tiro_tempo_ms)})
         return data
 
     @classmethod
@@ -354,39 +560,39 @@ class OVNI(GameObject):
         obj.restaurar_estado_base(data)
         
         # Restaura os atributos privados específicos do OVNI
-        obj._OVNI__ultimo_tiro_tempo_ms = pygame.time.get_ticks() - data.get("ultimo_tiro_tempo_ms_relativo", 0)
+        obj._OVNI__ultimo_tiro_tempo_ms = relogio.get_ticks() - data.get("ultimo_tiro_tempo_ms_relativo", 0)
         
         return obj
 
 
 class OvniX(OVNI):
-    def __init__(self, posicao: Optional[Vetor2D] = None, velocidade: Optional[Vetor2D] = None):
-        super().__init__(IMAGEM_OVNI_X, posicao, velocidade)
+    def __init__(self, posicao: Optional[Vetor2D] = None, velocidade: Optional[Vetor2D] = None, rng: Optional[random.Random] = None):
+        super().__init__(IMAGEM_OVNI_X, posicao, velocidade, rng)
 
     def tentar_atirar(self, posicao_nave: Vetor2D) -> list[OVNIProjetil]:
-        tempo_atual = pygame.time.get_ticks()
+        tempo_atual = relogio.get_ticks()
         if tempo_atual - self._OVNI__ultimo_tiro_tempo_ms > COOLDOWN_TIRO_OVNI_MS:
             self._OVNI__ultimo_tiro_tempo_ms = tempo_atual
             projeteis = []
             direcoes = [Vetor2D(1, 1).normalizar(), Vetor2D(-1, 1).normalizar(), Vetor2D(1, -1).normalizar(), Vetor2D(-1, -1).normalizar()]
             for direcao in direcoes:
-                projeteis.append(OVNIProjetil(self.get_posicao() + direcao * self.get_raio(), direcao * VELOCIDADE_PROJETIL_OVNI, IMAGEM_PROJETIL_OVNI_X))
+                projeteis.append(pool_ovni_projeteis.obter(self.get_posicao() + direcao * self.get_raio(), direcao * VELOCIDADE_PROJETIL_OVNI, IMAGEM_PROJETIL_OVNI_X))
             return projeteis
         return []
 
 
 class OvniCruz(OVNI):
-    def __init__(self, posicao: Optional[Vetor2D] = None, velocidade: Optional[Vetor2D] = None):
-        super().__init__(IMAGEM_OVNI_CRUZ, posicao, velocidade)
+    def __init__(self, posicao: Optional[Vetor2D] = None, velocidade: Optional[Vetor2D] = None, rng: Optional[random.Random] = None):
+        super().__init__(IMAGEM_OVNI_CRUZ, posicao, velocidade, rng)
 
     def tentar_atirar(self, posicao_nave: Vetor2D) -> list[OVNIProjetil]:
-        tempo_atual = pygame.time.get_ticks()
+        tempo_atual = relogio.get_ticks()
         if tempo_atual - self._OVNI__ultimo_tiro_tempo_ms > COOLDOWN_TIRO_OVNI_MS:
             self._OVNI__ultimo_tiro_tempo_ms = tempo_atual
             projeteis = []
             direcoes = [Vetor2D(1, 0), Vetor2D(-1, 0), Vetor2D(0, 1), Vetor2D(0, -1)]
             for direcao in direcoes:
-                projeteis.append(OVNIProjetil(self.get_posicao() + direcao * self.get_raio(), direcao * VELOCIDADE_PROJETIL_OVNI, IMAGEM_PROJETIL_OVNI_CRUZ))
+                projeteis.append(pool_ovni_projeteis.obter(self.get_posicao() + direcao * self.get_raio(), direcao * VELOCIDADE_PROJETIL_OVNI, IMAGEM_PROJETIL_OVNI_CRUZ))
             return projeteis
         return []
 
@@ -394,20 +600,26 @@ class EstadoFantasma(Enum):
     INVISIVEL = auto()
     CARREGANDO = auto()
 
+def desenhar_circulo_carga(tela: pygame.Surface, centro: tuple[float, float], raio: int) -> pygame.Rect:
+    return pygame.draw.circle(tela, COR_FANTASMA_CARREGANDO, centro, raio, 2)  # 2 = espessura da linha
+
+def _depurar_fantasma(mensagem: str) -> None:
+    if MENSAGENS_DEPURACAO_FANTASMA: print(f"[FANTASMA DEBUG] {mensagem}")
+
 class NaveFantasma(GameObject):
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
         super().__init__(Vetor2D(-100, -100), Vetor2D(), 18)
+        self.__rng = rng if rng is not None else random
         self.__estado = EstadoFantasma.INVISIVEL
-        self.__tempo_proxima_acao = pygame.time.get_ticks() + random.randint(4000, 8000)
+        self.__tempo_proxima_acao = relogio.get_ticks() + self.__rng.randint(4000, 8000)
         self.__alvo_disparo: Optional[Vetor2D] = None
         self.set_ativo(False)
-        try:
-            self.original_image = pygame.image.load(IMAGEM_FANTASMA).convert_alpha()
-            self.image = self.original_image
+        self.original_image = recursos.get_imagem(IMAGEM_FANTASMA)
+        self.image = self.original_image
+        if self.image:
             self.rect = self.image.get_rect(center=self.get_posicao().para_tupla())
-            self.mask = pygame.mask.from_surface(self.image)
-        except pygame.error:
-            self.image, self.rect, self.mask, self.original_image = None, None, None, None
+            self.mask = recursos.get_mascara(self.image)
+        else:
             print("AVISO: Falha ao carregar sprite da NaveFantasma.")
 
     # --- Getters e Setters ---
@@ -419,32 +631,32 @@ class NaveFantasma(GameObject):
     def set_alvo_disparo(self, a: Optional[Vetor2D]): self.__alvo_disparo = a
 
     def atualizar(self, delta_tempo: float, posicao_nave: Optional[Vetor2D] = None) -> Optional['LaserFantasma']:
-        tempo_atual = pygame.time.get_ticks()
+        tempo_atual = relogio.get_ticks()
         laser_criado = None
         
         if self.get_estado() == EstadoFantasma.INVISIVEL and tempo_atual >= self.get_tempo_proxima_acao():
-            print("[FANTASMA DEBUG] Timer INVISÍVEL terminou. Tentando aparecer...")
+            _depurar_fantasma("Timer INVISÍVEL terminou. Tentando aparecer...")
             if posicao_nave:
-                print("[FANTASMA DEBUG] Alvo encontrado! Mudando para o estado CARREGANDO.")
+                _depurar_fantasma("Alvo encontrado! Mudando para o estado CARREGANDO.")
                 self.set_estado(EstadoFantasma.CARREGANDO)
                 self.set_ativo(True)
-                nova_pos = Vetor2D(random.randrange(50, LARGURA_TELA - 50), random.randrange(50, ALTURA_TELA - 50))
+                nova_pos = Vetor2D(self.__rng.randrange(50, LARGURA_TELA - 50), self.__rng.randrange(50, ALTURA_TELA - 50))
                 self.set_posicao(nova_pos)
                 if self.rect: self.rect.center = nova_pos.para_tupla()
                 self.set_tempo_proxima_acao(tempo_atual + DURACAO_FANTASMA_CARREGANDO_MS)
                 self.set_alvo_disparo(posicao_nave.copia())
             else:
-                print("[FANTASMA DEBUG] Alvo NÃO encontrado. Esperando mais 2 segundos.")
+                _depurar_fantasma("Alvo NÃO encontrado. Esperando mais 2 segundos.")
                 self.set_tempo_proxima_acao(tempo_atual + 2000)
 
         elif self.get_estado() == EstadoFantasma.CARREGANDO and tempo_atual >= self.get_tempo_proxima_acao():
-            print("[FANTASMA DEBUG] Timer CARREGANDO terminou. Tentando atirar...")
+            _depurar_fantasma("Timer CARREGANDO terminou. Tentando atirar...")
             if self.get_alvo_disparo():
-                print("[FANTASMA DEBUG] SUCESSO! Atirando.")
+                _depurar_fantasma("SUCESSO! Atirando.")
                 direcao = (self.get_alvo_disparo() - self.get_posicao()).normalizar()
-                laser_criado = LaserFantasma(self.get_posicao(), direcao)
+                laser_criado = pool_lasers_fantasma.obter(self.get_posicao(), direcao)
             else:
-                print("[FANTASMA DEBUG] FALHA! Sem alvo para atirar. Desaparecendo.")
+                _depurar_fantasma("FALHA! Sem alvo para atirar. Desaparecendo.")
 
             self.set_estado(EstadoFantasma.INVISIVEL)
             self.set_ativo(False)
@@ -453,16 +665,18 @@ class NaveFantasma(GameObject):
             
         return laser_criado
 
-    def desenhar(self, tela: pygame.Surface) -> None:
+    def is_visivel(self) -> bool:
         # A nave fantasma só é visível e tem o círculo quando está no estado CARREGANDO
-        if not self.is_ativo() or self.get_estado() != EstadoFantasma.CARREGANDO:
-            return
+        return self.is_ativo() and self.get_estado() == EstadoFantasma.CARREGANDO
 
-        # Desenha o sprite da nave primeiro
-        super().desenhar(tela)
-        
+    def is_espreitando(self) -> bool:
+        # Invisível e prestes a aparecer: é quando o som de aviso do fantasma toca
+        return self.get_estado() == EstadoFantasma.INVISIVEL and self.get_tempo_proxima_acao() - relogio.get_ticks() <= AVISO_SOM_FANTASMA_MS
+
+    def get_circulo_carga(self) -> Optional[tuple[tuple[float, float], int]]:
+        """(centro, raio) do círculo que se fecha enquanto o ataque carrega, ou None se já for pequeno demais."""
         # Calcula o tempo que ainda falta para o ataque terminar
-        tempo_restante = max(0, self.get_tempo_proxima_acao() - pygame.time.get_ticks())
+        tempo_restante = max(0, self.get_tempo_proxima_acao() - relogio.get_ticks())
         
         # Calcula o progresso como uma fração do tempo total (este valor vai de 1.0 a 0.0)
         progresso_contracao = tempo_restante / DURACAO_FANTASMA_CARREGANDO_MS
@@ -472,21 +686,25 @@ class NaveFantasma(GameObject):
         raio_atual = int(raio_maximo_indicador * progresso_contracao)
         
         # Só desenha o círculo se ele ainda for visível
-        if raio_atual > 2:
-            pygame.draw.circle(
-                tela,
-                COR_FANTASMA_CARREGANDO,
-                self.get_posicao().para_tupla(),
-                raio_atual,
-                2  # Espessura da linha do círculo
-            )
+        return (self.get_posicao().para_tupla(), raio_atual) if raio_atual > 2 else None
+
+    def desenhar(self, tela: pygame.Surface) -> Optional[pygame.Rect]:
+        if not self.is_visivel(): return None
+
+        # Desenha o sprite da nave primeiro
+        area = super().desenhar(tela)
+        circulo = self.get_circulo_carga()
+        if circulo:
+            area_circulo = desenhar_circulo_carga(tela, *circulo)
+            area = area.union(area_circulo) if area else area_circulo
+        return area
     
     def to_dict(self) -> dict:
         data = self.to_dict_base()
         alvo = self.get_alvo_disparo()
         data.update({
             "estado": self.get_estado().name,
-            "tempo_proxima_acao_restante_ms": max(0, self.get_tempo_proxima_acao() - pygame.time.get_ticks()),
+            "tempo_proxima_acao_restante_ms": max(0, self.get_tempo_proxima_acao() - relogio.get_ticks()),
             "alvo_disparo": alvo.to_dict() if alvo else None
         })
         return data
@@ -498,30 +716,28 @@ class NaveFantasma(GameObject):
         obj.set_posicao(Vetor2D.from_dict(data["posicao"]))
         obj.set_velocidade(Vetor2D.from_dict(data["velocidade"]))
         obj.set_estado(EstadoFantasma[data.get("estado", "INVISIVEL")])
-        obj.set_tempo_proxima_acao(pygame.time.get_ticks() + data.get("tempo_proxima_acao_restante_ms", 0))
+        obj.set_tempo_proxima_acao(relogio.get_ticks() + data.get("tempo_proxima_acao_restante_ms", 0))
         alvo_data = data.get("alvo_disparo")
         obj.set_alvo_disparo(Vetor2D.from_dict(alvo_data) if alvo_data else None)
         return obj
 
 class LaserFantasma(GameObject):
     def __init__(self, pos_inicio: Vetor2D, direcao: Vetor2D):
-        super().__init__(pos_inicio, direcao * VELOCIDADE_LASER_FANTASMA, 5)
+        super().__init__(pos_inicio.copia(), direcao * VELOCIDADE_LASER_FANTASMA, 5)
+        self.original_image = recursos.get_imagem(IMAGEM_LASER_FANTASMA, _fallback_laser_fantasma)
+        # rotozoom (suavizado), como o laser sempre foi desenhado
+        self.__atlas = get_atlas(self.original_image, suave=True)
+        self.reiniciar(pos_inicio, direcao)
+
+    def reiniciar(self, pos_inicio: Vetor2D, direcao: Vetor2D) -> None:
+        self.set_posicao(pos_inicio.copia()); self.set_velocidade(direcao * VELOCIDADE_LASER_FANTASMA); self.set_ativo(True)
         self.__direcao = direcao
-        try:
-            self.original_image = pygame.image.load(IMAGEM_LASER_FANTASMA).convert_alpha()
-        except pygame.error:
-            self.original_image = pygame.Surface((4, 12), pygame.SRCALPHA)
-            pygame.draw.rect(self.original_image, COR_FANTASMA_LASER, (0,0,4,12))
-        
         angulo = math.degrees(math.atan2(-direcao.get_y(), direcao.get_x())) + 90
-        
-        self.image = pygame.transform.rotozoom(self.original_image, -angulo, 1.0)
+        self.image, self.mask = self.__atlas.get_quadro(-angulo)
         self.rect = self.image.get_rect(center=pos_inicio.para_tupla())
-        self.mask = pygame.mask.from_surface(self.image)
 
     def atualizar(self, delta_tempo: float) -> None:
-        pos = self.get_posicao() + self.get_velocidade() * delta_tempo * FPS
-        self.set_posicao(pos)
+        pos = self.get_posicao().iadd_escalado(self.get_velocidade(), delta_tempo * FPS)
         if self.rect: self.rect.center = pos.para_tupla()
         
         tela_rect = pygame.Rect(0, 0, LARGURA_TELA, ALTURA_TELA)
@@ -539,6 +755,11 @@ class LaserFantasma(GameObject):
         obj.restaurar_estado_base(data)
         return obj
 
+# Pools dos objetos de vida curta; o GerenciadorJogo devolve a eles o que sai de cena
+pool_projeteis: PoolObjetos[Projetil] = PoolObjetos(Projetil)
+pool_ovni_projeteis: PoolObjetos[OVNIProjetil] = PoolObjetos(OVNIProjetil)
+pool_lasers_fantasma: PoolObjetos[LaserFantasma] = PoolObjetos(LaserFantasma)
+
 CLASSE_MAP = {
         'Nave': Nave,   
         'Projetil': Projetil,
@@ -549,3 +770,35 @@ CLASSE_MAP = {
         'NaveFantasma': NaveFantasma,
         'LaserFantasma': LaserFantasma
     }
+
+# --- Pré-carregamento ---
+# Sprites das entidades: (caminho, fallback, atlas de rotação). O atlas é None
+# para sprites que não giram, False para `rotate` e True para `rotozoom`.
+SPRITES_ENTIDADES = (
+    (IMAGEM_NAVE, _fallback_nave, False),
+    (IMAGEM_PROJETIL_JOGADOR, _fallback_projetil, False),
+    *((Asteroide.IMAGENS[tamanho], Asteroide.FALLBACKS[tamanho], False) for tamanho in Asteroide.TAMANHOS),
+    (IMAGEM_OVNI_X, None, None),
+    (IMAGEM_OVNI_CRUZ, None, None),
+    (IMAGEM_PROJETIL_OVNI_X, _fallback_ovni_projetil, False),
+    (IMAGEM_PROJETIL_OVNI_CRUZ, _fallback_ovni_projetil, False),
+    (IMAGEM_FANTASMA, None, None),
+    (IMAGEM_LASER_FANTASMA, _fallback_laser_fantasma, True),
+)
+
+def _gerar_quadros(caminho: str, fallback, suave: bool, inicio: int, fim: int) -> None:
+    atlas = get_atlas(recursos.get_imagem(caminho, fallback), suave)
+    for indice in range(inicio, min(fim, atlas.get_passos())): atlas.get_quadro_indice(indice)
+
+def tarefas_pre_carregamento(quadros_rotacao: bool = PRE_CARREGAR_QUADROS_ROTACAO, quadros_por_tarefa: int = 45) -> list[tuple[str, Callable[[], object]]]:
+    """Tarefas (descrição, função) que carregam os sprites e, opcionalmente, todos os quadros de rotação."""
+    tarefas, atlas_vistos = [], set()
+    for caminho, fallback, suave in SPRITES_ENTIDADES:
+        tarefas.append((f"imagem {os.path.basename(caminho)}", lambda c=caminho, f=fallback: recursos.get_imagem(c, f)))
+        if suave is None or not quadros_rotacao or (caminho, suave) in atlas_vistos: continue
+        atlas_vistos.add((caminho, suave))
+        # O atlas é dividido em blocos para o progresso andar de forma regular
+        for inicio in range(0, PASSOS_ROTACAO_ATLAS, quadros_por_tarefa):
+            tarefas.append((f"rotações {os.path.basename(caminho)}",
+                            lambda c=caminho, f=fallback, s=suave, i=inicio: _gerar_quadros(c, f, s, i, i + quadros_por_tarefa)))
+    return tarefas
@@ -0,0 +1,20 @@
+from typing import NamedTuple
+
+
+class EntradaJogo(NamedTuple):
+    """Estado dos controles do jogador em um frame (vindo do teclado ou de um script)."""
+    esquerda: bool = False
+    direita: bool = False
+    acelerar: bool = False
+    atirar: bool = False
+
+    def para_bits(self) -> int:
+        """Empacota os quatro controles nos bits baixos de um inteiro (1 byte por frame nos replays)."""
+        return self.esquerda | (self.direita << 1) | (self.acelerar << 2) | (self.atirar << 3)
+
+    @classmethod
+    def de_bits(cls, bits: int) -> 'EntradaJogo':
+        return cls(bool(bits & 1), bool(bits & 2), bool(bits & 4), bool(bits & 8))
+
+
+ENTRADA_VAZIA = EntradaJogo()
@@ -1,12 +1,23 @@
 import pygame
-import pygame_menu
-import os
-import json
 import random
+import itertools
 from enum import Enum, auto
+from typing import Callable, Iterable, Sequence, Union
 from config import *
 from entidades import * # Ajuste o nome se seu arquivo for diferente
 from vetor import Vetor2D
+import relogio
+from relogio import RelogioPygame, RelogioVirtual, RelogioPassoFixo
+from colisao import GradeEspacial
+from soa import ArmazemSoA, numpy_disponivel
+from perfilador import PerfiladorFrames
+from texto import cache_texto
+from renderizador import RenderizadorSujo
+from pipeline import QuadroRenderizacao, SimulacaoParalela
+from entrada import EntradaJogo, ENTRADA_VAZIA
+from replay import GravadorEntrada
+import time
+from salvamento import ler_save_mais_recente, salvar_em_segundo_plano, remover_save, ServicoAutosave
 
 class EstadoJogoLoop(Enum):
     CONTINUAR_JOGO = auto()
@@ -14,28 +25,85 @@ class EstadoJogoLoop(Enum):
     VOLTAR_AO_MENU_COM_SAVE = auto()
     VOLTAR_AO_MENU_GAME_OVER = auto()
 
+class SomSilencioso:
+    """Substitui o GerenciadorSom quando o jogo roda sem áudio (ex.: simulação headless)."""
+    def tocar_som(self, nome_som: str, loop=0) -> bool: return False
+    def parar_som(self, nome_som: str): pass
+    def despachar_sons(self): pass
+    def get_estatisticas_sons(self) -> dict: return {}
+
+def _sprites_visiveis(grupos: Sequence[list], alfa: float = 1.0):
+    """Pares (imagem, rect) dos sprites ativos dos grupos, prontos para `Surface.blits` (interpolados se `alfa` < 1)."""
+    for grupo in grupos:
+        for sprite in grupo:
+            if not sprite.is_ativo(): continue
+            # image e rect podem ser derivados na hora (backend SoA): lidos uma vez só
+            imagem, rect = sprite.image, sprite.rect
+            if imagem and rect: yield imagem, rect if alfa >= 1 else rect.move(sprite.get_deslocamento_interpolado(alfa))
+
 class FundoEstrelado:
-    def __init__(self):
-        self.__estrelas_lentas = [[random.randrange(LARGURA_TELA), random.randrange(ALTURA_TELA), 1] for _ in range(NUM_ESTRELAS_LENTAS)]
-        self.__estrelas_rapidas = [[random.randrange(LARGURA_TELA), random.randrange(ALTURA_TELA), 2] for _ in range(NUM_ESTRELAS_RAPIDAS)]
+    """
+    Fundo de estrelas em camadas de parallax. Cada camada é uma faixa com o
+    dobro da altura da tela, com o mesmo padrão repetido nas duas metades;
+    rolar a camada é só deslocar a janela de leitura, então cada camada custa
+    um blit por frame, independente do número de estrelas.
+    """
+    def __init__(self, camadas: Sequence[tuple] = CAMADAS_ESTRELAS):
+        # Estrelas sorteadas já na criação; as superfícies só são montadas no primeiro desenho
+        self.__camadas = [([(random.randrange(LARGURA_TELA), random.randrange(ALTURA_TELA)) for _ in range(num)], velocidade, raio, cor)
+                          for num, velocidade, raio, cor in camadas]
+        self.__deslocamentos = [0.0] * len(self.__camadas)
+        self.__superficies: Optional[list[pygame.Surface]] = None
+
+    def _renderizar_camada(self, estrelas: list[tuple[int, int]], raio: int, cor: tuple) -> pygame.Surface:
+        superficie = pygame.Surface((LARGURA_TELA, 2 * ALTURA_TELA))
+        superficie.fill(PRETO)
+        for x, y in estrelas:
+            # Cópias vizinhas fazem as estrelas cortadas nas bordas continuarem do outro lado
+            for dx in (-LARGURA_TELA, 0, LARGURA_TELA):
+                for dy in (-ALTURA_TELA, 0, ALTURA_TELA, 2 * ALTURA_TELA):
+                    pygame.draw.circle(superficie, cor, (x + dx, y + dy), raio)
+        if pygame.display.get_surface() is not None: superficie = superficie.convert()
+        superficie.set_colorkey(PRETO, pygame.RLEACCEL)  # RLE: os pixels transparentes nem são visitados no blit
+        return superficie
 
     def atualizar(self, delta_tempo: float):
-        for estrela in self.__estrelas_lentas: estrela[1] = (estrela[1] + VELOCIDADE_ESTRELAS_LENTA * delta_tempo * FPS) % ALTURA_TELA
-        for estrela in self.__estrelas_rapidas: estrela[1] = (estrela[1] + VELOCIDADE_ESTRELAS_RAPIDA * delta_tempo * FPS) % ALTURA_TELA
+        passo = delta_tempo * FPS
+        for i, (_, velocidade, _, _) in enumerate(self.__camadas):
+            self.__deslocamentos[i] = (self.__deslocamentos[i] + velocidade * passo) % ALTURA_TELA
+
+    def get_deslocamentos(self) -> list[float]: return list(self.__deslocamentos)
 
-    def desenhar(self, tela: pygame.Surface):
-        for x, y, tamanho in self.__estrelas_lentas: pygame.draw.circle(tela, (150, 150, 150), (int(x), int(y)), max(1, tamanho // 2))
-        for x, y, tamanho in self.__estrelas_rapidas: pygame.draw.circle(tela, COR_ESTRELA, (int(x), int(y)), tamanho)
+    def desenhar(self, tela: pygame.Surface, deslocamentos: Optional[Sequence[float]] = None):
+        if self.__superficies is None:
+            self.__superficies = [self._renderizar_camada(estrelas, raio, cor) for estrelas, _, raio, cor in self.__camadas]
+        for superficie, deslocamento in zip(self.__superficies, deslocamentos if deslocamentos is not None else self.__deslocamentos):
+            # A faixa [ALTURA - d, 2*ALTURA - d) mostra as estrelas descidas d pixels
+            tela.blit(superficie, (0, 0), (0, ALTURA_TELA - int(deslocamento), LARGURA_TELA, ALTURA_TELA))
 
 class GerenciadorJogo:
     """
     Orquestra todos os elementos do jogo, incluindo o loop principal,
     lógica de atualização, colisões, e gerenciamento de estado.
     """
-    def __init__(self, tela: pygame.Surface, clock: pygame.time.Clock, gerenciador_som):
+    def __init__(self, tela: Optional[pygame.Surface], clock: Optional[pygame.time.Clock], gerenciador_som, backend: str = BACKEND_ENTIDADES, relogio_jogo=None, arquivo_trace: Optional[str] = ARQUIVO_TRACE_PERFIL, semente: Optional[int] = None, renderizacao_suja: bool = RENDERIZACAO_SUJA, simulacao_paralela: bool = SIMULACAO_EM_PARALELO, taxa_fisica: int = TAXA_FISICA, limite_fps: int = LIMITE_FPS_RENDERIZACAO):
         self.__tela = tela
         self.__clock = clock
-        self.__gerenciador_som = gerenciador_som
+        self.__gerenciador_som = gerenciador_som if gerenciador_som is not None else SomSilencioso()
+        # Física em passo fixo: o loop acumula o tempo real e o consome em passos de 1/taxa_fisica s
+        self.__passo_fisica = 1 / taxa_fisica if taxa_fisica else 0.0
+        self.__acumulador_fisica = 0.0
+        self.__tiro_pendente = False
+        self.__limite_fps = limite_fps
+        # Todas as entidades consultam o tempo por este relógio (real, virtual ou um passo fixo por vez)
+        if relogio_jogo is None: relogio_jogo = RelogioPassoFixo(pygame.time.get_ticks()) if self.__passo_fisica and tela is not None else RelogioPygame()
+        self.__relogio = relogio_jogo
+        relogio.set_relogio(self.__relogio)
+        # Toda a aleatoriedade da partida sai deste gerador, para que ela possa ser reproduzida
+        self.__semente = semente if semente is not None else random.randrange(2 ** 32)
+        self.__rng = random.Random(self.__semente)
+        self.__gravador: Optional[GravadorEntrada] = None
+        self.__arquivo_replay: Optional[str] = None
         self.__nave: Optional[Nave] = None
         self.__asteroides: list[Asteroide] = []
         self.__projeteis: list[Projetil] = []
@@ -43,16 +111,52 @@ class GerenciadorJogo:
         self.__ovni_projeteis: list[OVNIProjetil] = []
         self.__fantasmas: list[NaveFantasma] = []
         self.__lasers_fantasma: list[LaserFantasma] = []
+        # Loops de fundo (SONS_EM_FLUXO) tocando agora
+        self.__loops_tocando: set[str] = set()
+        # As listas acima são persistentes (reinício e carga trocam só o conteúdo),
+        # então os grupos abaixo são montados uma vez e valem pela partida inteira
+        asteroides, projeteis, ovnis, ovni_projeteis, fantasmas, lasers = self.__asteroides, self.__projeteis, self.__ovnis, self.__ovni_projeteis, self.__fantasmas, self.__lasers_fantasma
+        self.__listas_entidades = {"asteroides": asteroides, "projeteis": projeteis, "ovnis": ovnis, "ovni_projeteis": ovni_projeteis,
+                                   "fantasmas": fantasmas, "lasers_fantasma": lasers}
+        self.__grupos_atualizacao = (asteroides, projeteis, ovnis, ovni_projeteis, fantasmas, lasers)
+        self.__grupos_atualizacao_soa = (ovnis, ovni_projeteis, fantasmas, lasers)  # asteroides e projéteis ficam com o ArmazemSoA
+        self.__grupos_perigos = (asteroides, ovnis, ovni_projeteis, lasers)
+        # Camadas de desenho, de baixo para cima: nave, sprites simples, fantasmas, lasers
+        self.__camada_sprites = (asteroides, projeteis, ovnis, ovni_projeteis)
+        self.__camada_lasers = (lasers,)
         self.__fundo_estrelado = FundoEstrelado()
         self.__pontuacao = 0
         self.__vidas = VIDAS_INICIAIS
         self.__game_over = False
         self.__nivel_atual = 0
-        self.__fonte_hud = pygame.font.Font(None, 36)
-        self.__fonte_game_over = pygame.font.Font(None, 72)
+        # Sem tela (modo headless) nada é desenhado, então as fontes não são necessárias
+        self.__fonte_hud = pygame.font.Font(None, 36) if tela is not None else None
+        self.__fonte_game_over = pygame.font.Font(None, 72) if tela is not None else None
+        # HUD composto numa superfície própria, refeita só quando pontuação ou vidas mudam
+        self.__superficie_hud: Optional[pygame.Surface] = None
+        self.__chave_hud: Optional[tuple[int, int]] = None
+        # Modo de retângulos sujos: fundo estático (estrelas paradas + HUD) e update só do que mudou
+        self.__renderizador = RenderizadorSujo(tela) if renderizacao_suja and tela is not None else None
+        self.__fundo_estrelas: Optional[pygame.Surface] = None
+        self.__fundo_sujo: Optional[pygame.Surface] = None
+        self.__hud_no_fundo: Optional[pygame.Surface] = None
+        # Modo em pipeline: a simulação roda numa thread e o desenho usa um de dois retratos do mundo
+        self.__simulacao_paralela = simulacao_paralela and tela is not None
+        self.__quadros = (QuadroRenderizacao(), QuadroRenderizacao())
+        self.__indice_quadro_frente = 0
         self.__jogo_pausado = False
         self.__acao_menu_pausa: Optional[EstadoJogoLoop] = None
         self.__tempo_para_respawn = 0
+        # Células do tamanho do maior asteroide
+        self.__grade_asteroides = GradeEspacial(2 * max(raio for raio, _ in Asteroide.TAMANHOS.values()))
+        self.__armazem_soa: Optional[ArmazemSoA] = None
+        if backend == "numpy":
+            if numpy_disponivel(): self.__armazem_soa = ArmazemSoA()
+            else: print("AVISO: NumPy não encontrado, usando o backend de objetos.")
+        self.__perfilador = PerfiladorFrames()
+        # Pontos de restauração só fazem sentido na partida jogada na tela
+        self.__autosave = ServicoAutosave() if tela is not None else None
+        self.__arquivo_trace = arquivo_trace
 
     def get_pontuacao(self) -> int:
         return self.__pontuacao
@@ -72,13 +176,59 @@ class GerenciadorJogo:
     def set_game_over(self, estado: bool):
         self.__game_over = estado
 
-    def reiniciar_jogo_completo(self):
-        if os.path.exists(ARQUIVO_SAVE_GAME):
-            try: os.remove(ARQUIVO_SAVE_GAME)
-            except OSError as e: print(f"Erro ao remover save antigo: {e}")
+    def get_nivel_atual(self) -> int:
+        return self.__nivel_atual
+
+    def get_nave(self) -> Optional[Nave]:
+        return self.__nave
+
+    def get_relogio(self):
+        return self.__relogio
+
+    def get_semente(self) -> int:
+        return self.__semente
+
+    def get_perfilador(self) -> PerfiladorFrames:
+        return self.__perfilador
+
+    def get_estatisticas_pools(self) -> dict[str, dict]:
+        return {"projeteis": pool_projeteis.get_estatisticas(), "ovni_projeteis": pool_ovni_projeteis.get_estatisticas(),
+                "lasers_fantasma": pool_lasers_fantasma.get_estatisticas()}
+
+    def zerar_estatisticas_pools(self) -> None:
+        for pool in (pool_projeteis, pool_ovni_projeteis, pool_lasers_fantasma): pool.zerar_estatisticas()
+
+    def get_listas_entidades(self) -> dict[str, list]:
+        """
+        As listas vivas de entidades, por nome (usado por ferramentas de medição
+        e cenas de teste). Para pôr ou tirar entidades use `adicionar_entidades`
+        e `limpar_entidades`, que mantêm o backend SoA em dia.
+        """
+        return self.__listas_entidades
+
+    def adicionar_entidades(self, nome: str, entidades: Iterable[GameObject]) -> None:
+        lista = self.__listas_entidades[nome]
+        inicio = len(lista)
+        lista.extend(entidades)
+        # Com o backend SoA, asteroides e projéteis passam a morar no armazém a partir daqui
+        if self.__armazem_soa: self.__armazem_soa.vincular(nome, lista[inicio:])
+
+    def limpar_entidades(self, nome: str) -> None:
+        if self.__armazem_soa: self.__armazem_soa.limpar(nome)
+        self.__listas_entidades[nome].clear()
+
+    def reiniciar_jogo_completo(self, apagar_save: bool = True):
+        self.__relogio.iniciar_quadro()
+        if apagar_save:
+            remover_save()
+            if self.__autosave: self.__autosave.limpar()
         
         self.__nave = Nave(Vetor2D(LARGURA_TELA / 2, ALTURA_TELA / 2))
-        self.__asteroides, self.__projeteis, self.__ovnis, self.__ovni_projeteis, self.__fantasmas, self.__lasers_fantasma = [], [], [], [], [], []
+        if self.__armazem_soa: self.__armazem_soa.limpar()
+        pool_projeteis.recolher_todos(self.__projeteis)
+        pool_ovni_projeteis.recolher_todos(self.__ovni_projeteis)
+        pool_lasers_fantasma.recolher_todos(self.__lasers_fantasma)
+        for lista in self.__grupos_atualizacao: lista.clear()
         
         self.set_pontuacao(0)
         self.set_vidas(VIDAS_INICIAIS)
@@ -87,7 +237,7 @@ class GerenciadorJogo:
         
         self._spawn_asteroides_nivel()
         
-        tempo_final_inv = pygame.time.get_ticks() + (TEMPO_INVENCIBILIDADE_SEGUNDOS * 1000)
+        tempo_final_inv = relogio.get_ticks() + (TEMPO_INVENCIBILIDADE_SEGUNDOS * 1000)
         if self.__nave:
             self.__nave.set_invulneravel_fim(tempo_final_inv)
 
@@ -95,9 +245,9 @@ class GerenciadorJogo:
         num_asteroides = ASTEROIDES_INICIAIS + self.__nivel_atual * 2
         for _ in range(num_asteroides):
             while True:
-                pos = Vetor2D(random.randint(0, LARGURA_TELA), random.randint(0, ALTURA_TELA))
+                pos = Vetor2D(self.__rng.randint(0, LARGURA_TELA), self.__rng.randint(0, ALTURA_TELA))
                 if self.__nave and pos.distancia_ate(self.__nave.get_posicao()) > self.__nave.get_raio() * 7:
-                    self.__asteroides.append(Asteroide(pos, "grande"))
+                    self.adicionar_entidades("asteroides", (Asteroide(pos, "grande", rng=self.__rng),))
                     break
 
     
@@ -107,23 +257,126 @@ class GerenciadorJogo:
             self.__nivel_atual += 1
             self.set_pontuacao(self.get_pontuacao() + 1000 * self.__nivel_atual)
             self.__nave.ativar_tiro_triplo(DURACAO_TIRO_TRIPLO_SEGUNDOS)
-            pygame.time.wait(1000)
+            self.__relogio.esperar(1000)
             self._spawn_asteroides_nivel()
             self.__nave.set_posicao(Vetor2D(LARGURA_TELA / 2, ALTURA_TELA / 2))
             self.__nave.set_velocidade(Vetor2D(0, 0))
 
-    def _processar_input_jogo(self):
-        if not self.__nave or not self.__nave.is_ativo() or self.is_game_over() or self.__jogo_pausado: return
+    def _ler_entrada_teclado(self, atirar: bool) -> EntradaJogo:
         teclas = pygame.key.get_pressed()
-        self.__nave.set_rotacao('esquerda', teclas[pygame.K_a] or teclas[pygame.K_LEFT])
-        self.__nave.set_rotacao('direita', teclas[pygame.K_d] or teclas[pygame.K_RIGHT])
-        self.__nave.set_acelerando(teclas[pygame.K_w] or teclas[pygame.K_UP])
+        return EntradaJogo(bool(teclas[pygame.K_a] or teclas[pygame.K_LEFT]), bool(teclas[pygame.K_d] or teclas[pygame.K_RIGHT]), bool(teclas[pygame.K_w] or teclas[pygame.K_UP]), atirar)
+
+    def _processar_input_jogo(self, entrada: EntradaJogo):
+        if not self.__nave or not self.__nave.is_ativo() or self.__jogo_pausado: return
+        if entrada.atirar:
+            tiros = self.__nave.atirar()
+            if tiros: self.__gerenciador_som.tocar_som('tiro'); self.adicionar_entidades("projeteis", tiros)
+        if self.is_game_over(): return
+        self.__nave.set_rotacao('esquerda', entrada.esquerda)
+        self.__nave.set_rotacao('direita', entrada.direita)
+        self.__nave.set_acelerando(entrada.acelerar)
+
+    def executar_frame(self, entrada: EntradaJogo, delta_tempo: float):
+        """
+        Um frame completo de lógica: congela o relógio, grava a entrada (se
+        houver gravação), aplica os controles e roda a simulação.
+        """
+        self.__relogio.iniciar_quadro()
+        if self.__gravador: self.__gravador.registrar(self.__relogio.get_ticks(), delta_tempo, entrada)
+        self._processar_input_jogo(entrada)
+        self.__perfilador.marcar("entrada")
+        self._passo_logico(delta_tempo)
+
+    def iniciar_gravacao(self, caminho: str):
+        """Grava os frames desta partida num replay (chamar logo após `reiniciar_jogo_completo`)."""
+        self.__gravador = GravadorEntrada(self.__semente, self.__relogio.get_ticks())
+        self.__arquivo_replay = caminho
+
+    def _passo_logico(self, delta_tempo: float):
+        """Um passo da simulação, sem nenhum desenho."""
+        if not self.is_game_over():
+            perfilador = self.__perfilador
+            self._respawn_nave_se_necessario(); self._atualizar_objetos(delta_tempo); perfilador.marcar("atualizacao")
+            self._checar_colisoes(); perfilador.marcar("colisoes")
+            self._verificar_proximo_nivel(); perfilador.marcar("nivel")
+
+    # --- Simulação headless ---
+    @classmethod
+    def criar_headless(cls, backend: str = BACKEND_ENTIDADES, relogio_virtual: Optional[RelogioVirtual] = None, semente: Optional[int] = None, taxa_fisica: int = TAXA_FISICA) -> 'GerenciadorJogo':
+        """
+        Cria um jogo sem tela, som ou relógio real, já reiniciado. O tempo só
+        avança a cada `simular_passo`, então a lógica roda tão rápido quanto a
+        CPU permitir e independe da taxa de quadros.
+        """
+        jogo = cls(None, None, None, backend, relogio_virtual if relogio_virtual is not None else RelogioVirtual(), arquivo_trace=None, semente=semente, taxa_fisica=taxa_fisica)
+        jogo.reiniciar_jogo_completo(apagar_save=False)
+        return jogo
+
+    def simular_passo(self, entrada: EntradaJogo = ENTRADA_VAZIA, delta_tempo: float = 1 / FPS):
+        """Avança o relógio virtual em `delta_tempo` e executa um passo com a entrada dada."""
+        if isinstance(self.__relogio, RelogioVirtual): self.__relogio.avancar(delta_tempo * 1000)
+        self.executar_frame(entrada, delta_tempo)
+
+    def simular(self, num_frames: int, entradas: Union[Sequence[EntradaJogo], Callable[['GerenciadorJogo', int], EntradaJogo], None] = None, delta_tempo: float = 1 / FPS) -> int:
+        """
+        Roda até `num_frames` passos de tamanho fixo ou até o game over.
+        `entradas` pode ser uma sequência (uma entrada por frame; acabando, o
+        jogador fica parado) ou uma função `(jogo, frame) -> EntradaJogo`.
+        Retorna quantos frames foram simulados.
+        """
+        for frame in range(num_frames):
+            if self.is_game_over(): return frame
+            if entradas is None: entrada = ENTRADA_VAZIA
+            elif callable(entradas): entrada = entradas(self, frame)
+            else: entrada = entradas[frame] if frame < len(entradas) else ENTRADA_VAZIA
+            self.simular_passo(entrada, delta_tempo)
+        return num_frames
+
+    # --- Física em passo fixo ---
+    def _guardar_estados_anteriores(self):
+        if self.__nave: self.__nave.guardar_estado_anterior()
+        grupos = self.__grupos_atualizacao
+        if self.__armazem_soa:
+            self.__armazem_soa.guardar_estados_anteriores()
+            grupos = self.__grupos_atualizacao_soa
+        for grupo in grupos:
+            for entidade in grupo: entidade.guardar_estado_anterior()
+
+    def _avancar_fisica(self, entrada: EntradaJogo, delta_tempo: float) -> float:
+        """
+        Soma o tempo real do frame ao acumulador e roda quantos passos fixos
+        de física couberem nele (nenhum, se o desenho estiver mais rápido que a
+        física). Devolve a fração do próximo passo já decorrida, usada para
+        interpolar o desenho. Sem passo fixo, roda um passo com o delta do frame.
+        """
+        if not self.__passo_fisica:
+            self.executar_frame(entrada, delta_tempo)
+            return 1.0
+        passo = self.__passo_fisica
+        self.__acumulador_fisica = min(self.__acumulador_fisica + delta_tempo, MAX_PASSOS_FISICA_POR_FRAME * passo)
+        passos = int(self.__acumulador_fisica / passo)
+        self.__acumulador_fisica -= passos * passo
+        # O tiro vem de um KEYDOWN: guardado até um passo consumi-lo, para não se perder num frame sem passos
+        self.__tiro_pendente = self.__tiro_pendente or entrada.atirar
+        for i in range(passos):
+            if i == passos - 1: self._guardar_estados_anteriores()
+            self.simular_passo(entrada._replace(atirar=self.__tiro_pendente), passo)
+            self.__tiro_pendente = False
+            if self.is_game_over(): break
+        return self.__acumulador_fisica / passo
 
 
     def _atualizar_objetos(self, delta_tempo: float):
         self.__fundo_estrelado.atualizar(delta_tempo)
-        todas_entidades = [self.__nave] + self.__asteroides + self.__projeteis + self.__ovnis + self.__ovni_projeteis + self.__fantasmas + self.__lasers_fantasma
-        for entidade in filter(None, todas_entidades): entidade.atualizar(delta_tempo)
+        if self.__armazem_soa:
+            # Asteroides e projéteis são atualizados em lote pelo backend SoA
+            self.__armazem_soa.atualizar(delta_tempo)
+            grupos = self.__grupos_atualizacao_soa
+        else:
+            grupos = self.__grupos_atualizacao
+        if self.__nave: self.__nave.atualizar(delta_tempo)
+        for grupo in grupos:
+            for entidade in grupo: entidade.atualizar(delta_tempo)
         alvo_jogador = self.__nave.get_posicao() if self.__nave and self.__nave.is_ativo() else None
         if alvo_jogador:
             for ovni in self.__ovnis:
@@ -131,12 +384,14 @@ class GerenciadorJogo:
         for fantasma in self.__fantasmas:
             laser = fantasma.atualizar(delta_tempo, alvo_jogador)
             if laser: self.__lasers_fantasma.append(laser)
-        if not self.__fantasmas and random.random() < CHANCE_SPAWN_FANTASMA: self.__fantasmas.append(NaveFantasma())
-        if random.random() < CHANCE_SPAWN_OVNI_X and len(self.__ovnis) < MAX_OVNIS_TELA: self.__ovnis.append(OvniX())
-        if random.random() < CHANCE_SPAWN_OVNI_CRUZ and len(self.__ovnis) < MAX_OVNIS_TELA: self.__ovnis.append(OvniCruz())
-        self.__projeteis[:] = [p for p in self.__projeteis if p.is_ativo()]
-        self.__ovni_projeteis[:] = [p for p in self.__ovni_projeteis if p.is_ativo()]
-        self.__lasers_fantasma[:] = [l for l in self.__lasers_fantasma if l.is_ativo()]
+        # As chances de spawn são por frame a FPS: escaladas pelo tamanho do passo
+        rng, passo = self.__rng, delta_tempo * FPS
+        if not self.__fantasmas and rng.random() < CHANCE_SPAWN_FANTASMA * passo: self.__fantasmas.append(NaveFantasma(rng))
+        if rng.random() < CHANCE_SPAWN_OVNI_X * passo and len(self.__ovnis) < MAX_OVNIS_TELA: self.__ovnis.append(OvniX(rng=rng))
+        if rng.random() < CHANCE_SPAWN_OVNI_CRUZ * passo and len(self.__ovnis) < MAX_OVNIS_TELA: self.__ovnis.append(OvniCruz(rng=rng))
+        pool_projeteis.recolher_inativos(self.__projeteis)
+        pool_ovni_projeteis.recolher_inativos(self.__ovni_projeteis)
+        pool_lasers_fantasma.recolher_inativos(self.__lasers_fantasma)
         self.__asteroides[:] = [a for a in self.__asteroides if a.is_ativo()]
         self.__ovnis[:] = [o for o in self.__ovnis if o.is_ativo()]
         self.__fantasmas[:] = [f for f in self.__fantasmas if f.is_ativo() or f.get_estado() == EstadoFantasma.INVISIVEL]
@@ -146,11 +401,15 @@ class GerenciadorJogo:
 
         # --- Colisão dos projéteis do jogador com inimigos ---
         novos_asteroides_frag = []
+        asteroides = list(self.__asteroides)
+        self.__grade_asteroides.construir(asteroides)
         for p in list(self.__projeteis):
             if not p.is_ativo(): continue
             
-            # Com asteroides
-            for a in list(self.__asteroides):
+            # Com asteroides (apenas os que dividem alguma célula da grade com o projétil)
+            rect_p = p.get_rect()
+            for i in (self.__grade_asteroides.candidatos(rect_p) if rect_p else ()):
+                a = asteroides[i]
                 if a.is_ativo() and p.colide_com(a):
                     p.set_ativo(False)
                     self.set_pontuacao(self.get_pontuacao() + a.get_pontos())
@@ -165,40 +424,44 @@ class GerenciadorJogo:
                 if p.is_ativo() and f.is_ativo() and p.colide_com(f):
                     p.set_ativo(False); f.set_ativo(False); self.set_pontuacao(self.get_pontuacao() + PONTOS_FANTASMA); break
         
-        self.__asteroides.extend(novos_asteroides_frag)
+        self.adicionar_entidades("asteroides", novos_asteroides_frag)
         
         # --- Colisão da nave do jogador com perigos ---
         if not self.__nave.is_invulneravel() and self.__nave.is_ativo():
-            todos_os_perigos = self.__asteroides + self.__ovnis + self.__ovni_projeteis + self.__lasers_fantasma
-            for inimigo in todos_os_perigos:
+            # Depois da primeira colisão o laço termina, então percorrer as listas vivas é seguro
+            for inimigo in itertools.chain.from_iterable(self.__grupos_perigos):
                 if inimigo.is_ativo() and self.__nave.colide_com(inimigo):
                     if isinstance(inimigo, Asteroide):
-                        self.__asteroides.extend(inimigo.dividir())
+                        self.adicionar_entidades("asteroides", inimigo.dividir())
                     inimigo.set_ativo(False)
                     self._nave_destruida()
                     return
 
         # --- LÓGICA DE COLISÃO ENTRE ASTEROIDES ---
-        for i, ast1 in enumerate(self.__asteroides):
-            for j in range(i + 1, len(self.__asteroides)):
-                ast2 = self.__asteroides[j]
-
-                if ast1.is_ativo() and ast2.is_ativo() and ast1.colide_com(ast2):
-                    
-                    v1 = ast1.get_velocidade()
-                    v2 = ast2.get_velocidade()
-                    ast1.set_velocidade(v2)
-                    ast2.set_velocidade(v1)
-
-                    dist_vetor = ast1.get_posicao() - ast2.get_posicao()
-                    dist = dist_vetor.magnitude()
-                    if dist == 0: continue
-                    
-                    sobreposicao = (ast1.get_raio() + ast2.get_raio()) - dist
-                    if sobreposicao > 0:
-                        deslocamento = dist_vetor.normalizar() * (sobreposicao / 2)
-                        ast1.set_posicao(ast1.get_posicao() + deslocamento)
-                        ast2.set_posicao(ast2.get_posicao() - deslocamento)
+        # A broadphase devolve os pares na mesma ordem do antigo laço duplo (i, j)
+        for ast1, ast2 in self._pares_candidatos_asteroides():
+            if ast1.is_ativo() and ast2.is_ativo() and ast1.colide_com(ast2):
+                
+                v1 = ast1.get_velocidade()
+                v2 = ast2.get_velocidade()
+                ast1.set_velocidade(v2)
+                ast2.set_velocidade(v1)
+
+                dist_vetor = ast1.get_posicao() - ast2.get_posicao()
+                dist = dist_vetor.magnitude()
+                if dist == 0: continue
+                
+                sobreposicao = (ast1.get_raio() + ast2.get_raio()) - dist
+                if sobreposicao > 0:
+                    deslocamento = dist_vetor.normalizar() * (sobreposicao / 2)
+                    ast1.deslocar(deslocamento)
+                    ast2.deslocar(deslocamento, -1)
+
+    def _pares_candidatos_asteroides(self) -> list[tuple[Asteroide, Asteroide]]:
+        if self.__armazem_soa: return self.__armazem_soa.pares_candidatos()
+        asteroides = self.__asteroides
+        self.__grade_asteroides.construir(asteroides)
+        return [(asteroides[i], asteroides[j]) for i, j in self.__grade_asteroides.pares_candidatos()]
 
     def _nave_destruida(self):
         if not self.__nave or self.__nave.is_invulneravel(): return
@@ -206,30 +469,118 @@ class GerenciadorJogo:
         self.__nave.set_ativo(False)
         self.set_vidas(self.get_vidas() - 1)
         if self.get_vidas() < 0: self.set_game_over(True)
-        else: self.__tempo_para_respawn = pygame.time.get_ticks() + 2000
+        else: self.__tempo_para_respawn = relogio.get_ticks() + 2000
 
     def _respawn_nave_se_necessario(self):
-        if self.__nave and not self.__nave.is_ativo() and self.get_vidas() >= 0 and self.__tempo_para_respawn > 0 and pygame.time.get_ticks() >= self.__tempo_para_respawn:
+        if self.__nave and not self.__nave.is_ativo() and self.get_vidas() >= 0 and self.__tempo_para_respawn > 0 and relogio.get_ticks() >= self.__tempo_para_respawn:
             self.__nave.set_posicao(Vetor2D(LARGURA_TELA/2, ALTURA_TELA/2))
             self.__nave.set_velocidade(Vetor2D(0,0))
             self.__nave.set_angulo(0)
             self.__nave.set_ativo(True)
-            tempo_final = pygame.time.get_ticks() + (TEMPO_INVENCIBILIDADE_SEGUNDOS * 1000)
+            tempo_final = relogio.get_ticks() + (TEMPO_INVENCIBILIDADE_SEGUNDOS * 1000)
             self.__nave.set_invulneravel_fim(tempo_final)
             self.__tempo_para_respawn = 0
 
-    def _desenhar_hud(self):
-        self.__tela.blit(self.__fonte_hud.render(f"Pontos: {self.get_pontuacao()}", True, BRANCO), (10, 10))
-        for i in range(self.get_vidas()):
+    def _desenhar_entidades(self, coletar_areas: bool = False, alfa: float = 1.0) -> list[Optional[pygame.Rect]]:
+        """
+        Desenha as entidades em camadas. Os sprites que são só imagem vão para a
+        tela num único `Surface.blits` por camada; nave e fantasmas, que desenham
+        extras (fogo do motor, círculo de carga), usam o próprio `desenhar`.
+        Com `coletar_areas`, devolve as áreas da tela alteradas. Com `alfa` < 1,
+        o que se move é desenhado entre o passo de física anterior e o atual.
+        """
+        tela, areas = self.__tela, []
+        if self.__nave: areas.append(self.__nave.desenhar(tela, alfa))
+        areas += tela.blits(_sprites_visiveis(self.__camada_sprites, alfa), coletar_areas) or ()
+        areas += [fantasma.desenhar(tela) for fantasma in self.__fantasmas]
+        areas += tela.blits(_sprites_visiveis(self.__camada_lasers, alfa), coletar_areas) or ()
+        return areas
+
+    def _reconstruir_hud(self, pontuacao: int, vidas: int) -> pygame.Surface:
+        superficie = pygame.Surface((LARGURA_TELA, 45), pygame.SRCALPHA)
+        superficie.blit(cache_texto.render(self.__fonte_hud, f"Pontos: {pontuacao}", BRANCO), (10, 10))
+        for i in range(vidas):
             p1 = (LARGURA_TELA - 30 - i * 25, 17)
             p2 = (LARGURA_TELA - 30 - i * 25 - 8 * 0.6, 17 + 8 * 1.6)
             p3 = (LARGURA_TELA - 30 - i * 25 + 8 * 0.6, 17 + 8 * 1.6)
-            pygame.draw.polygon(self.__tela, VERDE, [p1, p2, p3], 1)
+            pygame.draw.polygon(superficie, VERDE, [p1, p2, p3], 1)
+        return superficie
+
+    def _get_superficie_hud(self, chave: Optional[tuple[int, int]] = None) -> pygame.Surface:
+        """HUD para (pontuação, vidas); sem `chave`, usa os valores atuais do jogo."""
+        if chave is None: chave = (self.get_pontuacao(), self.get_vidas())
+        if chave != self.__chave_hud:
+            self.__superficie_hud = self._reconstruir_hud(*chave)
+            self.__chave_hud = chave
+        return self.__superficie_hud
+
+    def _desenhar_hud(self):
+        self.__tela.blit(self._get_superficie_hud(), (0, 0))
+
+    def _preparar_fundo_sujo(self, chave_hud: Optional[tuple[int, int]] = None):
+        """
+        Monta o fundo estático do modo de retângulos sujos. O HUD faz parte do
+        fundo (as entidades passam por cima dele) e, quando muda, só a faixa
+        dele é refeita e reenviada ao display.
+        """
+        if self.__fundo_sujo is None:
+            self.__fundo_estrelas = pygame.Surface(self.__tela.get_size()).convert()
+            self.__fundo_estrelas.fill(PRETO)
+            self.__fundo_estrelado.desenhar(self.__fundo_estrelas)
+            self.__fundo_sujo = self.__fundo_estrelas.copy()
+            self.__renderizador.set_fundo(self.__fundo_sujo)
+        hud = self._get_superficie_hud(chave_hud)
+        if hud is self.__hud_no_fundo: return
+        area = hud.get_rect()
+        self.__fundo_sujo.blit(self.__fundo_estrelas, area, area)
+        self.__fundo_sujo.blit(hud, area)
+        self.__hud_no_fundo = hud
+        self.__renderizador.invalidar(area)
+
+    def _desenhar_quadro_sujo(self, alfa: float = 1.0) -> list[Optional[pygame.Rect]]:
+        self._preparar_fundo_sujo()
+        self.__renderizador.limpar()
+        areas = self._desenhar_entidades(coletar_areas=True, alfa=alfa)
+        areas.append(self.__perfilador.desenhar_overlay(self.__tela))
+        return areas
+
+    # --- Modo em pipeline ---
+    def _capturar_quadro(self, quadro: QuadroRenderizacao, alfa: float = 1.0) -> None:
+        """Copia para `quadro` tudo o que o desenho do frame precisa (roda na thread da simulação)."""
+        nave = self.__nave
+        quadro.nave = (nave.image, nave.rect.move(nave.get_deslocamento_interpolado(alfa)).topleft, nave.get_fogo_motor(alfa)) if nave and nave.is_visivel() and nave.image and nave.rect else None
+        quadro.sprites[:] = [(imagem, rect.topleft) for imagem, rect in _sprites_visiveis(self.__camada_sprites, alfa)]
+        quadro.fantasmas[:] = [(f.image, f.rect.topleft, f.get_circulo_carga()) for f in self.__fantasmas if f.is_visivel() and f.image and f.rect]
+        quadro.lasers[:] = [(imagem, rect.topleft) for imagem, rect in _sprites_visiveis(self.__camada_lasers, alfa)]
+        quadro.deslocamentos_estrelas[:] = self.__fundo_estrelado.get_deslocamentos()
+        quadro.chave_hud = (self.get_pontuacao(), self.get_vidas())
+        quadro.game_over = self.is_game_over()
+        quadro.contagens = self._contagens_entidades()
+
+    def _passo_paralelo(self, entrada: EntradaJogo, delta_tempo: float) -> None:
+        alfa = self._avancar_fisica(entrada, delta_tempo)
+        self._capturar_quadro(self.__quadros[1 - self.__indice_quadro_frente], alfa)
+
+    def _desenhar_quadro(self, quadro: QuadroRenderizacao) -> list[Optional[pygame.Rect]]:
+        """Desenha um retrato do mundo (modo em pipeline) e devolve as áreas alteradas."""
+        tela = self.__tela
+        if self.__renderizador is None:
+            tela.fill(PRETO)
+            self.__fundo_estrelado.desenhar(tela, quadro.deslocamentos_estrelas)
+            quadro.desenhar(tela)
+            tela.blit(self._get_superficie_hud(quadro.chave_hud), (0, 0))
+            self.__perfilador.desenhar_overlay(tela)
+            return []
+        self._preparar_fundo_sujo(quadro.chave_hud)
+        self.__renderizador.limpar()
+        areas = quadro.desenhar(tela, coletar_areas=True)
+        areas.append(self.__perfilador.desenhar_overlay(tela))
+        return areas
 
     def _desenhar_tela_game_over(self):
-        texto_go = self.__fonte_game_over.render("GAME OVER", True, VERMELHO)
+        texto_go = cache_texto.render(self.__fonte_game_over, "GAME OVER", VERMELHO)
         self.__tela.blit(texto_go, texto_go.get_rect(center=(LARGURA_TELA//2, ALTURA_TELA//2 - 50)))
-        texto_pont = self.__fonte_hud.render(f"Pontuação Final: {self.get_pontuacao()}", True, BRANCO)
+        texto_pont = cache_texto.render(self.__fonte_hud, f"Pontuação Final: {self.get_pontuacao()}", BRANCO)
         self.__tela.blit(texto_pont, texto_pont.get_rect(center=(LARGURA_TELA//2, ALTURA_TELA//2 + 20)))
 
     def _set_acao_pausa(self, acao: EstadoJogoLoop):
@@ -239,7 +590,26 @@ class GerenciadorJogo:
 
 
 
+    def _atualizar_sons_ambiente(self):
+        """Liga o loop do OVNI enquanto há um na tela e o do fantasma enquanto ele está prestes a aparecer."""
+        desejados = set()
+        if not self.is_game_over():
+            if any(o.is_ativo() for o in self.__ovnis): desejados.add("ovni_movendo")
+            nave_ativa = self.__nave is not None and self.__nave.is_ativo()
+            if nave_ativa and any(f.is_espreitando() for f in self.__fantasmas): desejados.add("fantasma_invisivel")
+        for nome in desejados - self.__loops_tocando:
+            # Loop ainda decodificando em segundo plano: é pedido de novo no próximo frame
+            if not self.__gerenciador_som.tocar_som(nome, loop=-1): desejados.discard(nome)
+        for nome in self.__loops_tocando - desejados: self.__gerenciador_som.parar_som(nome)
+        self.__loops_tocando = desejados
+
+    def _parar_sons_ambiente(self):
+        for nome in self.__loops_tocando: self.__gerenciador_som.parar_som(nome)
+        self.__loops_tocando = set()
+
     def _mostrar_menu_pausa(self):
+        import pygame_menu  # só carregado quando o jogo é pausado (nada de menus em modo headless)
+        self._parar_sons_ambiente()  # voltam no primeiro frame depois da pausa
         self.__jogo_pausado = True; self.__acao_menu_pausa = None
         tema_pausa = pygame_menu.themes.THEME_DARK.copy(); tema_pausa.background_color = (0, 0, 0, 180)
         menu_pausa = pygame_menu.Menu(title="JOGO PAUSADO", width=600, height=400, theme=tema_pausa)
@@ -251,13 +621,9 @@ class GerenciadorJogo:
         menu_pausa.mainloop(self.__tela)
         self.__jogo_pausado = False
 
-    def salvar_estado_jogo(self):
-        if self.is_game_over():
-            if os.path.exists(ARQUIVO_SAVE_GAME):
-                try: os.remove(ARQUIVO_SAVE_GAME)
-                except OSError: pass
-            return
-        estado = {"pontuacao": self.get_pontuacao(), 
+    def capturar_estado(self) -> dict:
+        """Cópia do estado da partida em dicionários simples, pronta para ser serializada em outra thread."""
+        return {"pontuacao": self.get_pontuacao(), 
                   "vidas": self.get_vidas(), 
                   "nivel_atual": self.__nivel_atual, 
                   "game_over": self.is_game_over(), 
@@ -267,55 +633,155 @@ class GerenciadorJogo:
                   "ovnis": [o.to_dict() for o in self.__ovnis], 
                   "ovni_projeteis": [op.to_dict() for op in self.__ovni_projeteis], 
                   "fantasmas": [f.to_dict() for f in self.__fantasmas], 
-                  "lasers_fantasma": [l.to_dict() for l in self.__lasers_fantasma],}
-        try:
-            with open(ARQUIVO_SAVE_GAME, "w") as f: json.dump(estado, f, indent=4)
-            print("Estado do jogo salvo com sucesso.")
-        except Exception as e: print(f"Erro ao salvar o estado do jogo: {e}")
+                  "lasers_fantasma": [l.to_dict() for l in self.__lasers_fantasma],
+                  "salvo_em": time.time()}
+
+    def salvar_estado_jogo(self):
+        if self.is_game_over():
+            remover_save()
+            return
+        # Só a captura do estado acontece neste frame; codificação e escrita vão para a thread de salvamento
+        salvar_em_segundo_plano(self.capturar_estado())
 
     def carregar_estado_jogo(self) -> bool:
-        if not os.path.exists(ARQUIVO_SAVE_GAME): return False
         try:
-            with open(ARQUIVO_SAVE_GAME, "r") as f: data = json.load(f)
+            # O save do "Salvar e Sair" ou o ponto de restauração mais novo, o que for mais recente
+            data = ler_save_mais_recente(self.__autosave.get_caminhos() if self.__autosave else ())
+            if data is None: return False
             if data.get("game_over") or not data.get("nave"): return False
             self.set_pontuacao(data["pontuacao"]); self.set_vidas(data["vidas"]); self.__nivel_atual = data["nivel_atual"]; self.set_game_over(data["game_over"])
             self.__nave = CLASSE_MAP["Nave"].from_dict(data["nave"])
-            self.__asteroides = [CLASSE_MAP[a["classe_tipo"]].from_dict(a) for a in data.get("asteroides", [])]
-            self.__projeteis = [CLASSE_MAP[p["classe_tipo"]].from_dict(p) for p in data.get("projeteis", [])]
-            self.__ovnis = [CLASSE_MAP[o["classe_tipo"]].from_dict(o) for o in data.get("ovnis", [])]
-            self.__ovni_projeteis = [CLASSE_MAP[op["classe_tipo"]].from_dict(op) for op in data.get("ovni_projeteis", [])]
-            self.__fantasmas = [CLASSE_MAP[f["classe_tipo"]].from_dict(f) for f in data.get("fantasmas", [])]
-            self.__lasers_fantasma = [CLASSE_MAP[l["classe_tipo"]].from_dict(l) for l in data.get("lasers_fantasma", [])]
+            if self.__armazem_soa: self.__armazem_soa.limpar()
+            self.__asteroides[:] = [CLASSE_MAP[a["classe_tipo"]].from_dict(a) for a in data.get("asteroides", [])]
+            self.__projeteis[:] = [CLASSE_MAP[p["classe_tipo"]].from_dict(p) for p in data.get("projeteis", [])]
+            if self.__armazem_soa: self.__armazem_soa.vincular("asteroides", self.__asteroides); self.__armazem_soa.vincular("projeteis", self.__projeteis)
+            self.__ovnis[:] = [CLASSE_MAP[o["classe_tipo"]].from_dict(o) for o in data.get("ovnis", [])]
+            self.__ovni_projeteis[:] = [CLASSE_MAP[op["classe_tipo"]].from_dict(op) for op in data.get("ovni_projeteis", [])]
+            self.__fantasmas[:] = [CLASSE_MAP[f["classe_tipo"]].from_dict(f) for f in data.get("fantasmas", [])]
+            self.__lasers_fantasma[:] = [CLASSE_MAP[l["classe_tipo"]].from_dict(l) for l in data.get("lasers_fantasma", [])]
             print("Estado do jogo carregado com sucesso."); return True
         except Exception as e: print(f"Erro ao carregar o estado do jogo: {e}"); return False
 
     def loop_principal(self) -> tuple[EstadoJogoLoop, int]:
+        try:
+            resultado = self._loop_frames()
+            # Saídas normais descartam os pontos de restauração: eles só sobrevivem a um crash
+            # (ou ficam atrás do save do "Salvar e Sair", que é mais recente)
+            if self.__autosave and resultado[0] != EstadoJogoLoop.VOLTAR_AO_MENU_COM_SAVE: self.__autosave.limpar()
+            return resultado
+        finally:
+            self._parar_sons_ambiente()
+            if self.__arquivo_trace:
+                try:
+                    self.__perfilador.exportar(self.__arquivo_trace)
+                    print(f"Trace de frames salvo em {self.__arquivo_trace}.")
+                except OSError as e: print(f"Erro ao salvar o trace de frames: {e}")
+            if self.__gravador and self.__arquivo_replay:
+                try:
+                    self.__gravador.salvar(self.__arquivo_replay)
+                    print(f"Replay com {self.__gravador.get_num_frames()} frames salvo em {self.__arquivo_replay}.")
+                except OSError as e: print(f"Erro ao salvar o replay: {e}")
+            if self.__renderizador:
+                estatisticas = self.__renderizador.get_estatisticas()
+                print(f"Retângulos sujos: {estatisticas['frames_parciais']} frames parciais, {estatisticas['frames_completos']} completos, "
+                      f"{estatisticas['fracao_media_enviada']:.1%} da tela enviada por frame em média.")
+            estatisticas = self.__gerenciador_som.get_estatisticas_sons()
+            if estatisticas.get("pedidos"):
+                print(f"Sons: {estatisticas['pedidos']} pedidos, {estatisticas['tocados']} tocados, {estatisticas['coalescidos']} agrupados no mesmo frame, "
+                      f"{estatisticas['descartados']} descartados, {estatisticas['roubados']} canais roubados.")
+
+    def _contagens_entidades(self) -> dict[str, int]:
+        return {nome: len(lista) for nome, lista in self.get_listas_entidades().items()}
+
+    def _processar_eventos(self, tecla_overlay: int) -> tuple[bool, Optional[tuple[EstadoJogoLoop, int]]]:
+        """Trata a fila de eventos do SDL. Devolve (atirou, resultado), com resultado != None para sair do loop."""
+        eventos = pygame.event.get() if not self.__jogo_pausado else []
+        atirar = False
+        for evento in eventos:
+            if evento.type == pygame.QUIT: return atirar, (EstadoJogoLoop.VOLTAR_AO_MENU_SEM_SALVAR, self.get_pontuacao())
+            if evento.type == pygame.KEYDOWN:
+                if evento.key == pygame.K_ESCAPE:
+                    if self.is_game_over(): return atirar, (EstadoJogoLoop.VOLTAR_AO_MENU_GAME_OVER, self.get_pontuacao())
+                    self._mostrar_menu_pausa()
+                    if self.__renderizador: self.__renderizador.invalidar()  # o menu desenhou por cima da tela
+                    if self.__acao_menu_pausa != EstadoJogoLoop.CONTINUAR_JOGO: return atirar, (self.__acao_menu_pausa, self.get_pontuacao())
+                if evento.key == pygame.K_SPACE: atirar = True
+                if evento.key == tecla_overlay: self.__perfilador.alternar_overlay()
+        return atirar, None
+
+    def _loop_frames(self) -> tuple[EstadoJogoLoop, int]:
         self.__jogo_pausado = False
+        if self.__simulacao_paralela: return self._loop_frames_paralelo()
+        perfilador = self.__perfilador
+        tecla_overlay = pygame.key.key_code(TECLA_OVERLAY_PERFIL)
         while True:
-            delta_tempo = self.__clock.tick(FPS) / 1000.0
-            eventos = pygame.event.get() if not self.__jogo_pausado else []
-            for evento in eventos:
-                if evento.type == pygame.QUIT: return EstadoJogoLoop.VOLTAR_AO_MENU_SEM_SALVAR, self.get_pontuacao()
-                if evento.type == pygame.KEYDOWN:
-                    if evento.key == pygame.K_ESCAPE:
-                        if self.is_game_over(): return EstadoJogoLoop.VOLTAR_AO_MENU_GAME_OVER, self.get_pontuacao()
-                        self._mostrar_menu_pausa()
-                        if self.__acao_menu_pausa != EstadoJogoLoop.CONTINUAR_JOGO: return self.__acao_menu_pausa, self.get_pontuacao()
-                    if evento.key == pygame.K_SPACE and self.__nave and self.__nave.is_ativo() and not self.__jogo_pausado:
-                        tiros = self.__nave.atirar()
-                        if tiros: self.__gerenciador_som.tocar_som('tiro'); self.__projeteis.extend(tiros)
+            delta_tempo = self.__clock.tick(self.__limite_fps) / 1000.0
+            perfilador.iniciar_frame(delta_tempo * 1000)
+            atirar, resultado = self._processar_eventos(tecla_overlay)
+            if resultado: return resultado
             
-            self._processar_input_jogo()
-            if not self.is_game_over():
-                self._respawn_nave_se_necessario(); self._atualizar_objetos(delta_tempo); self._checar_colisoes(); self._verificar_proximo_nivel()
+            alfa = self._avancar_fisica(self._ler_entrada_teclado(atirar), delta_tempo)
+            # Todos os sons pedidos durante o frame saem de uma vez, já sem repetições
+            self._atualizar_sons_ambiente()
+            self.__gerenciador_som.despachar_sons()
+            if self.__autosave and not self.is_game_over(): self.__autosave.atualizar(self.__relogio.get_ticks(), self.capturar_estado)
             
-            self.__tela.fill(PRETO)
-            self.__fundo_estrelado.desenhar(self.__tela)
-            todas_entidades = [self.__nave] + self.__asteroides + self.__projeteis + self.__ovnis + self.__ovni_projeteis + self.__fantasmas + self.__lasers_fantasma
-            for entidade in filter(None, todas_entidades): entidade.desenhar(self.__tela)
-            self._desenhar_hud()
+            if self.__renderizador is None:
+                self.__tela.fill(PRETO)
+                self.__fundo_estrelado.desenhar(self.__tela)
+                self._desenhar_entidades(alfa=alfa)
+                self._desenhar_hud()
+                perfilador.desenhar_overlay(self.__tela)
+            else: areas_desenhadas = self._desenhar_quadro_sujo(alfa)
+            perfilador.marcar("desenho")
             if self.is_game_over():
-                self._desenhar_tela_game_over(); pygame.display.flip(); pygame.time.wait(3000)
+                self._desenhar_tela_game_over(); pygame.display.flip(); self.__relogio.esperar(3000)
                 return EstadoJogoLoop.VOLTAR_AO_MENU_GAME_OVER, self.get_pontuacao()
             
-            pygame.display.flip()
\ No newline at end of file
+            if self.__renderizador is None: pygame.display.flip()
+            else: self.__renderizador.apresentar(areas_desenhadas)
+            perfilador.marcar("flip")
+            perfilador.finalizar_frame(self._contagens_entidades())
+
+    def _loop_frames_paralelo(self) -> tuple[EstadoJogoLoop, int]:
+        """
+        Loop em pipeline: enquanto a thread de simulação calcula o frame N+1,
+        a thread principal desenha e apresenta o retrato do frame N (a tela
+        fica um frame atrás da entrada). Eventos e desenho ficam na thread
+        principal, como o SDL exige; o estado do jogo só é tocado aqui entre
+        `aguardar` e o próximo `iniciar`, com a simulação parada.
+        """
+        perfilador = self.__perfilador
+        tecla_overlay = pygame.key.key_code(TECLA_OVERLAY_PERFIL)
+        self._capturar_quadro(self.__quadros[self.__indice_quadro_frente])
+        simulacao = SimulacaoParalela(self._passo_paralelo)
+        try:
+            while True:
+                delta_tempo = self.__clock.tick(self.__limite_fps) / 1000.0
+                perfilador.iniciar_frame(delta_tempo * 1000)
+                atirar, resultado = self._processar_eventos(tecla_overlay)
+                if resultado: return resultado
+                simulacao.iniciar(self._ler_entrada_teclado(atirar), delta_tempo)
+                perfilador.marcar("entrada")
+
+                quadro = self.__quadros[self.__indice_quadro_frente]
+                areas_desenhadas = self._desenhar_quadro(quadro)
+                perfilador.marcar("desenho")
+                if self.__renderizador is None: pygame.display.flip()
+                else: self.__renderizador.apresentar(areas_desenhadas)
+                perfilador.marcar("flip")
+
+                simulacao.aguardar()
+                # As fases da simulação não são medidas na outra thread: aqui fica só o que não coube atrás do desenho
+                perfilador.marcar("atualizacao")
+                self.__indice_quadro_frente = 1 - self.__indice_quadro_frente
+                self._atualizar_sons_ambiente()
+                self.__gerenciador_som.despachar_sons()
+                if self.__autosave and not self.is_game_over(): self.__autosave.atualizar(self.__relogio.get_ticks(), self.capturar_estado)
+                if self.is_game_over():
+                    self._desenhar_quadro(self.__quadros[self.__indice_quadro_frente])
+                    self._desenhar_tela_game_over(); pygame.display.flip(); self.__relogio.esperar(3000)
+                    return EstadoJogoLoop.VOLTAR_AO_MENU_GAME_OVER, self.get_pontuacao()
+                perfilador.finalizar_frame(quadro.contagens)
+        finally:
+            simulacao.encerrar()
\ No newline at end of file
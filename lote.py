@@ -0,0 +1,247 @@
+"""
+Roda muitas partidas headless em paralelo, com um robô no lugar do jogador,
+para avaliar as constantes de dificuldade do `config.py` sem jogar à mão:
+
+    python lote.py --partidas 200 --politica mirar --varrer VEL_MAX_ASTEROIDE=1.5,2,3 --saida lote.csv
+
+Cada partida recebe a própria semente, as sobrescritas de configuração e a
+política do robô, e roda num processo do pool (as partidas não compartilham
+nada, então o tempo cai com o número de núcleos). Cada resultado é gravado
+no CSV assim que chega; um resumo por combinação é mostrado no fim.
+"""
+import ast
+import csv
+import functools
+import glob
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Optional
+import config
+from config import BACKEND_ENTIDADES, FPS
+from entrada import EntradaJogo, ENTRADA_VAZIA
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+COLUNAS = ("execucao", "semente", "politica", "sobrescritas", "pontuacao", "nivel", "vidas", "game_over", "frames",
+           "tempo_sobrevivencia_s", "entidades_vivas", "media_atualizacao_ms")
+
+
+# --- Políticas do robô: (semente) -> (jogo, frame) -> EntradaJogo ---
+def politica_parado(semente: int) -> Callable:
+    return lambda jogo, frame: ENTRADA_VAZIA
+
+
+def politica_aleatoria(semente: int) -> Callable:
+    """Troca de comando a cada 10 frames, sorteando de um gerador próprio da partida."""
+    rng = random.Random(semente)
+    atual = [ENTRADA_VAZIA]
+    def decidir(jogo, frame: int) -> EntradaJogo:
+        if frame % 10 == 0:
+            giro = rng.random()
+            atual[0] = EntradaJogo(giro < 0.3, giro > 0.7, rng.random() < 0.4, rng.random() < 0.5)
+        return atual[0]
+    return decidir
+
+
+def politica_mirar(semente: int) -> Callable:
+    """Gira para o alvo mais próximo, atira quando está alinhada e se aproxima dos alvos distantes."""
+    def decidir(jogo, frame: int) -> EntradaJogo:
+        nave = jogo.get_nave()
+        if not nave or not nave.is_ativo(): return ENTRADA_VAZIA
+        listas = jogo.get_listas_entidades()
+        alvos = listas["asteroides"] + listas["ovnis"]
+        if not alvos: return ENTRADA_VAZIA
+        posicao = nave.get_posicao()
+        alvo = min(alvos, key=lambda a: posicao.distancia_ate(a.get_posicao()))
+        delta = alvo.get_posicao() - posicao
+        # Ângulo 0 da nave aponta para cima (ver Nave.atirar)
+        desejado = math.degrees(math.atan2(delta.y, delta.x)) + 90
+        diferenca = (desejado - nave.get_angulo() + 180) % 360 - 180
+        return EntradaJogo(diferenca < -5, diferenca > 5, posicao.distancia_ate(alvo.get_posicao()) > 250, abs(diferenca) < 10)
+    return decidir
+
+
+POLITICAS = {"parado": politica_parado, "aleatoria": politica_aleatoria, "mirar": politica_mirar}
+
+
+# --- Sobrescritas de configuração ---
+def _aplicar_sobrescritas(sobrescritas: dict) -> dict:
+    """
+    Troca as constantes em `config` e nos módulos do jogo que as copiaram com
+    `from config import *`. Devolve os valores originais para `_restaurar`.
+    Constantes já usadas na importação são recusadas antes, em `_ler_sobrescrita`.
+    """
+    originais = {nome: getattr(config, nome) for nome in sobrescritas}
+    for modulo in list(sys.modules.values()):
+        arquivo = getattr(modulo, "__file__", None)
+        if not arquivo or not os.path.abspath(arquivo).startswith(RAIZ): continue
+        for nome, valor in sobrescritas.items():
+            if vars(modulo).get(nome, None) is originais[nome]: setattr(modulo, nome, valor)
+    return originais
+
+
+def _restaurar(sobrescritas: dict, originais: dict) -> None:
+    for modulo in list(sys.modules.values()):
+        arquivo = getattr(modulo, "__file__", None)
+        if not arquivo or not os.path.abspath(arquivo).startswith(RAIZ): continue
+        for nome, valor in sobrescritas.items():
+            if nome in vars(modulo) and vars(modulo)[nome] is valor: setattr(modulo, nome, originais[nome])
+
+
+# --- Execução ---
+def _iniciar_processo() -> None:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # senão cada processo repete o banner do pygame
+    import gerenciador  # noqa: F401  (importado uma vez por processo, não por partida)
+    # As transições do fantasma seriam impressas a cada partida; o resto da saída dos processos continua visível
+    _aplicar_sobrescritas({"MENSAGENS_DEPURACAO_FANTASMA": False})
+
+
+def executar_partida(especificacao: tuple) -> dict:
+    """Roda uma partida até o game over ou `max_segundos` de jogo e devolve as métricas (uma linha do CSV)."""
+    from gerenciador import GerenciadorJogo
+    indice, semente, politica, sobrescritas, max_segundos, backend = especificacao
+    originais = _aplicar_sobrescritas(sobrescritas)
+    try:
+        random.seed(semente)
+        jogo = GerenciadorJogo.criar_headless(backend, semente=semente, taxa_fisica=config.TAXA_FISICA)
+        decidir = POLITICAS[politica](semente)
+        # Um frame da partida é um passo de física (TAXA_FISICA pode estar entre as sobrescritas)
+        dt = 1 / (config.TAXA_FISICA or FPS)
+        max_frames = round(max_segundos / dt)
+        total_s = 0.0
+        relogio = time.perf_counter
+        frames = 0
+        while frames < max_frames and not jogo.is_game_over():
+            entrada = decidir(jogo, frames)
+            inicio = relogio()
+            jogo.simular_passo(entrada, dt)
+            total_s += relogio() - inicio
+            frames += 1
+        return {"execucao": indice, "semente": semente, "politica": politica, "sobrescritas": json.dumps(sobrescritas, sort_keys=True),
+                "pontuacao": jogo.get_pontuacao(), "nivel": jogo.get_nivel_atual(), "vidas": jogo.get_vidas(),
+                "game_over": int(jogo.is_game_over()), "frames": frames, "tempo_sobrevivencia_s": round(frames * dt, 3),
+                "entidades_vivas": sum(len(lista) for lista in jogo.get_listas_entidades().values()),
+                "media_atualizacao_ms": round(total_s * 1000 / max(frames, 1), 4)}
+    finally:
+        _restaurar(sobrescritas, originais)
+
+
+def montar_partidas(partidas: int, semente_base: int, politica: str, fixas: dict, varreduras: dict,
+                    max_segundos: float, backend: str) -> list[tuple]:
+    """
+    Uma especificação por (combinação das varreduras, repetição). A semente é a
+    base mais a repetição, então toda combinação joga as mesmas partidas e as
+    diferenças entre elas vêm só dos parâmetros varridos.
+    """
+    nomes = list(varreduras)
+    especificacoes = []
+    for valores in itertools.product(*(varreduras[nome] for nome in nomes)):
+        sobrescritas = {**fixas, **dict(zip(nomes, valores))}
+        for repeticao in range(partidas):
+            especificacoes.append((len(especificacoes), semente_base + repeticao, politica, sobrescritas, max_segundos, backend))
+    return especificacoes
+
+
+# Usadas na importação, mas repassadas explicitamente a cada partida (ver `executar_partida`)
+_REPASSADAS_NA_PARTIDA = ("TAXA_FISICA",)
+
+
+def _e_bloco_main(teste: ast.expr) -> bool:
+    return ast.unparse(teste).replace('"', "'") == "__name__ == '__main__'"
+
+
+@functools.lru_cache(maxsize=None)
+def _constantes_fixadas_na_importacao() -> frozenset[str]:
+    """
+    Nomes lidos enquanto os módulos do jogo são importados: padrões de
+    parâmetros, corpos de classe e expressões no nível do módulo (inclusive
+    constantes derivadas dentro do próprio config.py). Trocar esses nomes
+    depois da importação não muda nada, então a sobrescrita só mudaria o rótulo.
+    """
+    nomes = set()
+
+    def visitar(no: ast.AST) -> None:
+        if isinstance(no, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+            # Do corpo nada roda na importação; padrões e decoradores, sim
+            for padrao in no.args.defaults + [d for d in no.args.kw_defaults if d is not None]: visitar(padrao)
+            for decorador in getattr(no, "decorator_list", ()): visitar(decorador)
+            return
+        if isinstance(no, ast.If) and _e_bloco_main(no.test): return
+        if isinstance(no, ast.Name) and isinstance(no.ctx, ast.Load): nomes.add(no.id)
+        for filho in ast.iter_child_nodes(no): visitar(filho)
+
+    for caminho in glob.glob(os.path.join(RAIZ, "*.py")):
+        with open(caminho, encoding="utf-8") as f: visitar(ast.parse(f.read(), caminho))
+    return frozenset(nomes - set(_REPASSADAS_NA_PARTIDA))
+
+
+def _ler_sobrescrita(texto: str, varias: bool) -> tuple[str, object]:
+    nome, sep, valor = texto.partition("=")
+    if not sep or not nome.isupper() or not hasattr(config, nome):
+        raise ValueError(f"'{texto}': esperado NOME=VALOR com uma constante de config.py")
+    if nome in _constantes_fixadas_na_importacao():
+        raise ValueError(f"'{nome}' é lida na importação dos módulos (padrão de parâmetro, atributo de classe ou "
+                         f"constante derivada); sobrescrevê-la por partida não teria efeito")
+    if not varias: return nome, ast.literal_eval(valor)
+    return nome, [ast.literal_eval(v) for v in valor.split(",")]
+
+
+def _resumir(linhas: list[dict]) -> None:
+    grupos: dict[str, list[dict]] = {}
+    for linha in linhas: grupos.setdefault(linha["sobrescritas"], []).append(linha)
+    for chave, grupo in sorted(grupos.items()):
+        media = lambda campo: statistics.fmean(linha[campo] for linha in grupo)
+        print(f"{chave}: {len(grupo)} partidas | pontuação média {media('pontuacao'):.0f} | nível médio {media('nivel'):.2f} | "
+              f"sobrevivência média {media('tempo_sobrevivencia_s'):.1f} s | game over {media('game_over'):.0%} | "
+              f"atualização média {media('media_atualizacao_ms'):.3f} ms")
+
+
+def main(argv: Optional[list[str]] = None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Partidas headless em lote para calibrar a dificuldade")
+    parser.add_argument("--partidas", type=int, default=100, help="partidas por combinação de sobrescritas")
+    parser.add_argument("--politica", choices=sorted(POLITICAS), default="mirar", help="como o robô controla a nave")
+    parser.add_argument("--definir", action="append", default=[], metavar="NOME=VALOR", help="sobrescreve uma constante em todas as partidas")
+    parser.add_argument("--varrer", action="append", default=[], metavar="NOME=V1,V2,...", help="roda as partidas para cada valor (combinações cruzadas)")
+    parser.add_argument("--max-segundos", type=float, default=300, help="limite de tempo de jogo por partida")
+    parser.add_argument("--semente", type=int, default=0, help="semente da primeira partida de cada combinação; as repetições seguintes somam 1, 2, ...")
+    parser.add_argument("--processos", type=int, default=os.cpu_count(), help="processos no pool (padrão: um por núcleo)")
+    parser.add_argument("--backend", choices=("objetos", "numpy"), default=BACKEND_ENTIDADES)
+    parser.add_argument("--saida", default="lote.csv", help="CSV com uma linha por partida")
+    args = parser.parse_args(argv)
+    try:
+        fixas = dict(_ler_sobrescrita(texto, False) for texto in args.definir)
+        varreduras = dict(_ler_sobrescrita(texto, True) for texto in args.varrer)
+    except (ValueError, SyntaxError) as e:
+        parser.error(str(e))
+
+    especificacoes = montar_partidas(args.partidas, args.semente, args.politica, fixas, varreduras, args.max_segundos, args.backend)
+    processos = max(1, min(args.processos, len(especificacoes)))
+    # Lotes pequenos mantêm o CSV andando; grandes demais deixariam núcleos ociosos no final
+    tamanho_lote = max(1, len(especificacoes) // (processos * 16))
+    print(f"{len(especificacoes)} partidas em {processos} processos...")
+    inicio = time.perf_counter()
+    linhas = []
+    with open(args.saida, "w", newline="") as f, multiprocessing.Pool(processos, initializer=_iniciar_processo) as pool:
+        escritor = csv.DictWriter(f, fieldnames=COLUNAS)
+        escritor.writeheader()
+        for linha in pool.imap_unordered(executar_partida, especificacoes, chunksize=tamanho_lote):
+            escritor.writerow(linha); f.flush()
+            linhas.append(linha)
+            if len(linhas) % max(1, len(especificacoes) // 10) == 0: print(f"  {len(linhas)}/{len(especificacoes)}")
+    duracao = time.perf_counter() - inicio
+    frames = sum(linha["frames"] for linha in linhas)
+    print(f"{len(linhas)} partidas, {frames} frames em {duracao:.1f} s ({frames / max(duracao, 1e-9):.0f} frames/s); resultados em {args.saida}")
+    _resumir(linhas)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,36 +1,62 @@
+from __future__ import annotations
+import time
+_INICIO_PROCESSO = time.perf_counter()  # referência do --startup-profile, antes dos imports pesados
+
 import pygame
-import pygame_menu
-import json
-import os
-from typing import Optional
+import argparse
+import io
+import threading
+from typing import Optional, TYPE_CHECKING
 
 # Importações locais
 from config import *
 from gerenciador import GerenciadorJogo, EstadoJogoLoop
 from entidades import CLASSE_MAP
-from ranking_manager import RankingManager
+from ranking_manager import RankingManager, criar_repositorio_ranking
 from jogador_ranking import JogadorRanking
+from salvamento import ler_save_mais_recente, caminhos_pontos_restauracao, aguardar_gravacoes
+from entidades import tarefas_pre_carregamento
+from precarregamento import PreCarregador
+from mixer_eventos import MixerEventos
+from perfilador import PerfilInicializacao
 from vetor import *
 
+# pygame_menu (~50 ms de importação) só é importado dentro dos métodos que montam menus,
+# depois que a tela de carregamento já apareceu; aqui ele serve só às anotações
+if TYPE_CHECKING: import pygame_menu
+
+
+class _SomMudo:
+    """Substitui um som que não pôde ser carregado (arquivo ausente, mixer indisponível)."""
+    def play(self, *args, **kwargs): return None
+    def stop(self): pass
+    def set_volume(self, volume): pass
+
 
 class GerenciadorSom:
+    # nome do efeito: (arquivo, fração do volume de SFX, categoria de canais, prioridade)
+    SONS = {
+        'tiro': (SOM_TIRO, 1.0, "tiros", 1),
+        'explosao_asteroide': (SOM_EXPLOSAO_ASTEROIDE, 1.0, "explosoes", 2),
+        'explosao_nave': (SOM_EXPLOSAO_NAVE, 1.0, "explosoes", 3),
+        'ovni_tiro': (SOM_OVNI_TIRO, 1.0, "inimigos", 1),
+        'ovni_movendo': (SOM_OVNI_MOVENDO, 0.3, "ambiente", 0),
+        'fantasma_invisivel': (SOM_FANTASMA_INVISIVEL, 0.6, "ambiente", 0),
+    }
+
     def __init__(self):
         self.__volume_musica = VOLUME_MUSICA_PADRAO
         self.__volume_sfx = VOLUME_SFX_PADRAO
-        try:
-            # Carrega os efeitos sonoros em memória
-            self.__som_tiro = pygame.mixer.Sound(SOM_TIRO)
-            self.__som_explosao_asteroide = pygame.mixer.Sound(SOM_EXPLOSAO_ASTEROIDE)
-            self.__som_explosao_nave = pygame.mixer.Sound(SOM_EXPLOSAO_NAVE)
-            self.__som_ovni_movendo = pygame.mixer.Sound(SOM_OVNI_MOVENDO)
-            self.__som_ovni_tiro = pygame.mixer.Sound(SOM_OVNI_TIRO)
-            self.__som_fantasma_invisivel = pygame.mixer.Sound(SOM_FANTASMA_INVISIVEL)
-            self.atualizar_volumes_sfx()
-            print("Efeitos sonoros carregados.")
-        except pygame.error as e:
-            print(f"AVISO: Não foi possível carregar um ou mais arquivos de som: {e}")
-            dummy_sound = type('DummySound', (), {'play': lambda s, *a, **kw: None, 'stop': lambda s: None, 'set_volume': lambda s, v: None})()
-            self.__som_tiro, self.__som_explosao_asteroide, self.__som_explosao_nave, self.__som_ovni_movendo, self.__som_ovni_tiro, self.__som_fantasma_invisivel = (dummy_sound,) * 6
+        # Os sons são decodificados na hora do primeiro uso (ou pelo pré-carregamento, os de SONS_PRE_CARREGADOS)
+        self.__sons: dict[str, object] = {}
+        # Arquivos ainda comprimidos dos loops de SONS_EM_FLUXO
+        self.__comprimidos: dict[str, bytes] = {}
+        self.__musica_carregada: Optional[str] = None
+        self.__trava_sons = threading.Lock()
+        # Decodificação dos loops de SONS_EM_FLUXO em segundo plano (uma por partida)
+        self.__preparo_fluxo: Optional[PreCarregador] = None
+        # Os efeitos passam por uma fila despachada uma vez por frame (sem mixer, nada toca)
+        self.__mixer_eventos = MixerEventos() if pygame.mixer.get_init() else None
 
     def get_volume_musica(self) -> float:
         return self.__volume_musica
@@ -38,11 +64,56 @@ class GerenciadorSom:
     def get_volume_sfx(self) -> float:
         return self.__volume_sfx
 
+    def carregar_som(self, nome_som: str):
+        with self.__trava_sons:
+            som = self.__sons.get(nome_som)
+            if som is not None: return som
+            arquivo, fator_volume = self.SONS[nome_som][:2]
+            try:
+                if nome_som in SONS_EM_FLUXO:
+                    dados = self.__comprimidos.get(nome_som)
+                    if dados is None:
+                        with open(arquivo, "rb") as f: dados = self.__comprimidos[nome_som] = f.read()
+                    som = pygame.mixer.Sound(file=io.BytesIO(dados))
+                else: som = pygame.mixer.Sound(arquivo)
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"AVISO: Não foi possível carregar o som '{nome_som}': {e}")
+                som = _SomMudo()
+            som.set_volume(self.__volume_sfx * fator_volume)
+            self.__sons[nome_som] = som
+            return som
+
+    def tarefas_pre_carregamento(self) -> list:
+        return [(f"som {nome}", lambda n=nome: self.carregar_som(n)) for nome in SONS_PRE_CARREGADOS]
+
+    def get_memoria_sons(self) -> dict[str, dict[str, int]]:
+        """Bytes ocupados por som: o áudio decodificado e, para os loops em fluxo, o arquivo comprimido."""
+        frequencia, formato, canais = pygame.mixer.get_init() or (0, 0, 0)
+        bytes_por_amostra = abs(formato) // 8 * canais
+        with self.__trava_sons:
+            memoria = {nome: {"decodificado": int(som.get_length() * frequencia) * bytes_por_amostra, "comprimido": 0}
+                       for nome, som in self.__sons.items() if not isinstance(som, _SomMudo)}
+            for nome, dados in self.__comprimidos.items():
+                memoria.setdefault(nome, {"decodificado": 0})["comprimido"] = len(dados)
+        return memoria
+
+    def imprimir_memoria_sons(self):
+        memoria = self.get_memoria_sons()
+        if not memoria: return
+        print("Memória dos sons carregados:")
+        for nome, uso in memoria.items():
+            print(f"  {nome:<20} {uso['decodificado'] / 1024:8.0f} KiB decodificados {uso['comprimido'] / 1024:6.0f} KiB comprimidos")
+        print(f"  {'total':<20} {sum(u['decodificado'] + u['comprimido'] for u in memoria.values()) / 1024:8.0f} KiB")
+
     def tocar_musica_fundo(self, tipo_musica: str = 'menu'):
+        arquivo_musica = MUSICA_FUNDO_MENU if tipo_musica == 'menu' else MUSICA_FUNDO_JOGO
+        # A mesma música já carregada não é lida do disco de novo; se estiver tocando, segue tocando
+        if arquivo_musica == self.__musica_carregada and pygame.mixer.music.get_busy(): return
         pygame.mixer.music.stop()
         try:
-            arquivo_musica = MUSICA_FUNDO_MENU if tipo_musica == 'menu' else MUSICA_FUNDO_JOGO
-            pygame.mixer.music.load(arquivo_musica)
+            if arquivo_musica != self.__musica_carregada:
+                pygame.mixer.music.load(arquivo_musica)
+                self.__musica_carregada = arquivo_musica
             pygame.mixer.music.set_volume(self.__volume_musica)
             pygame.mixer.music.play(-1)  # -1 para loop infinito
         except pygame.error as e:
@@ -51,17 +122,45 @@ class GerenciadorSom:
     def parar_musica(self):
         pygame.mixer.music.stop()
 
-    def tocar_som(self, nome_som: str, loop=0):
-        if nome_som == 'tiro': self.__som_tiro.play()
-        elif nome_som == 'explosao_asteroide': self.__som_explosao_asteroide.play()
-        elif nome_som == 'explosao_nave': self.__som_explosao_nave.play()
-        elif nome_som == 'ovni_tiro': self.__som_ovni_tiro.play()
-        elif nome_som == 'ovni_movendo': self.__som_ovni_movendo.play(loops=loop)
-        elif nome_som == 'fantasma_invisivel': self.__som_fantasma_invisivel.play(loops=loop)
+    def tocar_som(self, nome_som: str, loop=0) -> bool:
+        """Enfileira o efeito; ele toca no próximo `despachar_sons`. False se não vai tocar agora."""
+        if nome_som not in self.SONS or self.__mixer_eventos is None: return False
+        som = self.__sons.get(nome_som)
+        if som is None:
+            if nome_som in SONS_EM_FLUXO:
+                # Um loop nunca é decodificado na thread do jogo: o preparo roda em segundo plano e quem pediu tenta de novo
+                self.preparar_sons_em_fluxo()
+                return False
+            som = self.carregar_som(nome_som)
+        if isinstance(som, _SomMudo): return False
+        _, _, categoria, prioridade = self.SONS[nome_som]
+        self.__mixer_eventos.enfileirar(nome_som, som, categoria, prioridade, loop)
+        return True
+
+    def despachar_sons(self):
+        if self.__mixer_eventos: self.__mixer_eventos.despachar()
 
     def parar_som(self, nome_som: str):
-        if nome_som == 'ovni_movendo': self.__som_ovni_movendo.stop()
-        elif nome_som == 'fantasma_invisivel': self.__som_fantasma_invisivel.stop()
+        if self.__mixer_eventos: self.__mixer_eventos.parar(nome_som)
+
+    def preparar_sons_em_fluxo(self):
+        """Decodifica os loops de SONS_EM_FLUXO numa thread de fundo; ficam prontos até `liberar_sons_em_fluxo`."""
+        if self.__preparo_fluxo is not None or self.__mixer_eventos is None: return
+        self.__preparo_fluxo = PreCarregador([(f"loop {nome}", lambda n=nome: self.carregar_som(n)) for nome in SONS_EM_FLUXO])
+        self.__preparo_fluxo.iniciar()
+
+    def liberar_sons_em_fluxo(self):
+        """Fim da partida: os loops param e voltam a ocupar só o arquivo comprimido."""
+        if self.__preparo_fluxo is not None:
+            self.__preparo_fluxo.cancelar()
+            self.__preparo_fluxo = None
+        for nome_som in SONS_EM_FLUXO:
+            self.parar_som(nome_som)
+            with self.__trava_sons:
+                if not isinstance(self.__sons.get(nome_som), _SomMudo): self.__sons.pop(nome_som, None)
+
+    def get_estatisticas_sons(self) -> dict:
+        return self.__mixer_eventos.get_estatisticas() if self.__mixer_eventos else {}
 
     def set_volume_musica(self, volume, *args):
         novo_volume = float(volume) / 100.0
@@ -74,24 +173,39 @@ class GerenciadorSom:
         self.atualizar_volumes_sfx()
 
     def atualizar_volumes_sfx(self):
-        self.__som_tiro.set_volume(self.__volume_sfx)
-        self.__som_explosao_asteroide.set_volume(self.__volume_sfx)
-        self.__som_explosao_nave.set_volume(self.__volume_sfx)
-        self.__som_ovni_movendo.set_volume(self.__volume_sfx * 0.3)
-        self.__som_ovni_tiro.set_volume(self.__volume_sfx)
-        self.__som_fantasma_invisivel.set_volume(self.__volume_sfx * 0.6)
+        with self.__trava_sons:
+            for nome_som, som in self.__sons.items(): som.set_volume(self.__volume_sfx * self.SONS[nome_som][1])
+
 
 
 class App:
-    def __init__(self):
+    def __init__(self, backend: str = BACKEND_ENTIDADES, arquivo_trace: Optional[str] = ARQUIVO_TRACE_PERFIL, semente: Optional[int] = None, arquivo_replay: Optional[str] = None, renderizacao_suja: bool = RENDERIZACAO_SUJA, backend_ranking: str = BACKEND_RANKING, perfil_inicializacao: bool = False, simulacao_paralela: bool = SIMULACAO_EM_PARALELO, taxa_fisica: int = TAXA_FISICA, limite_fps: int = LIMITE_FPS_RENDERIZACAO):
+        self.__perfil_inicializacao = PerfilInicializacao(_INICIO_PROCESSO) if perfil_inicializacao else None
         pygame.init()
+        self.__backend = backend
+        self.__arquivo_trace = arquivo_trace
+        self.__semente = semente
+        self.__arquivo_replay = arquivo_replay
+        self.__renderizacao_suja = renderizacao_suja
+        self.__simulacao_paralela = simulacao_paralela
+        self.__taxa_fisica = taxa_fisica
+        self.__limite_fps = limite_fps
         self.__tela = pygame.display.set_mode((LARGURA_TELA, ALTURA_TELA))
         pygame.display.set_caption(TITULO_JOGO)
+        self._desenhar_tela_carregamento()
+        self._marcar_inicializacao("primeiro frame")
         self.__clock = pygame.time.Clock()
         self.__gerenciador_som = GerenciadorSom()
-        self.__ranking_manager = RankingManager()
+        # Sons, sprites e quadros de rotação carregam em segundo plano enquanto o menu já aparece
+        self.__pre_carregador = PreCarregador(self.__gerenciador_som.tarefas_pre_carregamento() + tarefas_pre_carregamento())
+        self.__pre_carregador.iniciar()
+        self.__ranking_manager = RankingManager(criar_repositorio_ranking(backend_ranking))
         self.__botao_continuar_ref = None
+        self.__rotulo_carregamento = None
+        self.__menu_na_tela = False
+        self.__submenus: dict[str, pygame_menu.Menu] = {}
         self.__menu_principal = self._criar_menu_principal()
+        self._marcar_inicializacao("menu principal montado")
 
     def get_tela(self) -> pygame.Surface:
         return self.__tela
@@ -114,8 +228,48 @@ class App:
     def set_botao_continuar_ref(self, botao: pygame_menu.widgets.Button):
         self.__botao_continuar_ref = botao
 
+    def _marcar_inicializacao(self, nome: str) -> None:
+        if self.__perfil_inicializacao: self.__perfil_inicializacao.marcar(nome)
+
+    def _desenhar_tela_carregamento(self) -> None:
+        tela = self.get_tela()
+        tela.fill(PRETO)
+        texto = pygame.font.Font(None, 36).render("Carregando...", True, BRANCO)
+        tela.blit(texto, texto.get_rect(center=(LARGURA_TELA // 2, ALTURA_TELA // 2)))
+        pygame.display.flip()
+
+    def _acompanhar_carregamento(self) -> None:
+        """Chamada a cada frame do menu principal: mostra o progresso do pré-carregamento."""
+        self.get_ranking_manager().sincronizar_se_vencido()
+        if not self.__menu_na_tela:
+            self.__menu_na_tela = True
+            self._marcar_inicializacao("menu principal na tela")
+        rotulo = self.__rotulo_carregamento
+        if rotulo is None or not rotulo.is_visible(): return
+        pre_carregador = self.__pre_carregador
+        if not pre_carregador.is_concluido():
+            rotulo.set_title(f"Carregando recursos... {pre_carregador.get_progresso():.0%}")
+            return
+        rotulo.hide()
+        print(f"Recursos carregados em segundo plano em {pre_carregador.get_duracao_ms():.0f} ms.")
+        self._marcar_inicializacao("recursos carregados")
+        if self.__perfil_inicializacao: self.__perfil_inicializacao.imprimir()
+
+    def _abrir_submenu(self, nome: str, criar) -> None:
+        """
+        Os submenus só são montados na primeira vez em que são abertos. O
+        `add.button(titulo, submenu)` público exige o submenu pronto quando o
+        menu principal é criado, então a abertura passa por `Menu._open`, API
+        privada do pygame-menu. Este é o único uso dela; a versão da biblioteca
+        está fixada em requirements.txt por isso.
+        """
+        submenu = self.__submenus.get(nome)
+        if submenu is None: submenu = self.__submenus[nome] = criar()
+        self.get_menu_principal()._open(submenu)
+
 
     def _criar_menu_principal(self) -> pygame_menu.Menu:
+        import pygame_menu
         tema = pygame_menu.themes.THEME_DARK.copy()
         tema.widget_font_size = 24
         tema.title_font_size = 36
@@ -129,21 +283,28 @@ class App:
             menu.add.button('Continuar Jogo', lambda: self._iniciar_jogo_callback(carregar_save=True))
         )
         
-        menu.add.button('Ranking', self._criar_menu_ranking())
-        menu.add.button('Configurações', self._criar_menu_configuracoes())
+        menu.add.button('Ranking', lambda: self._abrir_submenu('ranking', self._criar_menu_ranking))
+        menu.add.button('Configurações', lambda: self._abrir_submenu('configuracoes', self._criar_menu_configuracoes))
         menu.add.button('Sair', pygame_menu.events.EXIT)
+        self.__rotulo_carregamento = menu.add.label("Carregando recursos... 0%", font_size=16)
         menu.set_onbeforeopen(self._atualizar_botao_continuar)
         
         return menu
 
     def _criar_menu_ranking(self) -> pygame_menu.Menu:
+        import pygame_menu
         menu_ranking = pygame_menu.Menu(title="Ranking - Top 10", width=LARGURA_TELA * 0.8, height=ALTURA_TELA * 0.9, theme=pygame_menu.themes.THEME_DARK)
         frame = menu_ranking.add.frame_v(width=LARGURA_TELA * 0.7, height=ALTURA_TELA * 0.7)
         frame._relax = True
+        versao_exibida = None
         
         def atualizar_ranking(menu_atual, proximo_menu):
+            nonlocal versao_exibida
             ranking_manager = self.get_ranking_manager() # Usa getter
             ranking_manager.carregar_scores()
+            # A tabela só é refeita quando o Top 10 mudou desde a última vez que foi montada
+            if ranking_manager.get_versao() == versao_exibida and menu_ranking.get_widget('ranking_table'): return
+            versao_exibida = ranking_manager.get_versao()
             jogadores = ranking_manager.get_jogadores()
 
             if menu_ranking.get_widget('ranking_table'):
@@ -163,6 +324,7 @@ class App:
         return menu_ranking
 
     def _criar_menu_configuracoes(self) -> pygame_menu.Menu:
+        import pygame_menu
         gerenciador_som = self.get_gerenciador_som() # Usa getter
         menu_cfg = pygame_menu.Menu(title="Configurações", width=LARGURA_TELA*0.7, height=ALTURA_TELA*0.6, theme=pygame_menu.themes.THEME_DARK)
         menu_cfg.add.label("Volume da Música:")
@@ -176,17 +338,21 @@ class App:
         self.get_menu_principal().disable() # Usa getter
         gerenciador_som = self.get_gerenciador_som()
         gerenciador_som.tocar_musica_fundo('jogo')
+        # Os loops de fundo decodificam enquanto a partida começa e ficam prontos até ela acabar
+        gerenciador_som.preparar_sons_em_fluxo()
         
-        jogo = GerenciadorJogo(self.get_tela(), self.get_clock(), gerenciador_som)
+        jogo = GerenciadorJogo(self.get_tela(), self.get_clock(), gerenciador_som, self.__backend, arquivo_trace=self.__arquivo_trace, semente=self.__semente, renderizacao_suja=self.__renderizacao_suja, simulacao_paralela=self.__simulacao_paralela, taxa_fisica=self.__taxa_fisica, limite_fps=self.__limite_fps)
 
-        if carregar_save:
-            if not jogo.carregar_estado_jogo():
-                print("Não foi possível carregar o save, iniciando novo jogo.")
-                jogo.reiniciar_jogo_completo()
-        else:
+        carregou = carregar_save and jogo.carregar_estado_jogo()
+        if carregar_save and not carregou:
+            print("Não foi possível carregar o save, iniciando novo jogo.")
+        if not carregou:
             jogo.reiniciar_jogo_completo()
+            # Só partidas novas podem ser gravadas: o replay recomeça a partir da semente
+            if self.__arquivo_replay: jogo.iniciar_gravacao(self.__arquivo_replay)
 
         retorno_do_jogo, pontuacao_final = jogo.loop_principal()
+        gerenciador_som.liberar_sons_em_fluxo()
 
         if retorno_do_jogo == EstadoJogoLoop.VOLTAR_AO_MENU_GAME_OVER:
             self._coletar_nome_jogador_e_salvar_score(pontuacao_final)
@@ -197,6 +363,7 @@ class App:
 
     def _coletar_nome_jogador_e_salvar_score(self, pontuacao_final: int):
         if pontuacao_final <= 0: return
+        import pygame_menu
         menu_nome = pygame_menu.Menu(title="FIM DE JOGO", width=500, height=300, theme=pygame_menu.themes.THEME_DARK)
         menu_nome.add.label(f"Pontuacao Final: {pontuacao_final}", font_size=30)
         menu_nome.add.vertical_margin(20)
@@ -206,13 +373,12 @@ class App:
             nome_digitado = text_input.get_value().strip().upper()
             if not nome_digitado: print("Nome não pode ser vazio!"); return
             
-            print(f"Criando novo recorde para {nome_digitado} com {pontuacao_final} pontos.")
+            ranking_manager = self.get_ranking_manager() # Usa getter
+            print(f"Criando novo recorde para {nome_digitado} com {pontuacao_final} pontos ({ranking_manager.get_posicao(pontuacao_final)}º lugar).")
             novo_recorde = JogadorRanking(nome_digitado, pontuacao_final)
             
-            ranking_manager = self.get_ranking_manager() # Usa getter
             ranking_manager.carregar_scores()
             ranking_manager.adicionar_score(novo_recorde)
-            ranking_manager.salvar_scores()
             menu_nome.disable()
             self._atualizar_botao_continuar()
 
@@ -221,11 +387,9 @@ class App:
         menu_nome.mainloop(self.get_tela()) # Usa getter
 
     def _verificar_save_valido(self) -> bool:
-        if not os.path.exists(ARQUIVO_SAVE_GAME): return False
-        try:
-            with open(ARQUIVO_SAVE_GAME, 'r') as f:
-                return not json.load(f).get("game_over", True)
-        except (json.JSONDecodeError, IOError): return False
+        aguardar_gravacoes()  # um "Salvar e Sair" recém-pedido pode ainda estar sendo gravado
+        # Vale o save principal ou qualquer ponto de restauração legível (ex.: depois de um crash)
+        return ler_save_mais_recente(caminhos_pontos_restauracao()) is not None
 
     def _atualizar_botao_continuar(self):
         botao = self.get_botao_continuar_ref() # Usa getter
@@ -240,14 +404,29 @@ class App:
         self.get_gerenciador_som().tocar_musica_fundo('menu') # Usa getter
         self._atualizar_botao_continuar()
         try:
-            self.get_menu_principal().mainloop(self.get_tela()) # Usa getters
+            self.get_menu_principal().mainloop(self.get_tela(), bgfun=self._acompanhar_carregamento) # Usa getters
         except Exception as e:
             import traceback
             print(f"Ocorreu um erro fatal no loop principal: {e}"); traceback.print_exc()
         finally:
+            self.__pre_carregador.cancelar()
+            self.get_gerenciador_som().imprimir_memoria_sons()
+            if self.__perfil_inicializacao and not self.__pre_carregador.is_concluido(): self.__perfil_inicializacao.imprimir()
             pygame.quit()
             print("Jogo encerrado.")
 
 if __name__ == '__main__':
-    app = App()
+    parser = argparse.ArgumentParser(description=TITULO_JOGO)
+    parser.add_argument("--backend", choices=("objetos", "numpy"), default=BACKEND_ENTIDADES, help="backend de atualização de asteroides e projéteis")
+    parser.add_argument("--trace", metavar="ARQUIVO", default=ARQUIVO_TRACE_PERFIL, help="onde gravar o trace do perfilador de frames (.csv ou .json) ao sair de cada partida; vazio desativa")
+    parser.add_argument("--semente", type=int, default=None, help="semente do gerador aleatório das partidas")
+    parser.add_argument("--gravar-replay", metavar="ARQUIVO", default=None, help="grava a entrada de cada partida nova para reprodução com replay.py")
+    parser.add_argument("--retangulos-sujos", action="store_true", default=RENDERIZACAO_SUJA, help="atualiza só as áreas alteradas da tela (fundo estático)")
+    parser.add_argument("--ranking", choices=("sqlite", "diario"), default=BACKEND_RANKING, help="onde as pontuações são guardadas")
+    parser.add_argument("--simulacao-paralela", action="store_true", default=SIMULACAO_EM_PARALELO, help="simula o próximo frame numa thread enquanto o atual é desenhado")
+    parser.add_argument("--taxa-fisica", type=int, default=TAXA_FISICA, metavar="HZ", help="passos de física por segundo (0: passo variável, um por frame)")
+    parser.add_argument("--fps-maximo", type=int, default=LIMITE_FPS_RENDERIZACAO, metavar="FPS", help="limite de quadros desenhados por segundo (0: sem limite)")
+    parser.add_argument("--startup-profile", action="store_true", help="mostra o tempo até o primeiro frame e até todos os recursos carregados")
+    args = parser.parse_args()
+    app = App(backend=args.backend, arquivo_trace=args.trace, semente=args.semente, arquivo_replay=args.gravar_replay, renderizacao_suja=args.retangulos_sujos, backend_ranking=args.ranking, perfil_inicializacao=args.startup_profile, simulacao_paralela=args.simulacao_paralela, taxa_fisica=args.taxa_fisica, limite_fps=args.fps_maximo)
     app.run()
\ No newline at end of file
@@ -0,0 +1,73 @@
+import pygame
+from config import CANAIS_POR_CATEGORIA_SOM
+
+
+class MixerEventos:
+    """
+    Fila de eventos de som, despachada uma vez por frame. Pedidos repetidos do
+    mesmo som dentro de um frame viram um só: três tiros que acertam três
+    asteroides tocam uma explosão, não três. Cada categoria tem seus próprios
+    canais reservados do mixer. Com todos ocupados, o evento toma o canal do
+    som de menor prioridade (o mais antigo, no empate), desde que esse som não
+    seja mais prioritário que ele; caso contrário o evento é descartado.
+    """
+    def __init__(self, canais_por_categoria: dict[str, int] = CANAIS_POR_CATEGORIA_SOM):
+        total = sum(canais_por_categoria.values())
+        # Sobram canais livres para quem toca sons fora da fila (ex.: pygame_menu)
+        if pygame.mixer.get_num_channels() < total + 4: pygame.mixer.set_num_channels(total + 4)
+        pygame.mixer.set_reserved(total)
+        # Por canal: [Channel, nome do som, prioridade, despacho em que começou]
+        self.__canais: dict[str, list[list]] = {}
+        indice = 0
+        for categoria, quantidade in canais_por_categoria.items():
+            self.__canais[categoria] = [[pygame.mixer.Channel(indice + i), None, 0, 0] for i in range(quantidade)]
+            indice += quantidade
+        self.__fila: dict[str, tuple[pygame.mixer.Sound, str, int, int]] = {}
+        self.__despachos = 0
+        self.__pedidos = 0
+        self.__tocados = 0
+        self.__coalescidos = 0
+        self.__descartados = 0
+        self.__roubados = 0
+
+    def enfileirar(self, nome: str, som: pygame.mixer.Sound, categoria: str, prioridade: int, loops: int = 0) -> None:
+        self.__pedidos += 1
+        if nome in self.__fila:
+            self.__coalescidos += 1
+            return
+        self.__fila[nome] = (som, categoria, prioridade, loops)
+
+    def despachar(self) -> None:
+        """Toca os eventos do frame, dos mais prioritários para os menos."""
+        if not self.__fila: return
+        self.__despachos += 1
+        eventos = sorted(self.__fila.items(), key=lambda item: -item[1][2])
+        self.__fila.clear()
+        for nome, (som, categoria, prioridade, loops) in eventos:
+            canais = self.__canais.get(categoria)
+            if not canais:
+                self.__descartados += 1
+                continue
+            escolhido = next((canal for canal in canais if not canal[0].get_busy()), None)
+            if escolhido is None:
+                vitima = min(canais, key=lambda canal: (canal[2], canal[3]))
+                if vitima[2] > prioridade:
+                    self.__descartados += 1
+                    continue
+                escolhido = vitima
+                self.__roubados += 1
+            escolhido[0].play(som, loops=loops)
+            escolhido[1:] = [nome, prioridade, self.__despachos]
+            self.__tocados += 1
+
+    def parar(self, nome: str) -> None:
+        self.__fila.pop(nome, None)
+        for canais in self.__canais.values():
+            for canal in canais:
+                if canal[1] == nome:
+                    canal[0].stop()
+                    canal[1] = None
+
+    def get_estatisticas(self) -> dict:
+        return {"pedidos": self.__pedidos, "tocados": self.__tocados, "coalescidos": self.__coalescidos,
+                "descartados": self.__descartados, "roubados": self.__roubados}
@@ -0,0 +1,132 @@
+import csv
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Optional
+import pygame
+from config import BRANCO, VERDE, VERMELHO, CINZA_CLARO
+
+
+class PerfiladorFrames:
+    """
+    Instrumentação do loop principal. Cada frame registra quanto tempo cada
+    fase levou (`marcar` fecha a fase corrente), quantas entidades havia em
+    cada lista e a variação de blocos de memória alocados pelo interpretador.
+    Os últimos `capacidade` frames ficam num buffer circular, usado pelo
+    overlay na tela e exportado em CSV/JSON para análise offline.
+    """
+    FASES = ("entrada", "atualizacao", "colisoes", "nivel", "desenho", "flip")
+
+    def __init__(self, capacidade: int = 600):
+        self.__frames: deque[dict] = deque(maxlen=capacidade)
+        self.__frame_atual: Optional[dict] = None
+        self.__inicio_frame = 0.0
+        self.__ultima_marca = 0.0
+        self.__blocos_inicio = 0
+        self.__num_frame = 0
+        self.__thread_frame = 0
+        self.__overlay_visivel = False
+        self.__fonte: Optional[pygame.font.Font] = None
+
+    def is_overlay_visivel(self) -> bool: return self.__overlay_visivel
+    def alternar_overlay(self) -> None: self.__overlay_visivel = not self.__overlay_visivel
+    def get_frames(self) -> list[dict]: return list(self.__frames)
+
+    def iniciar_frame(self, intervalo_ms: float) -> None:
+        agora = time.perf_counter()
+        self.__frame_atual = {"frame": self.__num_frame, "intervalo_ms": intervalo_ms}
+        self.__inicio_frame = self.__ultima_marca = agora
+        self.__blocos_inicio = sys.getallocatedblocks()
+        self.__thread_frame = threading.get_ident()
+
+    def marcar(self, fase: str) -> None:
+        """Atribui à `fase` o tempo decorrido desde a marca anterior."""
+        # Marcas vindas da thread da simulação em pipeline são ignoradas: o frame é medido por quem o iniciou
+        if self.__frame_atual is None or threading.get_ident() != self.__thread_frame: return
+        agora = time.perf_counter()
+        self.__frame_atual[fase] = self.__frame_atual.get(fase, 0.0) + (agora - self.__ultima_marca) * 1000
+        self.__ultima_marca = agora
+
+    def finalizar_frame(self, contagens: dict[str, int]) -> None:
+        frame = self.__frame_atual
+        if frame is None: return
+        frame["frame_ms"] = (time.perf_counter() - self.__inicio_frame) * 1000
+        frame["blocos_alocados"] = sys.getallocatedblocks() - self.__blocos_inicio
+        frame.update(contagens)
+        self.__frames.append(frame)
+        self.__frame_atual = None
+        self.__num_frame += 1
+
+    def percentis(self, chave: str = "frame_ms") -> dict[str, float]:
+        valores = sorted(f.get(chave, 0.0) for f in self.__frames)
+        if not valores: return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+        ultimo = len(valores) - 1
+        return {nome: valores[min(ultimo, int(len(valores) * q))] for nome, q in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))}
+
+    # --- Overlay ---
+    def desenhar_overlay(self, tela: pygame.Surface, posicao: tuple[int, int] = (10, 45)) -> Optional[pygame.Rect]:
+        """Desenha o overlay (se visível) e devolve a área da tela coberta por ele."""
+        if not self.__overlay_visivel or not self.__frames: return None
+        if self.__fonte is None: self.__fonte = pygame.font.Font(None, 20)
+        x, y = posicao
+        largura, altura, teto_ms = 240, 60, 1000 / 30
+        fundo = pygame.Surface((largura, altura + 20 + 16 * (len(self.FASES) + 2)), pygame.SRCALPHA)
+        fundo.fill((0, 0, 0, 170))
+        area = tela.blit(fundo, (x - 4, y - 4))
+
+        # Gráfico do tempo de frame; a linha horizontal marca o orçamento de 60 FPS
+        frames = list(self.__frames)[-largura:]
+        base = y + altura
+        for i, frame in enumerate(frames):
+            ms = frame.get("frame_ms", 0.0)
+            h = min(altura, int(ms / teto_ms * altura))
+            cor = VERDE if ms <= 1000 / 60 else VERMELHO
+            pygame.draw.line(tela, cor, (x + i, base), (x + i, base - h))
+        limite_60 = base - int((1000 / 60) / teto_ms * altura)
+        area.union_ip(pygame.draw.line(tela, CINZA_CLARO, (x, limite_60), (x + largura, limite_60)))
+
+        p = self.percentis()
+        ultimo = frames[-1]
+        linhas = [f"frame p50 {p['p50']:.2f}  p95 {p['p95']:.2f}  p99 {p['p99']:.2f} ms"]
+        linhas += [f"{fase:<12} {ultimo.get(fase, 0.0):6.2f} ms" for fase in self.FASES]
+        linhas.append(f"blocos alocados {ultimo.get('blocos_alocados', 0):+d}")
+        for i, texto in enumerate(linhas):
+            area.union_ip(tela.blit(self.__fonte.render(texto, True, BRANCO), (x, base + 6 + i * 16)))
+        return area
+
+    # --- Exportação ---
+    def exportar(self, caminho: str) -> None:
+        """Grava os frames do buffer em CSV ou JSON, conforme a extensão do arquivo."""
+        frames = self.get_frames()
+        pasta = os.path.dirname(caminho)
+        if pasta: os.makedirs(pasta, exist_ok=True)
+        if caminho.lower().endswith(".json"):
+            with open(caminho, "w") as f:
+                json.dump({"resumo": self.percentis(), "frames": frames}, f, indent=2)
+            return
+        colunas: list[str] = []
+        for frame in frames:
+            colunas.extend(c for c in frame if c not in colunas)
+        with open(caminho, "w", newline="") as f:
+            escritor = csv.DictWriter(f, fieldnames=colunas, restval=0)
+            escritor.writeheader()
+            escritor.writerows(frames)
+
+
+class PerfilInicializacao:
+    """Marcos da inicialização do jogo (`--startup-profile`), em ms desde o início do processo."""
+    def __init__(self, inicio: float):
+        self.__inicio = inicio
+        self.__marcos: list[tuple[str, float]] = []
+
+    def get_marcos(self) -> list[tuple[str, float]]: return list(self.__marcos)
+
+    def marcar(self, nome: str) -> None:
+        self.__marcos.append((nome, (time.perf_counter() - self.__inicio) * 1000))
+
+    def imprimir(self) -> None:
+        print("Perfil de inicialização:")
+        for nome, ms in self.__marcos: print(f"  {nome:<28} {ms:8.1f} ms")
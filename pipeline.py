@@ -0,0 +1,84 @@
+import threading
+from typing import Callable, Optional
+import pygame
+from entidades import desenhar_fogo_motor, desenhar_circulo_carga
+
+
+class QuadroRenderizacao:
+    """
+    Retrato do que precisa ser desenhado num frame: imagem e posição de cada
+    sprite, a chama da nave, o círculo de carga dos fantasmas, o deslocamento
+    das estrelas e os números do HUD. As Surfaces vêm dos atlas (somente
+    leitura) e as posições são copiadas, então a simulação pode continuar
+    mexendo nas entidades enquanto o retrato é desenhado. O jogo mantém dois
+    retratos e os reaproveita alternadamente (buffer duplo).
+    """
+    def __init__(self):
+        self.nave: Optional[tuple] = None  # (imagem, posição, vértices do fogo ou None)
+        self.sprites: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        self.fantasmas: list[tuple] = []  # (imagem, posição, (centro, raio) do círculo ou None)
+        self.lasers: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        self.deslocamentos_estrelas: list[float] = []
+        self.chave_hud: tuple[int, int] = (0, 0)
+        self.game_over = False
+        self.contagens: dict[str, int] = {}
+
+    def desenhar(self, tela: pygame.Surface, coletar_areas: bool = False) -> list[Optional[pygame.Rect]]:
+        """Desenha as entidades do retrato, na mesma ordem de camadas de `GerenciadorJogo._desenhar_entidades`."""
+        areas = []
+        if self.nave:
+            imagem, posicao, fogo = self.nave
+            areas.append(tela.blit(imagem, posicao))
+            if fogo: areas.append(desenhar_fogo_motor(tela, fogo))
+        areas += tela.blits(self.sprites, coletar_areas) or ()
+        for imagem, posicao, circulo in self.fantasmas:
+            areas.append(tela.blit(imagem, posicao))
+            if circulo: areas.append(desenhar_circulo_carga(tela, *circulo))
+        areas += tela.blits(self.lasers, coletar_areas) or ()
+        return areas
+
+
+class SimulacaoParalela:
+    """
+    Roda `passo(*args)` numa thread própria, um passo por vez. `iniciar`
+    entrega os argumentos e acorda a thread; `aguardar` bloqueia até o passo
+    terminar, repassando a exceção se houve uma. Entre um `aguardar` e o
+    `iniciar` seguinte a thread está parada, então o loop principal pode
+    mexer no estado do jogo (pausa, autosave, sons) sem nenhuma trava.
+    """
+    def __init__(self, passo: Callable[..., None]):
+        self.__passo = passo
+        self.__args: tuple = ()
+        self.__erro: Optional[BaseException] = None
+        self.__encerrada = False
+        self.__pedido = threading.Event()
+        self.__pronto = threading.Event()
+        self.__pronto.set()
+        self.__thread = threading.Thread(target=self._executar, name="simulacao", daemon=True)
+        self.__thread.start()
+
+    def iniciar(self, *args) -> None:
+        self.__pronto.clear()
+        self.__args = args
+        self.__pedido.set()
+
+    def aguardar(self) -> None:
+        self.__pronto.wait()
+        if self.__erro is not None:
+            erro, self.__erro = self.__erro, None
+            raise erro
+
+    def _executar(self) -> None:
+        while True:
+            self.__pedido.wait()
+            self.__pedido.clear()
+            if self.__encerrada: return
+            try: self.__passo(*self.__args)
+            except BaseException as e: self.__erro = e
+            self.__pronto.set()
+
+    def encerrar(self) -> None:
+        self.__pronto.wait()
+        self.__encerrada = True
+        self.__pedido.set()
+        self.__thread.join(1.0)
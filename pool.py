@@ -0,0 +1,61 @@
+from typing import Generic, TypeVar
+from config import TAMANHO_MAXIMO_POOL
+
+T = TypeVar("T")
+
+
+class PoolObjetos(Generic[T]):
+    """
+    Reaproveita entidades de vida curta (tiros e lasers). `obter` entrega uma
+    instância livre, reiniciada no lugar com `reiniciar(*args)`, ou cria uma
+    nova quando não há nenhuma; `recolher_inativos` tira das listas do jogo as
+    que saíram de cena e as guarda para o próximo `obter`. Assim uma troca de
+    tiros intensa não gera uma enxurrada de objetos para o coletor de lixo.
+    """
+    def __init__(self, classe: type, capacidade: int = TAMANHO_MAXIMO_POOL):
+        self.__classe = classe
+        self.__capacidade = capacidade
+        self.__livres: list[T] = []
+        self.__em_uso = 0
+        self.__pico_em_uso = 0
+        self.__criados = 0
+        self.__reaproveitados = 0
+
+    def obter(self, *args) -> T:
+        if self.__livres:
+            obj = self.__livres.pop()
+            obj.reiniciar(*args)
+            self.__reaproveitados += 1
+        else:
+            obj = self.__classe(*args)
+            self.__criados += 1
+        self.__em_uso += 1
+        if self.__em_uso > self.__pico_em_uso: self.__pico_em_uso = self.__em_uso
+        return obj
+
+    def devolver(self, obj: T) -> None:
+        # Objetos criados fora do pool (ex.: carregados do save) também são aceitos
+        self.__em_uso = max(0, self.__em_uso - 1)
+        if len(self.__livres) < self.__capacidade: self.__livres.append(obj)
+
+    def recolher_inativos(self, lista: list[T]) -> None:
+        """Remove da lista (no lugar) as entidades inativas, devolvendo-as ao pool."""
+        ativos = []
+        for obj in lista:
+            if obj.is_ativo(): ativos.append(obj)
+            else: self.devolver(obj)
+        lista[:] = ativos
+
+    def recolher_todos(self, lista: list[T]) -> None:
+        for obj in lista: self.devolver(obj)
+        lista.clear()
+
+    def zerar_estatisticas(self) -> None:
+        """Recomeça a contagem (ex.: a cada cena medida); o pico parte do que está em uso agora."""
+        self.__pico_em_uso = self.__em_uso
+        self.__criados = 0
+        self.__reaproveitados = 0
+
+    def get_estatisticas(self) -> dict:
+        return {"livres": len(self.__livres), "em_uso": self.__em_uso, "pico_em_uso": self.__pico_em_uso,
+                "criados": self.__criados, "reaproveitados": self.__reaproveitados}
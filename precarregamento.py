@@ -0,0 +1,45 @@
+import threading
+import time
+from typing import Callable, Optional
+
+
+class PreCarregador:
+    """
+    Executa tarefas de carregamento (sons, sprites, quadros de rotação) numa
+    thread de fundo enquanto o menu já está na tela. O progresso pode ser
+    lido a qualquer momento pelo loop do menu. Quem precisar de um recurso
+    antes de ele ficar pronto simplesmente o carrega na hora: os caches são
+    preenchidos sob demanda, e a tarefa correspondente vira um acerto.
+    """
+    def __init__(self, tarefas: list[tuple[str, Callable[[], object]]]):
+        self.__tarefas = tarefas
+        self.__concluidas = 0
+        self.__cancelado = False
+        self.__inicio = 0.0
+        self.__duracao_ms: Optional[float] = None
+        self.__thread = threading.Thread(target=self._executar, name="pre-carregamento", daemon=True)
+
+    def get_num_tarefas(self) -> int: return len(self.__tarefas)
+    def get_concluidas(self) -> int: return self.__concluidas
+    def get_duracao_ms(self) -> Optional[float]: return self.__duracao_ms
+    def is_concluido(self) -> bool: return self.__duracao_ms is not None
+
+    def get_progresso(self) -> float:
+        return self.__concluidas / len(self.__tarefas) if self.__tarefas else 1.0
+
+    def iniciar(self) -> None:
+        self.__inicio = time.perf_counter()
+        self.__thread.start()
+
+    def _executar(self) -> None:
+        for descricao, tarefa in self.__tarefas:
+            if self.__cancelado: return
+            try: tarefa()
+            except Exception as e: print(f"AVISO: falha ao pré-carregar {descricao}: {e}")
+            self.__concluidas += 1
+        self.__duracao_ms = (time.perf_counter() - self.__inicio) * 1000
+
+    def cancelar(self, timeout: float = 1.0) -> None:
+        """Interrompe entre duas tarefas (ex.: antes de `pygame.quit`) e espera a thread parar."""
+        self.__cancelado = True
+        if self.__thread.is_alive(): self.__thread.join(timeout)
@@ -0,0 +1,258 @@
+import atexit
+import bisect
+import json
+import math
+import os
+import time
+from contextlib import contextmanager
+from typing import Optional
+try:
+    import fcntl
+except ImportError:  # fcntl não existe no Windows: lá o ranking tem um só processo escrevendo
+    fcntl = None
+from config import (ARQUIVO_RANKING_SNAPSHOT, ARQUIVO_RANKING_DIARIO, ARQUIVO_HIGH_SCORES, LOTE_FSYNC_RANKING,
+                    INTERVALO_FSYNC_RANKING_SEGUNDOS, LIMITE_COMPACTACAO_RANKING)
+from jogador_ranking import JogadorRanking
+
+
+def _gravar_atomico(caminho: str, dados: bytes) -> None:
+    temporario = caminho + ".tmp"
+    with open(temporario, "wb") as f:
+        f.write(dados); f.flush(); os.fsync(f.fileno())
+    os.replace(temporario, caminho)
+
+
+class RepositorioRankingDiario:
+    """
+    Ranking em dois arquivos: um snapshot JSON com todas as pontuações, só
+    trocado por inteiro (arquivo temporário + rename atômico), e um diário
+    onde cada score novo é uma linha acrescentada no fim. Gravar um score
+    custa um append; o fsync é feito em lotes (a cada `lote_fsync` scores ou
+    `intervalo_fsync` segundos, e ao fechar). O prazo também é conferido fora
+    das gravações: o loop do menu chama `sincronizar_se_vencido` a cada
+    frame. Quando o diário passa de `limite_compactacao` linhas, ele é
+    dobrado num snapshot novo.
+
+    O snapshot e o diário levam um número de geração: um diário de geração
+    antiga já está contido no snapshot (o jogo caiu entre as duas trocas) e
+    é descartado; uma última linha cortada pela metade também é. Um snapshot
+    ilegível não zera o ranking em silêncio: ele é guardado como
+    `.corrompido` e o problema é avisado.
+
+    Vários processos podem gravar no mesmo ranking: appends e compactação
+    acontecem sob uma trava exclusiva (flock num arquivo `.lock` ao lado do
+    diário). A compactação relê snapshot e diário do disco antes de gravar,
+    então inclui os scores dos outros processos; e quem ainda escreve num
+    diário que foi trocado por outro processo relê tudo e passa ao diário novo
+    antes do próximo append. Sem fcntl (Windows) não há trava: só um processo
+    deve escrever no ranking.
+    """
+    def __init__(self, caminho_snapshot: str = ARQUIVO_RANKING_SNAPSHOT, caminho_diario: str = ARQUIVO_RANKING_DIARIO,
+                 caminho_json: Optional[str] = ARQUIVO_HIGH_SCORES, lote_fsync: int = LOTE_FSYNC_RANKING,
+                 intervalo_fsync: float = INTERVALO_FSYNC_RANKING_SEGUNDOS, limite_compactacao: int = LIMITE_COMPACTACAO_RANKING):
+        self.__caminho_snapshot = caminho_snapshot
+        self.__caminho_diario = caminho_diario
+        self.__lote_fsync = lote_fsync
+        self.__intervalo_fsync = intervalo_fsync
+        self.__limite_compactacao = limite_compactacao
+        # (-pontuacao, ordem de chegada, nome): a lista fica sempre na ordem do ranking
+        self.__ordenados: list[tuple[int, int, str]] = []
+        self.__melhores: dict[str, int] = {}
+        self.__proxima_ordem = 0
+        self.__geracao = 0
+        self.__linhas_diario = 0
+        self.__pendentes_fsync = 0
+        self.__ultimo_fsync = time.monotonic()
+        self.__arquivo = None
+        self.__arquivo_trava = open(caminho_diario + ".lock", "a")
+        self.__profundidade_trava = 0
+        with self._trava(): self._recuperar(caminho_json)
+        atexit.register(self.fechar)
+
+    def get_caminhos(self) -> tuple[str, str]: return self.__caminho_snapshot, self.__caminho_diario
+    def get_linhas_diario(self) -> int: return self.__linhas_diario
+
+    def recarregar(self) -> None:
+        """Refaz o estado em memória a partir dos arquivos (outro processo gravou neles)."""
+        with self._trava(): self._reler()
+
+    def _reler(self) -> None:
+        self._fechar_diario()
+        self.__ordenados, self.__melhores, self.__proxima_ordem = [], {}, 0
+        self.__geracao = self.__linhas_diario = self.__pendentes_fsync = 0
+        self._recuperar(None)
+
+    @contextmanager
+    def _trava(self):
+        """Trava exclusiva entre processos; reentrante dentro do mesmo objeto."""
+        self.__profundidade_trava += 1
+        if self.__profundidade_trava == 1 and fcntl: fcntl.flock(self.__arquivo_trava.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            self.__profundidade_trava -= 1
+            if self.__profundidade_trava == 0 and fcntl: fcntl.flock(self.__arquivo_trava.fileno(), fcntl.LOCK_UN)
+
+    def _acompanhar_diario(self) -> None:
+        """Se outro processo compactou (trocou o diário de lugar), relê tudo e passa a escrever no diário novo."""
+        try:
+            trocado = self.__arquivo is None or os.stat(self.__caminho_diario).st_ino != os.fstat(self.__arquivo.fileno()).st_ino
+        except FileNotFoundError:
+            trocado = True
+        if trocado: self._reler()
+
+    # --- Recuperação ---
+    def _recuperar(self, caminho_json: Optional[str]) -> None:
+        tem_snapshot = os.path.exists(self.__caminho_snapshot)
+        if tem_snapshot: self._carregar_snapshot()
+        elif not os.path.exists(self.__caminho_diario) and caminho_json and os.path.exists(caminho_json):
+            self._importar_json(caminho_json)
+            self._compactar()
+            return
+        self._reaplicar_diario()
+        self.__geracao = max(self.__geracao, 0)
+        if self.__arquivo is None: self._iniciar_diario()
+
+    def _carregar_snapshot(self) -> None:
+        try:
+            with open(self.__caminho_snapshot, "r") as f:
+                dados = json.load(f)
+            self.__geracao = int(dados["geracao"])
+            for nome, pontuacao in dados["scores"]: self._registrar(str(nome), int(pontuacao))
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            corrompido = self.__caminho_snapshot + ".corrompido"
+            os.replace(self.__caminho_snapshot, corrompido)
+            print(f"Snapshot do ranking ilegível ({e}); guardado em {corrompido}.")
+            self.__ordenados, self.__melhores, self.__proxima_ordem = [], {}, 0
+            self.__geracao = -1  # sem snapshot válido, o diário existente é aproveitado seja qual for a geração
+
+    def _importar_json(self, caminho_json: str) -> None:
+        try:
+            with open(caminho_json, "r") as f:
+                registros = [JogadorRanking.from_dict(d) for d in json.load(f)]
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            print(f"Ranking antigo ilegível, não importado: {e}")
+            return
+        for jogador in registros: self._registrar(jogador.get_nome(), int(jogador.get_pontuacao()))
+        if registros: print(f"{len(registros)} recordes importados de {caminho_json}.")
+
+    def _reaplicar_diario(self) -> None:
+        if not os.path.exists(self.__caminho_diario): return
+        with open(self.__caminho_diario, "rb") as f:
+            linhas = f.read().split(b"\n")
+        # Sem "\n" no fim, a última linha foi cortada no meio da gravação
+        validas, descartadas = [], len(linhas[-1]) > 0
+        try:
+            geracao = int(json.loads(linhas[0])["geracao"])
+            if self.__geracao == -1: self.__geracao = geracao
+            if geracao != self.__geracao: return  # já incorporado ao snapshot
+            for linha in linhas[1:-1]:
+                registro = json.loads(linha)
+                validas.append((str(registro["nome"]), int(registro["pontuacao"])))
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            descartadas = True
+        if not validas and len(linhas) < 2: return
+        for nome, pontuacao in validas: self._registrar(nome, pontuacao)
+        self.__linhas_diario = len(validas)
+        if descartadas:
+            print(f"Diário do ranking com final incompleto; {len(validas)} registros recuperados.")
+            # Reescreve só a parte válida, para os próximos appends não seguirem o lixo
+            self._iniciar_diario(validas)
+        else:
+            self.__arquivo = open(self.__caminho_diario, "ab")
+
+    def _iniciar_diario(self, registros: Optional[list[tuple[str, int]]] = None) -> None:
+        if self.__arquivo is not None: self.__arquivo.close()
+        linhas = [json.dumps({"geracao": self.__geracao})]
+        linhas += [json.dumps({"nome": nome, "pontuacao": pontuacao}) for nome, pontuacao in registros or ()]
+        _gravar_atomico(self.__caminho_diario, ("\n".join(linhas) + "\n").encode())
+        self.__linhas_diario = len(registros or ())
+        self.__arquivo = open(self.__caminho_diario, "ab")
+
+    # --- Escrita ---
+    def _registrar(self, nome: str, pontuacao: int) -> None:
+        bisect.insort(self.__ordenados, (-pontuacao, self.__proxima_ordem, nome))
+        self.__proxima_ordem += 1
+        if pontuacao > self.__melhores.get(nome, -math.inf): self.__melhores[nome] = pontuacao
+
+    def adicionar(self, jogador: JogadorRanking) -> None:
+        nome, pontuacao = jogador.get_nome(), int(jogador.get_pontuacao())
+        with self._trava():
+            self._acompanhar_diario()
+            self.__arquivo.write((json.dumps({"nome": nome, "pontuacao": pontuacao}) + "\n").encode())
+            self.__arquivo.flush()
+        self.__pendentes_fsync += 1
+        if self.__pendentes_fsync >= self.__lote_fsync or time.monotonic() - self.__ultimo_fsync >= self.__intervalo_fsync:
+            self.sincronizar()
+        self._registrar(nome, pontuacao)
+        self.__linhas_diario += 1
+        if self.__linhas_diario >= self.__limite_compactacao: self.compactar()
+
+    def sincronizar(self) -> None:
+        if self.__arquivo is None or self.__pendentes_fsync == 0: return
+        self.__arquivo.flush()
+        os.fsync(self.__arquivo.fileno())
+        self.__pendentes_fsync = 0
+        self.__ultimo_fsync = time.monotonic()
+
+    def sincronizar_se_vencido(self) -> None:
+        """fsync dos scores pendentes se o último ficou para trás há `intervalo_fsync` segundos."""
+        if self.__pendentes_fsync and time.monotonic() - self.__ultimo_fsync >= self.__intervalo_fsync: self.sincronizar()
+
+    def compactar(self) -> None:
+        """Dobra o diário num snapshot novo e começa um diário vazio da geração seguinte."""
+        with self._trava():
+            # Relê do disco: o diário pode ter linhas de outros processos que não estão na memória
+            self._reler()
+            self._compactar()
+
+    def _compactar(self) -> None:
+        self.__geracao += 1
+        scores = [[nome, -negativo] for negativo, _, nome in self.__ordenados]
+        _gravar_atomico(self.__caminho_snapshot, json.dumps({"geracao": self.__geracao, "scores": scores}).encode())
+        self.__pendentes_fsync = 0
+        self._iniciar_diario()
+
+    def _fechar_diario(self) -> None:
+        if self.__arquivo is None: return
+        self.sincronizar()
+        self.__arquivo.close()
+        self.__arquivo = None
+
+    def fechar(self) -> None:
+        """Grava o que falta, fecha o diário e o arquivo da trava; o repositório não pode mais ser usado."""
+        self._fechar_diario()
+        if not self.__arquivo_trava.closed: self.__arquivo_trava.close()
+        atexit.unregister(self.fechar)
+
+    # --- Consultas ---
+    def top(self, quantidade: int, deslocamento: int = 0) -> list[JogadorRanking]:
+        return [JogadorRanking(nome, -negativo) for negativo, _, nome in self.__ordenados[deslocamento:deslocamento + quantidade]]
+
+    def posicao(self, pontuacao: int) -> int:
+        """Posição (1 = primeiro) que uma nova `pontuacao` ocupa no ranking."""
+        return bisect.bisect_left(self.__ordenados, (-pontuacao, math.inf)) + 1
+
+    def melhor_do_jogador(self, nome: str) -> Optional[int]:
+        return self.__melhores.get(nome)
+
+    def total(self) -> int:
+        return len(self.__ordenados)
+
+
+if __name__ == '__main__':
+    import random
+    import tempfile
+    with tempfile.TemporaryDirectory() as pasta:
+        caminhos = os.path.join(pasta, "ranking.snapshot.json"), os.path.join(pasta, "ranking.diario")
+        repositorio = RepositorioRankingDiario(*caminhos, caminho_json=None)
+        inicio = time.perf_counter()
+        for i in range(20000): repositorio.adicionar(JogadorRanking(f"J{i % 500}", random.randint(0, 200000)))
+        print(f"20000 inserções em {time.perf_counter() - inicio:.2f} s")
+        top = [(j.get_nome(), j.get_pontuacao()) for j in repositorio.top(10)]
+        repositorio.fechar()
+        # Simula uma queda no meio de um append: a linha cortada é descartada na volta
+        with open(caminhos[1], "ab") as f: f.write(b'{"nome": "CORTADO", "pont')
+        recuperado = RepositorioRankingDiario(*caminhos, caminho_json=None)
+        print(f"Recuperados {recuperado.total()} scores; Top 10 igual: {[(j.get_nome(), j.get_pontuacao()) for j in recuperado.top(10)] == top}")
+        recuperado.fechar()
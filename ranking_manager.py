@@ -1,40 +1,85 @@
-import json
 import os
 from jogador_ranking import JogadorRanking
-from typing import List
-from config import ARQUIVO_HIGH_SCORES
+from typing import List, Optional
+from config import TAMANHO_TOP_RANKING, TAMANHO_PAGINA_RANKING, BACKEND_RANKING
+from ranking_diario import RepositorioRankingDiario
+
+def criar_repositorio_ranking(backend: str = BACKEND_RANKING):
+    """Abre o repositório de pontuações do backend pedido ("sqlite" ou "diario")."""
+    if backend == "sqlite":
+        try:
+            from ranking_sqlite import RepositorioRankingSQLite
+            return RepositorioRankingSQLite()
+        except ImportError:  # sqlite3 é opcional em algumas builds do Python
+            print("Módulo sqlite3 indisponível; usando o diário de pontuações.")
+    return RepositorioRankingDiario()
 
 class RankingManager:
-    def __init__(self):
-        self.__jogadores: List[JogadorRanking] = []
+    def __init__(self, repositorio=None):
+        # O repositório guarda todas as pontuações; aqui fica só a lista exibida (Top 10)
+        self.__repositorio = repositorio if repositorio is not None else criar_repositorio_ranking()
+        self.__jogadores: List[JogadorRanking] = self.__repositorio.top(TAMANHO_TOP_RANKING)
+        # Sobe a cada mudança no Top 10; quem exibe o ranking compara com a versão que desenhou
+        self.__versao = 0
+        self.__marca_arquivos = self._marca_arquivos()
+
+    def get_repositorio(self): return self.__repositorio
+    def get_versao(self) -> int: return self.__versao
+
+    def _marca_arquivos(self) -> tuple:
+        """(mtime, tamanho) de cada arquivo do repositório; muda quando alguém grava neles."""
+        marca = []
+        for caminho in self.__repositorio.get_caminhos():
+            try:
+                info = os.stat(caminho)
+                marca.append((info.st_mtime_ns, info.st_size))
+            except OSError: marca.append(None)
+        return tuple(marca)
 
     def get_jogadores(self) -> List[JogadorRanking]:
         return self.__jogadores.copy()
 
     def set_jogadores(self, nova_lista: List[JogadorRanking]) -> None:
         self.__jogadores = nova_lista
+        self.__versao += 1
 
     def carregar_scores(self):
-        """Carrega os scores do arquivo JSON padrão."""
-        try:
-            with open(ARQUIVO_HIGH_SCORES, "r") as f:
-                dados = json.load(f)
-            # Usa o novo setter para definir a lista
-            self.set_jogadores([JogadorRanking.from_dict(d) for d in dados])
-        except (FileNotFoundError, json.JSONDecodeError):
-            self.set_jogadores([]) # Usa o setter para esvaziar a lista
+        """Recarrega o Top 10, mas só se os arquivos do repositório mudaram desde a última leitura."""
+        marca = self._marca_arquivos()
+        if marca == self.__marca_arquivos: return
+        self.__marca_arquivos = marca
+        self.__repositorio.recarregar()
+        jogadores = self.__repositorio.top(TAMANHO_TOP_RANKING)
+        if [j.to_dict() for j in jogadores] != [j.to_dict() for j in self.__jogadores]: self.set_jogadores(jogadores)
 
     def adicionar_score(self, novo_recorde: JogadorRanking):
-        """Adiciona um novo score à lista, ordena e mantém apenas o Top 10."""
-        # Pega a lista atual com o getter
-        jogadores_atuais = self.get_jogadores()
-        jogadores_atuais.append(novo_recorde)
-        jogadores_atuais.sort(key=lambda j: j.get_pontuacao(), reverse=True)
-        # Define a nova lista ordenada e cortada com o setter
-        self.set_jogadores(jogadores_atuais[:10])
-
-    def salvar_scores(self):
-        """Salva a lista de scores atual no arquivo JSON padrão."""
-        with open(ARQUIVO_HIGH_SCORES, "w") as f:
-            json.dump([j.to_dict() for j in self.get_jogadores()], f, indent=4)
+        """Registra o score no repositório (todos são guardados) e atualiza o Top 10 exibido no lugar."""
+        self.__repositorio.adicionar(novo_recorde)
+        # A gravação é nossa e a memória já está em dia: não precisa reler na próxima carga
+        self.__marca_arquivos = self._marca_arquivos()
+        pontuacao = novo_recorde.get_pontuacao()
+        # Empates ficam depois dos scores já existentes; fora do Top 10 nada muda
+        posicao = len(self.__jogadores)
+        while posicao > 0 and self.__jogadores[posicao - 1].get_pontuacao() < pontuacao: posicao -= 1
+        if posicao >= TAMANHO_TOP_RANKING: return
+        self.__jogadores.insert(posicao, novo_recorde)
+        del self.__jogadores[TAMANHO_TOP_RANKING:]
+        self.__versao += 1
+
+    def sincronizar_se_vencido(self):
+        """Chamada a cada frame do menu: grava em disco os scores que esperam o prazo do fsync."""
+        self.__repositorio.sincronizar_se_vencido()
+
+    # --- Consultas sobre o ranking completo ---
+    def get_pagina(self, pagina: int, tamanho: int = TAMANHO_PAGINA_RANKING) -> List[JogadorRanking]:
+        """Página `pagina` (a partir de 0) do ranking completo."""
+        return self.__repositorio.top(tamanho, max(0, pagina) * tamanho)
+
+    def get_posicao(self, pontuacao: int) -> int:
+        return self.__repositorio.posicao(pontuacao)
+
+    def get_melhor_do_jogador(self, nome: str) -> Optional[int]:
+        return self.__repositorio.melhor_do_jogador(nome)
 
+    def get_total_scores(self) -> int:
+        return self.__repositorio.total()
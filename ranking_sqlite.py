@@ -0,0 +1,104 @@
+import json
+import os
+import sqlite3
+import time
+from typing import Optional
+from config import ARQUIVO_RANKING_DB, ARQUIVO_HIGH_SCORES
+from jogador_ranking import JogadorRanking
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    nome TEXT NOT NULL,
+    pontuacao INTEGER NOT NULL,
+    registrado_em REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scores_pontuacao ON scores (pontuacao DESC, id);
+CREATE INDEX IF NOT EXISTS idx_scores_nome ON scores (nome, pontuacao DESC);
+CREATE TABLE IF NOT EXISTS meta (chave TEXT PRIMARY KEY, valor TEXT NOT NULL);
+"""
+
+
+class RepositorioRankingSQLite:
+    """
+    Guarda todas as pontuações já registradas num banco SQLite, não só o Top 10.
+    Os índices em (pontuacao, id) e (nome, pontuacao) deixam inserção, página do
+    ranking e melhor pontuação de um jogador em buscas de árvore B. A posição de
+    uma pontuação é um COUNT(*) sobre `idx_scores_pontuacao`: o SQLite percorre
+    só o trecho do índice acima dela (custo proporcional à posição, sem ler a
+    tabela nem manter cópia em memória). Empates ficam na ordem de chegada,
+    como na lista antiga.
+
+    Na primeira abertura, o `high_scores.json` antigo é importado uma única vez
+    (fica marcado na tabela `meta`); o arquivo JSON não é alterado.
+    """
+    def __init__(self, caminho: str = ARQUIVO_RANKING_DB, caminho_json: Optional[str] = ARQUIVO_HIGH_SCORES):
+        self.__caminho = caminho
+        self.__conexao = sqlite3.connect(caminho)
+        self.__conexao.execute("PRAGMA journal_mode=WAL")
+        self.__conexao.execute("PRAGMA synchronous=NORMAL")
+        self.__conexao.executescript(_ESQUEMA)
+        if caminho_json: self._importar_json(caminho_json)
+
+    def get_caminhos(self) -> tuple[str, str]: return self.__caminho, self.__caminho + "-wal"
+
+    def sincronizar_se_vencido(self) -> None:
+        """Nada pendente: cada `adicionar` já é uma transação confirmada."""
+
+    def recarregar(self) -> None:
+        """Nada a reler: toda consulta vai ao banco e já vê o que outro processo gravou."""
+
+    def _importar_json(self, caminho_json: str) -> None:
+        if self.__conexao.execute("SELECT 1 FROM meta WHERE chave = 'json_importado'").fetchone(): return
+        registros = []
+        if os.path.exists(caminho_json):
+            try:
+                with open(caminho_json, "r") as f:
+                    registros = [JogadorRanking.from_dict(d) for d in json.load(f)]
+            except (json.JSONDecodeError, KeyError, TypeError) as e:
+                print(f"Ranking antigo ilegível, não importado: {e}")
+        agora = time.time()
+        with self.__conexao:
+            self.__conexao.executemany("INSERT INTO scores (nome, pontuacao, registrado_em) VALUES (?, ?, ?)",
+                                       [(j.get_nome(), int(j.get_pontuacao()), agora) for j in registros])
+            self.__conexao.execute("INSERT INTO meta (chave, valor) VALUES ('json_importado', ?)", (caminho_json,))
+        if registros: print(f"{len(registros)} recordes importados de {caminho_json}.")
+
+    def adicionar(self, jogador: JogadorRanking) -> None:
+        with self.__conexao:
+            self.__conexao.execute("INSERT INTO scores (nome, pontuacao, registrado_em) VALUES (?, ?, ?)",
+                                   (jogador.get_nome(), int(jogador.get_pontuacao()), time.time()))
+
+    def top(self, quantidade: int, deslocamento: int = 0) -> list[JogadorRanking]:
+        linhas = self.__conexao.execute("SELECT nome, pontuacao FROM scores ORDER BY pontuacao DESC, id LIMIT ? OFFSET ?",
+                                        (quantidade, deslocamento))
+        return [JogadorRanking(nome, pontuacao) for nome, pontuacao in linhas]
+
+    def posicao(self, pontuacao: int) -> int:
+        """Posição (1 = primeiro) que uma nova `pontuacao` ocupa no ranking."""
+        return self.__conexao.execute("SELECT COUNT(*) FROM scores WHERE pontuacao >= ?", (int(pontuacao),)).fetchone()[0] + 1
+
+    def melhor_do_jogador(self, nome: str) -> Optional[int]:
+        return self.__conexao.execute("SELECT MAX(pontuacao) FROM scores WHERE nome = ?", (nome,)).fetchone()[0]
+
+    def total(self) -> int:
+        return self.__conexao.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def fechar(self) -> None:
+        self.__conexao.close()
+
+
+if __name__ == '__main__':
+    import random
+    import tempfile
+    with tempfile.TemporaryDirectory() as pasta:
+        repositorio = RepositorioRankingSQLite(os.path.join(pasta, "ranking.db"), caminho_json=None)
+        inicio = time.perf_counter()
+        for i in range(20000): repositorio.adicionar(JogadorRanking(f"J{i % 500}", random.randint(0, 200000)))
+        print(f"20000 inserções em {time.perf_counter() - inicio:.2f} s")
+        inicio = time.perf_counter()
+        for _ in range(1000): repositorio.posicao(random.randint(0, 200000))
+        print(f"1000 consultas de posição em {(time.perf_counter() - inicio) * 1000:.1f} ms")
+        print("Top 3:", [(j.get_nome(), j.get_pontuacao()) for j in repositorio.top(3)])
+        print("Melhor de J7:", repositorio.melhor_do_jogador("J7"))
+        repositorio.fechar()
@@ -0,0 +1,72 @@
+from typing import Callable, Optional
+import pygame
+
+
+class GerenciadorRecursos:
+    """
+    Registro global de imagens do jogo. Cada arquivo é lido do disco e
+    convertido uma única vez; as entidades recebem a mesma Surface
+    compartilhada, que deve ser tratada como somente leitura.
+    """
+    def __init__(self):
+        self.__imagens: dict[str, pygame.Surface] = {}
+        self.__fallbacks: dict[tuple[str, Callable], pygame.Surface] = {}
+        self.__mascaras: dict[pygame.Surface, pygame.mask.Mask] = {}
+        self.__caminhos_invalidos: set[str] = set()
+        self.__acertos = 0
+        self.__faltas = 0
+
+    def get_imagem(self, caminho: str, fallback: Optional[Callable[[], pygame.Surface]] = None) -> Optional[pygame.Surface]:
+        """
+        Retorna a imagem do caminho informado, carregando-a só na primeira vez.
+        Se o arquivo não puder ser lido, usa (e também guarda) a Surface criada
+        por `fallback`, ou retorna None quando não houver fallback.
+        """
+        imagem = self.__imagens.get(caminho)
+        if imagem is not None:
+            self.__acertos += 1
+            return imagem
+
+        if caminho not in self.__caminhos_invalidos:
+            self.__faltas += 1
+            try:
+                imagem = pygame.image.load(caminho)
+                # Sem modo de vídeo (simulação headless) a conversão não é possível nem necessária
+                if pygame.display.get_init() and pygame.display.get_surface() is not None:
+                    imagem = imagem.convert_alpha()
+                self.__imagens[caminho] = imagem
+                return imagem
+            except (pygame.error, FileNotFoundError):
+                self.__caminhos_invalidos.add(caminho)
+
+        if fallback is None: return None
+        chave = (caminho, fallback)
+        imagem = self.__fallbacks.get(chave)
+        if imagem is None:
+            imagem = fallback()
+            self.__fallbacks[chave] = imagem
+        return imagem
+
+    def get_mascara(self, imagem: pygame.Surface) -> pygame.mask.Mask:
+        """Máscara de colisão de uma Surface do cache, calculada uma única vez por Surface."""
+        mascara = self.__mascaras.get(imagem)
+        if mascara is None:
+            mascara = pygame.mask.from_surface(imagem)
+            self.__mascaras[imagem] = mascara
+        return mascara
+
+    def get_estatisticas(self) -> dict:
+        return {"acertos": self.__acertos, "faltas": self.__faltas, "imagens": len(self.__imagens), "fallbacks": len(self.__fallbacks), "caminhos_invalidos": len(self.__caminhos_invalidos)}
+
+    def limpar(self) -> None:
+        """Descarta todas as Surfaces (ex.: após recriar o modo de vídeo)."""
+        self.__imagens.clear()
+        self.__fallbacks.clear()
+        self.__mascaras.clear()
+        self.__caminhos_invalidos.clear()
+        self.__acertos = 0
+        self.__faltas = 0
+
+
+# Instância única compartilhada por todo o processo
+recursos = GerenciadorRecursos()
@@ -0,0 +1,79 @@
+from typing import Optional
+import pygame
+
+
+class RelogioPygame:
+    """
+    Relógio real do jogo, baseado em `pygame.time.get_ticks`. Depois de
+    `iniciar_quadro`, o tempo fica congelado até o próximo quadro: toda a
+    lógica de um frame enxerga o mesmo instante, o que torna o frame
+    reprodutível a partir do valor gravado (ver `replay.py`).
+    """
+    def __init__(self):
+        self.__ticks_quadro: Optional[int] = None
+
+    def iniciar_quadro(self) -> None:
+        self.__ticks_quadro = pygame.time.get_ticks()
+
+    def get_ticks(self) -> int:
+        return self.__ticks_quadro if self.__ticks_quadro is not None else pygame.time.get_ticks()
+
+    def esperar(self, ms: int) -> None:
+        pygame.time.wait(ms)
+        # Avança exatamente `ms`, como o relógio virtual faria na reprodução
+        if self.__ticks_quadro is not None: self.__ticks_quadro += ms
+
+
+class RelogioVirtual:
+    """
+    Relógio controlado pela simulação: só anda quando `avancar` é chamado.
+    Permite rodar a lógica do jogo mais rápido que o tempo real e de forma
+    reprodutível.
+    """
+    def __init__(self, inicio_ms: float = 0.0):
+        self.__tempo_ms = float(inicio_ms)
+
+    def iniciar_quadro(self) -> None:
+        pass
+
+    def get_ticks(self) -> int:
+        return int(self.__tempo_ms)
+
+    def get_tempo_ms(self) -> float:
+        return self.__tempo_ms
+
+    def avancar(self, ms: float) -> None:
+        self.__tempo_ms += ms
+
+    def definir(self, ms: float) -> None:
+        self.__tempo_ms = float(ms)
+
+    def esperar(self, ms: int) -> None:
+        # Não bloqueia: apenas faz o tempo virtual passar
+        self.avancar(ms)
+
+
+class RelogioPassoFixo(RelogioVirtual):
+    """
+    Relógio da física em passo fixo: como o virtual, anda exatamente um
+    passo a cada `avancar`, então todo passo enxerga o mesmo tempo que a
+    reprodução verá. Mas `esperar` bloqueia de verdade, para as pausas do
+    jogo (troca de nível, game over) continuarem visíveis na tela.
+    """
+    def esperar(self, ms: int) -> None:
+        pygame.time.wait(ms)
+        self.avancar(ms)
+
+
+# Relógio usado pelas entidades e pelo gerenciador (trocado pelo modo headless)
+_relogio_atual = RelogioPygame()
+
+def get_relogio():
+    return _relogio_atual
+
+def set_relogio(novo_relogio) -> None:
+    global _relogio_atual
+    _relogio_atual = novo_relogio
+
+def get_ticks() -> int:
+    return _relogio_atual.get_ticks()
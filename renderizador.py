@@ -0,0 +1,67 @@
+from typing import Iterable, Optional
+import pygame
+from config import LIMITE_AREA_SUJA
+
+
+class RenderizadorSujo:
+    """
+    Renderização por retângulos sujos. O fundo é uma Surface estática; a cada
+    frame só as áreas onde algo foi desenhado no frame anterior são
+    restauradas a partir dele, e só essas áreas mais as do frame atual são
+    enviadas ao display com `pygame.display.update`. Quando a soma das áreas
+    passa de `limite_area` (fração da tela), um `flip` completo sai mais
+    barato e é usado no lugar.
+    """
+    def __init__(self, tela: pygame.Surface, limite_area: float = LIMITE_AREA_SUJA):
+        self.__tela = tela
+        self.__area_tela = tela.get_width() * tela.get_height()
+        self.__limite_area = limite_area
+        self.__fundo: Optional[pygame.Surface] = None
+        self.__rects_anteriores: list[pygame.Rect] = []
+        self.__rects_invalidos: list[pygame.Rect] = []
+        self.__quadro_completo = True
+        self.__frames_parciais = 0
+        self.__frames_completos = 0
+        self.__pixels_enviados = 0
+
+    def is_quadro_completo(self) -> bool: return self.__quadro_completo
+
+    def set_fundo(self, fundo: pygame.Surface) -> None:
+        self.__fundo = fundo
+        self.invalidar()
+
+    def invalidar(self, rect: Optional[pygame.Rect] = None) -> None:
+        """Marca `rect` (ou a tela inteira, se omitido) para ser refeito no próximo frame."""
+        if rect is None: self.__quadro_completo = True
+        else: self.__rects_invalidos.append(pygame.Rect(rect))
+
+    def limpar(self) -> None:
+        """Apaga o que foi desenhado no frame anterior, copiando o fundo por cima."""
+        tela, fundo = self.__tela, self.__fundo
+        if self.__quadro_completo:
+            tela.blit(fundo, (0, 0))
+            return
+        for rect in self.__rects_anteriores: tela.blit(fundo, rect, rect)
+        for rect in self.__rects_invalidos: tela.blit(fundo, rect, rect)
+
+    def apresentar(self, rects_desenhados: Iterable[pygame.Rect]) -> None:
+        """Envia ao display as áreas alteradas neste frame (ou a tela inteira)."""
+        atuais = [r for r in rects_desenhados if r]
+        sujos = self.__rects_anteriores + self.__rects_invalidos + atuais
+        area = sum(r.w * r.h for r in sujos)
+        if self.__quadro_completo or area > self.__limite_area * self.__area_tela:
+            pygame.display.flip()
+            self.__frames_completos += 1
+            self.__pixels_enviados += self.__area_tela
+        else:
+            pygame.display.update(sujos)
+            self.__frames_parciais += 1
+            self.__pixels_enviados += area
+        self.__rects_anteriores = atuais
+        self.__rects_invalidos = []
+        self.__quadro_completo = False
+
+    def get_estatisticas(self) -> dict:
+        frames = self.__frames_parciais + self.__frames_completos
+        return {"frames_parciais": self.__frames_parciais, "frames_completos": self.__frames_completos,
+                "fracao_media_enviada": self.__pixels_enviados / (frames * self.__area_tela) if frames else 0.0}
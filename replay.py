@@ -0,0 +1,110 @@
+"""
+Gravação e reprodução de partidas.
+
+Um replay guarda a semente do gerador aleatório da partida, o instante do
+relógio em que ela começou e, para cada frame, o instante congelado do
+relógio, o delta de tempo (exato, em segundos, desde a versão 2) e os
+controles pressionados. Com isso a lógica
+do jogo pode ser refeita bit a bit, sem tela e sem esperar o tempo real:
+
+    python replay.py partida.rpl
+"""
+import struct
+import zlib
+from typing import Optional
+from config import BACKEND_ENTIDADES
+from entrada import EntradaJogo
+
+MAGICO = b"ASRP"
+VERSAO = 2
+# magico, versao, semente, ticks do início, número de frames
+_CABECALHO = struct.Struct("<4sBQII")
+# ticks do frame, delta (v1: ms inteiros; v2: segundos em double), controles empacotados.
+# Com a física em passo fixo o delta é 1/TAXA_FISICA, que não cabe em ms inteiros.
+_FRAME_POR_VERSAO = {1: struct.Struct("<IHB"), 2: struct.Struct("<IdB")}
+
+
+class ReplayInvalido(Exception):
+    pass
+
+
+class GravadorEntrada:
+    """Acumula os frames de uma partida em memória, num buffer binário compacto."""
+    def __init__(self, semente: int, ticks_inicio: int):
+        self.__semente = semente
+        self.__ticks_inicio = ticks_inicio
+        self.__dados = bytearray()
+        self.__num_frames = 0
+
+    def get_num_frames(self) -> int: return self.__num_frames
+
+    def registrar(self, ticks: int, delta_tempo: float, entrada: EntradaJogo) -> None:
+        self.__dados += _FRAME_POR_VERSAO[VERSAO].pack(ticks, delta_tempo, entrada.para_bits())
+        self.__num_frames += 1
+
+    def salvar(self, caminho: str) -> None:
+        with open(caminho, "wb") as f:
+            f.write(_CABECALHO.pack(MAGICO, VERSAO, self.__semente, self.__ticks_inicio, self.__num_frames))
+            f.write(zlib.compress(bytes(self.__dados)))
+
+
+class Replay:
+    def __init__(self, semente: int, ticks_inicio: int, frames: list[tuple[int, float, EntradaJogo]]):
+        self.__semente = semente
+        self.__ticks_inicio = ticks_inicio
+        self.__frames = frames
+
+    def get_semente(self) -> int: return self.__semente
+    def get_ticks_inicio(self) -> int: return self.__ticks_inicio
+    def get_frames(self) -> list[tuple[int, float, EntradaJogo]]: return self.__frames
+
+
+def carregar_replay(caminho: str) -> Replay:
+    with open(caminho, "rb") as f:
+        dados = f.read()
+    if len(dados) < _CABECALHO.size:
+        raise ReplayInvalido("Arquivo de replay truncado.")
+    magico, versao, semente, ticks_inicio, num_frames = _CABECALHO.unpack_from(dados)
+    if magico != MAGICO or versao not in _FRAME_POR_VERSAO:
+        raise ReplayInvalido(f"Formato de replay desconhecido ({magico!r}, versão {versao}).")
+    try:
+        corpo = zlib.decompress(dados[_CABECALHO.size:])
+    except zlib.error as e:
+        raise ReplayInvalido(f"Corpo do replay corrompido: {e}")
+    formato = _FRAME_POR_VERSAO[versao]
+    if len(corpo) != num_frames * formato.size:
+        raise ReplayInvalido("Número de frames não confere com o cabeçalho.")
+    escala = 1000.0 if versao == 1 else 1.0
+    frames = [(ticks, delta / escala, EntradaJogo.de_bits(bits)) for ticks, delta, bits in formato.iter_unpack(corpo)]
+    return Replay(semente, ticks_inicio, frames)
+
+
+def reproduzir(replay: Replay, backend: str = BACKEND_ENTIDADES, ate_frame: Optional[int] = None):
+    """Refaz a partida em modo headless, o mais rápido possível, e devolve o GerenciadorJogo final."""
+    from gerenciador import GerenciadorJogo
+    from relogio import RelogioVirtual
+
+    relogio_virtual = RelogioVirtual(replay.get_ticks_inicio())
+    jogo = GerenciadorJogo(None, None, None, backend, relogio_virtual, arquivo_trace=None, semente=replay.get_semente())
+    jogo.reiniciar_jogo_completo(apagar_save=False)
+    frames = replay.get_frames() if ate_frame is None else replay.get_frames()[:ate_frame]
+    for ticks, delta_tempo, entrada in frames:
+        relogio_virtual.definir(ticks)
+        jogo.executar_frame(entrada, delta_tempo)
+    return jogo
+
+
+if __name__ == '__main__':
+    import argparse
+    import time
+    parser = argparse.ArgumentParser(description="Reproduz um replay em modo headless")
+    parser.add_argument("arquivo")
+    parser.add_argument("--backend", choices=("objetos", "numpy"), default=BACKEND_ENTIDADES)
+    args = parser.parse_args()
+    replay = carregar_replay(args.arquivo)
+    inicio = time.perf_counter()
+    jogo = reproduzir(replay, args.backend)
+    duracao = time.perf_counter() - inicio
+    frames = len(replay.get_frames())
+    print(f"{frames} frames reproduzidos em {duracao:.2f} s ({frames / max(duracao, 1e-9):.0f} frames/s)")
+    print(f"Semente {replay.get_semente()} | pontuação {jogo.get_pontuacao()} | vidas {jogo.get_vidas()} | nível {jogo.get_nivel_atual()} | game over: {jogo.is_game_over()}")
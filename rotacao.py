@@ -0,0 +1,49 @@
+import pygame
+from config import PASSOS_ROTACAO_ATLAS
+
+
+class AtlasRotacao:
+    """
+    Guarda versões rotacionadas de uma imagem em ângulos quantizados, junto
+    com a máscara de colisão de cada uma. Os quadros são gerados sob demanda:
+    só os ângulos realmente pedidos são renderizados, e apenas uma vez.
+    Com `suave`, os quadros usam `rotozoom` (com antialiasing) em vez de `rotate`.
+    """
+    def __init__(self, imagem: pygame.Surface, passos: int = PASSOS_ROTACAO_ATLAS, suave: bool = False):
+        self.__imagem = imagem
+        self.__passos = max(1, int(passos))
+        self.__suave = suave
+        self.__quadros: dict[int, tuple[pygame.Surface, pygame.mask.Mask]] = {}
+
+    def get_passos(self) -> int: return self.__passos
+    def get_num_quadros_gerados(self) -> int: return len(self.__quadros)
+
+    def indice_para(self, angulo_graus: float) -> int:
+        return round(angulo_graus * self.__passos / 360.0) % self.__passos
+
+    def get_quadro(self, angulo_graus: float) -> tuple[pygame.Surface, pygame.mask.Mask]:
+        """Retorna (imagem, máscara) para o ângulo, no mesmo sentido de `pygame.transform.rotate`."""
+        return self.get_quadro_indice(self.indice_para(angulo_graus))
+
+    def get_quadro_indice(self, indice: int) -> tuple[pygame.Surface, pygame.mask.Mask]:
+        quadro = self.__quadros.get(indice)
+        if quadro is None:
+            angulo = indice * 360.0 / self.__passos
+            imagem = pygame.transform.rotozoom(self.__imagem, angulo, 1.0) if self.__suave else pygame.transform.rotate(self.__imagem, angulo)
+            quadro = (imagem, pygame.mask.from_surface(imagem))
+            self.__quadros[indice] = quadro
+        return quadro
+
+
+# Um atlas por imagem-base compartilhada (as Surfaces vêm do cache de recursos)
+_atlas_por_imagem: dict[tuple[pygame.Surface, bool], AtlasRotacao] = {}
+
+def get_atlas(imagem: pygame.Surface, suave: bool = False) -> AtlasRotacao:
+    atlas = _atlas_por_imagem.get((imagem, suave))
+    if atlas is None:
+        atlas = AtlasRotacao(imagem, suave=suave)
+        _atlas_por_imagem[(imagem, suave)] = atlas
+    return atlas
+
+def limpar_atlas() -> None:
+    _atlas_por_imagem.clear()
@@ -0,0 +1,270 @@
+"""
+Formato binário do save do jogo.
+
+    cabeçalho: mágico "ASSV", versão, tamanho do corpo, CRC32 do corpo
+    corpo:     pontuação, vidas, nível, game over, instante do save (v2)
+               tabela de strings (nomes de classe, de lista, tamanhos, caminhos...)
+               seções, uma por (lista, classe): número de registros e os
+               registros de tamanho fixo, empacotados com `struct`
+
+Cada classe de entidade tem um esquema com os campos do seu `to_dict`, então
+a conversão passa pelos mesmos dicionários do save JSON antigo, que continua
+legível para migração. A gravação acontece numa thread própria: o arquivo é
+escrito ao lado com extensão .tmp e trocado pelo definitivo com `os.replace`,
+então um save nunca fica pela metade.
+
+`ServicoAutosave` usa o mesmo formato para manter um anel de pontos de
+restauração, gravados periodicamente durante a partida.
+"""
+import json
+import os
+import struct
+import time
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional, Sequence
+from config import ARQUIVO_SAVE_GAME, ARQUIVO_SAVE_GAME_JSON, INTERVALO_AUTOSAVE_SEGUNDOS, NUM_PONTOS_RESTAURACAO, DIRETORIO_AUTOSAVE
+
+MAGICO = b"ASSV"
+VERSAO = 2
+_CABECALHO = struct.Struct("<4sHII")
+# pontuação, vidas, nível atual, game over e, a partir da versão 2, o instante do save (time.time())
+_GLOBAIS_POR_VERSAO = {1: struct.Struct("<qqq?"), 2: struct.Struct("<qqq?d")}
+# lista, classe (índices na tabela de strings), número de registros
+_SECAO = struct.Struct("<HHI")
+_NUM_STRINGS = struct.Struct("<H")
+
+# Códigos de campo: d = float, i/q = inteiro, ? = bool, s = string (índice na tabela),
+# v = vetor (x, y), V = vetor opcional (presente, x, y)
+_FORMATOS = {"d": "d", "i": "i", "q": "q", "?": "?", "s": "H", "v": "dd", "V": "?dd"}
+_BASE = (("posicao", "v"), ("velocidade", "v"), ("raio", "d"), ("ativo", "?"))
+_ESQUEMAS = {
+    "Nave": (("angulo_graus", "d"), ("tem_tiro_triplo", "?"), ("tempo_fim_tiro_triplo_restante_ms", "q"), ("invulneravel_fim_restante_ms", "q")),
+    "Projetil": (("frames_vividos", "i"),),
+    "Asteroide": (("tamanho_str", "s"), ("pontos", "i"), ("angulo_rotacao", "d"), ("velocidade_rotacao", "d")),
+    "OVNIProjetil": (("tempo_criacao_relativo_ms", "q"), ("imagem_path", "s")),
+    "OvniX": (("ultimo_tiro_tempo_ms_relativo", "q"),),
+    "OvniCruz": (("ultimo_tiro_tempo_ms_relativo", "q"),),
+    "NaveFantasma": (("estado", "s"), ("tempo_proxima_acao_restante_ms", "q"), ("alvo_disparo", "V")),
+    "LaserFantasma": (("direcao", "v"),),
+}
+_STRUCTS = {classe: struct.Struct("<" + "".join(_FORMATOS[c] for _, c in _BASE + campos)) for classe, campos in _ESQUEMAS.items()}
+LISTAS = ("asteroides", "projeteis", "ovnis", "ovni_projeteis", "fantasmas", "lasers_fantasma")
+
+
+class SaveInvalido(Exception):
+    pass
+
+
+class _TabelaStrings:
+    def __init__(self):
+        self.__indices: dict[str, int] = {}
+
+    def indice(self, texto: str) -> int:
+        indice = self.__indices.get(texto)
+        if indice is None:
+            indice = self.__indices[texto] = len(self.__indices)
+        return indice
+
+    def empacotar(self) -> bytes:
+        partes = [_NUM_STRINGS.pack(len(self.__indices))]
+        for texto in self.__indices:
+            dados = texto.encode("utf-8")
+            partes.append(_NUM_STRINGS.pack(len(dados)) + dados)
+        return b"".join(partes)
+
+
+def _achatar(entidade: dict, campos: tuple, strings: _TabelaStrings) -> list:
+    valores = []
+    for nome, codigo in campos:
+        valor = entidade.get(nome)
+        if codigo == "v": valores += (valor["x"], valor["y"])
+        elif codigo == "V": valores += (True, valor["x"], valor["y"]) if valor else (False, 0.0, 0.0)
+        elif codigo == "s": valores.append(strings.indice(valor))
+        else: valores.append(valor)
+    return valores
+
+
+def _remontar(valores: tuple, campos: tuple, strings: list[str], classe: str) -> dict:
+    entidade, i = {"classe_tipo": classe}, 0
+    for nome, codigo in campos:
+        if codigo == "v":
+            entidade[nome] = {"x": valores[i], "y": valores[i + 1]}; i += 2
+        elif codigo == "V":
+            entidade[nome] = {"x": valores[i + 1], "y": valores[i + 2]} if valores[i] else None; i += 3
+        else:
+            entidade[nome] = strings[valores[i]] if codigo == "s" else valores[i]; i += 1
+    return entidade
+
+
+def codificar_estado(estado: dict) -> bytes:
+    """Converte o dicionário de estado (o mesmo do save JSON) para o formato binário."""
+    strings = _TabelaStrings()
+    secoes = []
+    listas = [("nave", [estado["nave"]] if estado.get("nave") else [])] + [(nome, estado.get(nome, [])) for nome in LISTAS]
+    for nome_lista, entidades in listas:
+        # Agrupa por classe, mantendo a ordem relativa dentro de cada classe
+        por_classe: dict[str, list[dict]] = {}
+        for entidade in entidades: por_classe.setdefault(entidade["classe_tipo"], []).append(entidade)
+        for classe, grupo in por_classe.items():
+            if classe not in _ESQUEMAS: raise SaveInvalido(f"Classe sem esquema de save: {classe}")
+            formato, campos = _STRUCTS[classe], _BASE + _ESQUEMAS[classe]
+            registros = b"".join(formato.pack(*_achatar(e, campos, strings)) for e in grupo)
+            secoes.append(_SECAO.pack(strings.indice(nome_lista), strings.indice(classe), len(grupo)) + registros)
+    globais = _GLOBAIS_POR_VERSAO[VERSAO].pack(estado["pontuacao"], estado["vidas"], estado["nivel_atual"], estado["game_over"], estado.get("salvo_em", 0.0))
+    corpo = globais + strings.empacotar() + b"".join(secoes)
+    return _CABECALHO.pack(MAGICO, VERSAO, len(corpo), zlib.crc32(corpo)) + corpo
+
+
+def decodificar_estado(dados: bytes) -> dict:
+    if len(dados) < _CABECALHO.size: raise SaveInvalido("Save truncado.")
+    magico, versao, tamanho, crc = _CABECALHO.unpack_from(dados)
+    if magico != MAGICO or versao not in _GLOBAIS_POR_VERSAO: raise SaveInvalido(f"Formato de save desconhecido ({magico!r}, versão {versao}).")
+    corpo = memoryview(dados)[_CABECALHO.size:]
+    if len(corpo) != tamanho or zlib.crc32(corpo) != crc: raise SaveInvalido("Save corrompido (tamanho ou checksum não conferem).")
+    try:
+        globais = _GLOBAIS_POR_VERSAO[versao]
+        pontuacao, vidas, nivel_atual, game_over, *salvo_em = globais.unpack_from(corpo)
+        pos = globais.size
+        (num_strings,) = _NUM_STRINGS.unpack_from(corpo, pos); pos += _NUM_STRINGS.size
+        strings = []
+        for _ in range(num_strings):
+            (tamanho_str,) = _NUM_STRINGS.unpack_from(corpo, pos); pos += _NUM_STRINGS.size
+            strings.append(bytes(corpo[pos:pos + tamanho_str]).decode("utf-8")); pos += tamanho_str
+        estado = {"pontuacao": pontuacao, "vidas": vidas, "nivel_atual": nivel_atual, "game_over": game_over, "salvo_em": salvo_em[0] if salvo_em else 0.0, "nave": None}
+        estado.update({nome: [] for nome in LISTAS})
+        while pos < len(corpo):
+            indice_lista, indice_classe, quantidade = _SECAO.unpack_from(corpo, pos); pos += _SECAO.size
+            nome_lista, classe = strings[indice_lista], strings[indice_classe]
+            formato, campos = _STRUCTS[classe], _BASE + _ESQUEMAS[classe]
+            entidades = [_remontar(valores, campos, strings, classe) for valores in formato.iter_unpack(corpo[pos:pos + quantidade * formato.size])]
+            pos += quantidade * formato.size
+            if nome_lista == "nave": estado["nave"] = entidades[0] if entidades else None
+            else: estado[nome_lista].extend(entidades)
+    except (struct.error, IndexError, KeyError, UnicodeDecodeError) as e:
+        raise SaveInvalido(f"Save malformado: {e}")
+    return estado
+
+
+def ler_save(caminho: str = ARQUIVO_SAVE_GAME, caminho_json: str = ARQUIVO_SAVE_GAME_JSON) -> Optional[dict]:
+    """Lê o save binário ou, na falta dele, o save JSON antigo. Retorna None se não houver save."""
+    if os.path.exists(caminho):
+        with open(caminho, "rb") as f: return decodificar_estado(f.read())
+    if os.path.exists(caminho_json):
+        with open(caminho_json, "r") as f: return json.load(f)
+    return None
+
+
+def ler_save_mais_recente(caminhos_extras: Sequence[str] = ()) -> Optional[dict]:
+    """
+    O save continuável mais recente entre o save principal e `caminhos_extras`
+    (os pontos de restauração). Arquivos corrompidos e partidas já encerradas
+    são ignorados; saves sem instante (JSON antigo, versão 1) contam como os mais velhos.
+    """
+    candidatos = []
+    try: candidatos.append(ler_save())
+    except (SaveInvalido, OSError, json.JSONDecodeError) as e: print(f"Save principal ignorado: {e}")
+    for caminho in caminhos_extras:
+        if not os.path.exists(caminho): continue
+        try:
+            with open(caminho, "rb") as f: candidatos.append(decodificar_estado(f.read()))
+        except (SaveInvalido, OSError) as e: print(f"Ponto de restauração ignorado ({caminho}): {e}")
+    validos = [e for e in candidatos if e and not e.get("game_over") and e.get("nave")]
+    return max(validos, key=lambda e: e.get("salvo_em", 0.0), default=None)
+
+
+# --- Gravação em segundo plano ---
+# Uma única thread de gravação: saves e remoções são aplicados na ordem em que foram pedidos
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="salvamento")
+_ultima_tarefa: Optional[Future] = None
+
+
+def _agendar(funcao, *args) -> Future:
+    global _ultima_tarefa
+    _ultima_tarefa = _executor.submit(funcao, *args)
+    return _ultima_tarefa
+
+
+def _gravar(estado: dict, caminho: str, caminho_json: Optional[str], anunciar: bool) -> None:
+    try:
+        dados = codificar_estado(estado)
+        diretorio = os.path.dirname(caminho)
+        if diretorio: os.makedirs(diretorio, exist_ok=True)
+        temporario = caminho + ".tmp"
+        with open(temporario, "wb") as f:
+            f.write(dados); f.flush(); os.fsync(f.fileno())
+        os.replace(temporario, caminho)
+        # O save JSON antigo já foi migrado; removê-lo evita que ele reapareça após um game over
+        if caminho_json and os.path.exists(caminho_json): os.remove(caminho_json)
+        if anunciar: print(f"Estado do jogo salvo com sucesso ({len(dados)} bytes).")
+    except (OSError, SaveInvalido, KeyError, TypeError, struct.error) as e: print(f"Erro ao salvar o estado do jogo: {e}")
+
+
+def _remover(caminho: str, caminho_json: Optional[str]) -> None:
+    for arquivo in (caminho, caminho_json):
+        if arquivo and os.path.exists(arquivo):
+            try: os.remove(arquivo)
+            except OSError as e: print(f"Erro ao remover save antigo: {e}")
+
+
+def salvar_em_segundo_plano(estado: dict, caminho: str = ARQUIVO_SAVE_GAME, caminho_json: Optional[str] = ARQUIVO_SAVE_GAME_JSON, anunciar: bool = True) -> Future:
+    """Agenda a gravação de `estado`; o dicionário não deve ser alterado depois disso."""
+    return _agendar(_gravar, estado, caminho, caminho_json, anunciar)
+
+
+def remover_save(caminho: str = ARQUIVO_SAVE_GAME, caminho_json: Optional[str] = ARQUIVO_SAVE_GAME_JSON) -> Future:
+    return _agendar(_remover, caminho, caminho_json)
+
+
+def aguardar_gravacoes() -> None:
+    """Bloqueia até que todos os saves e remoções pendentes tenham sido aplicados."""
+    if _ultima_tarefa is not None: _ultima_tarefa.result()
+
+
+# --- Autosave ---
+def caminhos_pontos_restauracao(num_pontos: int = NUM_PONTOS_RESTAURACAO, diretorio: str = DIRETORIO_AUTOSAVE) -> list[str]:
+    return [os.path.join(diretorio, f"autosave_{i}.sav") for i in range(num_pontos)]
+
+
+class ServicoAutosave:
+    """
+    Anel de pontos de restauração. A cada `intervalo_segundos` de jogo o
+    estado é capturado no loop principal (só a cópia em dicionários, bem
+    abaixo de 1 ms) e a codificação e a escrita vão para a thread de
+    salvamento, sobrescrevendo o ponto mais antigo do anel.
+    """
+    def __init__(self, intervalo_segundos: float = INTERVALO_AUTOSAVE_SEGUNDOS, num_pontos: int = NUM_PONTOS_RESTAURACAO, diretorio: str = DIRETORIO_AUTOSAVE):
+        self.__intervalo_ms = int(intervalo_segundos * 1000)
+        self.__caminhos = caminhos_pontos_restauracao(num_pontos, diretorio)
+        self.__proximo_ms: Optional[int] = None
+        self.__proximo_slot = self._slot_mais_antigo()
+        self.__num_snapshots = 0
+        self.__ultima_captura_ms = 0.0
+
+    def get_caminhos(self) -> list[str]: return self.__caminhos
+    def get_num_snapshots(self) -> int: return self.__num_snapshots
+    def get_ultima_captura_ms(self) -> float: return self.__ultima_captura_ms
+
+    def _slot_mais_antigo(self) -> int:
+        """Um slot vazio ou, se o anel estiver cheio, o que foi gravado há mais tempo."""
+        def idade(i: int) -> float:
+            return os.path.getmtime(self.__caminhos[i]) if os.path.exists(self.__caminhos[i]) else -1.0
+        return min(range(len(self.__caminhos)), key=idade)
+
+    def atualizar(self, agora_ms: int, capturar_estado: Callable[[], dict]) -> bool:
+        """Chamado a cada frame; tira um snapshot quando o intervalo venceu. Retorna se tirou."""
+        if self.__proximo_ms is None: self.__proximo_ms = agora_ms + self.__intervalo_ms
+        if agora_ms < self.__proximo_ms: return False
+        inicio = time.perf_counter()
+        salvar_em_segundo_plano(capturar_estado(), self.__caminhos[self.__proximo_slot], caminho_json=None, anunciar=False)
+        self.__ultima_captura_ms = (time.perf_counter() - inicio) * 1000
+        self.__proximo_slot = (self.__proximo_slot + 1) % len(self.__caminhos)
+        self.__proximo_ms = agora_ms + self.__intervalo_ms
+        self.__num_snapshots += 1
+        return True
+
+    def limpar(self) -> None:
+        """Descarta todos os pontos de restauração (a partida terminou normalmente)."""
+        for caminho in self.__caminhos: remover_save(caminho, caminho_json=None)
+        self.__proximo_ms = None
+        self.__proximo_slot = 0
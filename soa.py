@@ -0,0 +1,239 @@
+from typing import Iterable, Optional
+from config import FPS, LARGURA_TELA, ALTURA_TELA, DURACAO_PROJETIL, PASSOS_ROTACAO_ATLAS
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele o jogo usa o caminho objeto-a-objeto
+    np = None
+
+
+def numpy_disponivel() -> bool:
+    return np is not None
+
+
+def _envolver(x, y, raio) -> None:
+    """Wrap-around vetorizado, com a mesma regra de `Vetor2D.envolver`."""
+    max_x, max_y = LARGURA_TELA + raio, ALTURA_TELA + raio
+    x[:] = np.where(x < -raio, max_x, np.where(x > max_x, -raio, x))
+    y[:] = np.where(y < -raio, max_y, np.where(y > max_y, -raio, y))
+
+
+# Colunas de um BlocoSoA (linhas da matriz `dados`). QUADRO é o índice no
+# atlas de rotação; CX/CY, o centro do rect no último passo; ORDEM, a ordem
+# de chegada, que é a mesma das listas do GerenciadorJogo.
+(X, Y, VX, VY, RAIO, ANGULO, VEL_ANGULAR, VIDA, QUADRO, CX, CY,
+ CX_ANTERIOR, CY_ANTERIOR, TEM_ANTERIOR, ENVOLVENTE, ORDEM) = range(16)
+NUM_COLUNAS = 16
+
+
+class BlocoSoA:
+    """
+    Estado de um tipo de entidade em colunas NumPy pré-alocadas. As vagas
+    [0, n) guardam exatamente as entidades ativas, e cada entidade sabe a
+    própria vaga: remover uma copia a última vaga para o buraco (swap-remove),
+    então nada é realocado nem recopiado entre um frame e outro. A
+    capacidade dobra quando enche.
+    """
+    def __init__(self, capacidade: int = 256):
+        self.dados = np.zeros((NUM_COLUNAS, capacidade))
+        self.entidades: list = []
+        self.__proxima_ordem = 0
+
+    def __len__(self) -> int: return len(self.entidades)
+
+    def adicionar(self, entidade) -> None:
+        vaga = len(self.entidades)
+        if vaga == self.dados.shape[1]:
+            maior = np.zeros((NUM_COLUNAS, 2 * vaga))
+            maior[:, :vaga] = self.dados
+            self.dados = maior
+        self.entidades.append(entidade)
+        self.dados[ORDEM, vaga] = self.__proxima_ordem
+        self.dados[TEM_ANTERIOR, vaga] = 0
+        self.__proxima_ordem += 1
+        entidade.vincular_soa(self, vaga)
+
+    def remover(self, vaga: int) -> None:
+        """Tira a entidade da vaga (ela volta a guardar o próprio estado) e fecha o buraco com a última."""
+        self.entidades[vaga].desvincular_soa()
+        ultima = len(self.entidades) - 1
+        if vaga != ultima:
+            self.dados[:, vaga] = self.dados[:, ultima]
+            movida = self.entidades[ultima]
+            self.entidades[vaga] = movida
+            movida.set_vaga_soa(vaga)
+        self.entidades.pop()
+
+    def desativar_marcadas(self, marcadas) -> None:
+        """Desativa (e assim remove) as entidades das vagas marcadas."""
+        # Da maior vaga para a menor: a última vaga nunca é uma ainda por remover
+        for vaga in np.flatnonzero(marcadas)[::-1].tolist(): self.entidades[vaga].set_ativo(False)
+
+    def limpar(self) -> None:
+        for entidade in reversed(self.entidades): entidade.desvincular_soa()
+        self.entidades.clear()
+
+
+class ArmazemSoA:
+    """
+    Backend "structure of arrays" para asteroides e projéteis.
+
+    Posição, velocidade, raio, ângulo, tempo de vida e o centro do rect de
+    cada entidade moram num `BlocoSoA`, que é a fonte da verdade enquanto a
+    entidade está em jogo. Integração, wrap-around, rotação e expiração
+    rodam como operações vetoriais sobre as colunas, sem copiar nada de ou
+    para os objetos. `Asteroide` e `Projetil` viram visões da sua vaga: os
+    getters leem as colunas, e imagem, máscara e rect são derivados delas
+    na hora, para o desenho, as colisões finas e o save.
+
+    O GerenciadorJogo vincula as entidades ao pô-las nas listas
+    (`vincular`); uma entidade desativada sai do bloco sozinha.
+    """
+    def __init__(self):
+        if np is None:
+            raise RuntimeError("O backend SoA precisa do NumPy instalado.")
+        self.__asteroides = BlocoSoA()
+        self.__projeteis = BlocoSoA()
+        self.__blocos = {"asteroides": self.__asteroides, "projeteis": self.__projeteis}
+
+    def get_bloco(self, nome: str) -> Optional[BlocoSoA]: return self.__blocos.get(nome)
+
+    def vincular(self, nome: str, entidades: Iterable) -> None:
+        """Passa para o bloco `nome` as entidades ativas ainda soltas (listas sem bloco são ignoradas)."""
+        bloco = self.__blocos.get(nome)
+        if bloco is None: return
+        for entidade in entidades:
+            if entidade.is_ativo() and entidade.get_bloco_soa() is None: bloco.adicionar(entidade)
+
+    def limpar(self, nome: Optional[str] = None) -> None:
+        for chave, bloco in self.__blocos.items():
+            if nome is None or chave == nome: bloco.limpar()
+
+    def atualizar(self, delta_tempo: float) -> None:
+        """Equivalente em lote a chamar `atualizar` em cada asteroide e projétil em jogo."""
+        passo = delta_tempo * FPS
+        d, n = self.__asteroides.dados, len(self.__asteroides)
+        if n:
+            x, y, angulo = d[X, :n], d[Y, :n], d[ANGULO, :n]
+            angulo[:] = (angulo + d[VEL_ANGULAR, :n] * passo) % 360
+            x += d[VX, :n] * passo
+            y += d[VY, :n] * passo
+            _envolver(x, y, d[RAIO, :n])
+            d[QUADRO, :n] = np.round(angulo * PASSOS_ROTACAO_ATLAS / 360.0) % PASSOS_ROTACAO_ATLAS
+            d[CX, :n] = np.trunc(x)
+            d[CY, :n] = np.trunc(y)
+
+        d, n = self.__projeteis.dados, len(self.__projeteis)
+        if n:
+            x, y, vida = d[X, :n], d[Y, :n], d[VIDA, :n]
+            x += d[VX, :n] * passo
+            y += d[VY, :n] * passo
+            _envolver(x, y, d[RAIO, :n])
+            d[CX, :n] = np.trunc(x)
+            d[CY, :n] = np.trunc(y)
+            vida += passo
+            expirou = vida > DURACAO_PROJETIL
+            if expirou.any(): self.__projeteis.desativar_marcadas(expirou)
+
+    def guardar_estados_anteriores(self) -> None:
+        """Equivalente em lote a `guardar_estado_anterior` (interpolação do desenho)."""
+        for bloco in self.__blocos.values():
+            d, n = bloco.dados, len(bloco)
+            d[CX_ANTERIOR, :n] = d[CX, :n]
+            d[CY_ANTERIOR, :n] = d[CY, :n]
+            d[TEM_ANTERIOR, :n] = 1
+
+    def pares_candidatos(self) -> list[tuple]:
+        """
+        Broadphase círculo-círculo vetorizada (sweep-and-prune no eixo x) dos
+        asteroides. Cada um é envolvido por um círculo que cobre o rect de
+        qualquer quadro de rotação, então todo par com rects sobrepostos
+        aparece na saída. Os pares saem como (asteroide, asteroide), na ordem
+        das listas do jogo, como em `GradeEspacial.pares_candidatos`.
+        """
+        bloco = self.__asteroides
+        d, n = bloco.dados, len(bloco)
+        if n < 2: return []
+        x, y, raio = d[CX, :n], d[CY, :n], d[ENVOLVENTE, :n]
+
+        ordem = np.argsort(x - raio, kind="stable")
+        inicio, fim = (x - raio)[ordem], (x + raio)[ordem]
+        # Para o i-ésimo intervalo (ordenado), os vizinhos são os seguintes que começam antes do seu fim
+        limite = np.searchsorted(inicio, fim, side="right")
+        base = np.arange(n)
+        contagem = np.maximum(limite - base - 1, 0)
+        total = int(contagem.sum())
+        if total == 0: return []
+        a = np.repeat(base, contagem)
+        b = a + 1 + (np.arange(total) - np.repeat(np.cumsum(contagem) - contagem, contagem))
+        i, j = ordem[a], ordem[b]
+
+        dx, dy, soma = x[i] - x[j], y[i] - y[j], raio[i] + raio[j]
+        perto = dx * dx + dy * dy <= soma * soma
+        i, j = i[perto], j[perto]
+        # A ordem de chegada das vagas é a posição nas listas do jogo
+        chegada = d[ORDEM, :n]
+        troca = chegada[i] > chegada[j]
+        primeiro, segundo = np.where(troca, j, i), np.where(troca, i, j)
+        ordem_pares = np.lexsort((chegada[segundo], chegada[primeiro]))
+        entidades = bloco.entidades
+        return [(entidades[p], entidades[q]) for p, q in zip(primeiro[ordem_pares].tolist(), segundo[ordem_pares].tolist())]
+
+
+def _benchmark():
+    """Compara o backend SoA com o caminho objeto-a-objeto (atualização e broadphase)."""
+    import os
+    import random
+    import time
+    import pygame
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    from colisao import GradeEspacial
+    from entidades import Asteroide, Projetil
+    from vetor import Vetor2D
+
+    def cena(n: int, semente: int):
+        random.seed(semente)
+        aleatoria = lambda: Vetor2D(random.uniform(0, LARGURA_TELA), random.uniform(0, ALTURA_TELA))
+        asteroides = [Asteroide(aleatoria(), random.choice(list(Asteroide.TAMANHOS))) for _ in range(n)]
+        projeteis = [Projetil(aleatoria(), Vetor2D(random.uniform(-10, 10), random.uniform(-10, 10))) for _ in range(n // 2)]
+        return asteroides, projeteis
+
+    def cronometrar(funcao, frames: int) -> float:
+        inicio = time.perf_counter()
+        for _ in range(frames): funcao()
+        return (time.perf_counter() - inicio) / frames * 1000
+
+    armazem, frames, dt = ArmazemSoA(), 30, 1 / FPS
+    grade = GradeEspacial(2 * max(raio for raio, _ in Asteroide.TAMANHOS.values()))
+    def broadphase_grade(asteroides):
+        grade.construir(asteroides)
+        return grade.pares_candidatos()
+
+    print(f"{'asteroides':>10} | {'atualizar (ms/frame)':^21} | {'broadphase (ms/frame)':^21}")
+    print(f"{'':>10} | {'objetos':>10} {'SoA':>10} | {'grade':>10} {'SoA':>10}")
+    for n in (100, 250, 500, 1000, 2000):
+        asteroides, projeteis = cena(n, n)
+        entidades = asteroides + projeteis
+        for e in entidades: e.atualizar(0)  # aquece o atlas de rotação antes de medir
+        def passo_objetos():
+            for e in entidades: e.atualizar(dt)
+        atualizar_obj = cronometrar(passo_objetos, frames)
+        estado_obj = [(a.get_posicao().to_dict(), a.get_angulo_rotacao()) for a in asteroides]
+        broad_grade = cronometrar(lambda: broadphase_grade(asteroides), frames)
+
+        asteroides, projeteis = cena(n, n)
+        for e in asteroides + projeteis: e.atualizar(0)
+        armazem.limpar()
+        armazem.vincular("asteroides", asteroides); armazem.vincular("projeteis", projeteis)
+        atualizar_soa = cronometrar(lambda: armazem.atualizar(dt), frames)
+        assert estado_obj == [(a.get_posicao().to_dict(), a.get_angulo_rotacao()) for a in asteroides], "SoA divergiu do caminho por objeto"
+        broad_soa = cronometrar(armazem.pares_candidatos, frames)
+        pares = {(asteroides[i], asteroides[j]) for i, j in broadphase_grade(asteroides)}
+        assert {p for p in pares if p[0].colide_com(p[1])} <= set(armazem.pares_candidatos()), "Broadphase SoA perdeu pares"
+        print(f"{n:>10} | {atualizar_obj:>10.2f} {atualizar_soa:>10.2f} | {broad_grade:>10.2f} {broad_soa:>10.2f}")
+
+
+if __name__ == '__main__':
+    _benchmark()
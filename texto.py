@@ -0,0 +1,40 @@
+from collections import OrderedDict
+import pygame
+
+
+class CacheTexto:
+    """
+    Cache LRU de textos já rasterizados, com chave (fonte, texto, cor).
+    Renderizar uma fonte é caro; a maior parte dos textos do jogo se repete
+    de um frame para o outro, então basta renderizar cada um uma vez.
+    As Surfaces devolvidas são compartilhadas e não devem ser alteradas.
+    """
+    def __init__(self, capacidade: int = 128):
+        self.__capacidade = capacidade
+        self.__superficies: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+        self.__acertos = 0
+        self.__faltas = 0
+
+    def render(self, fonte: pygame.font.Font, texto: str, cor: tuple, antialias: bool = True) -> pygame.Surface:
+        chave = (fonte, texto, cor, antialias)
+        superficie = self.__superficies.get(chave)
+        if superficie is not None:
+            self.__superficies.move_to_end(chave)
+            self.__acertos += 1
+            return superficie
+        self.__faltas += 1
+        superficie = fonte.render(texto, antialias, cor)
+        self.__superficies[chave] = superficie
+        if len(self.__superficies) > self.__capacidade:
+            self.__superficies.popitem(last=False)  # descarta o usado há mais tempo
+        return superficie
+
+    def get_estatisticas(self) -> dict:
+        return {"acertos": self.__acertos, "faltas": self.__faltas, "textos": len(self.__superficies)}
+
+    def limpar(self) -> None:
+        self.__superficies.clear()
+
+
+# Instância compartilhada pelo HUD e pelas telas do jogo
+cache_texto = CacheTexto()
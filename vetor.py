@@ -1,49 +1,49 @@
 import math
 
 class Vetor2D:
+    # __slots__ evita o __dict__ por instância e deixa o acesso aos campos direto
+    __slots__ = ("x", "y")
+
     def __init__(self, x=0.0, y=0.0):
-        # O construtor agora usa os setters para definir os valores iniciais
-        self.set_x(x)
-        self.set_y(y)
+        self.x = float(x)
+        self.y = float(y)
 
     # --- Getters e Setters ---
     def get_x(self) -> float: 
-        return self.__x
+        return self.x
 
     def get_y(self) -> float: 
-        return self.__y
+        return self.y
 
     def set_x(self, novo_x: float): 
-        self.__x = float(novo_x)
+        self.x = float(novo_x)
 
     def set_y(self, novo_y: float): 
-        self.__y = float(novo_y)
+        self.y = float(novo_y)
 
     # --- Métodos de Operação ---
     def __add__(self, outro: 'Vetor2D') -> 'Vetor2D':
-        # Acessar os valores de ambos os vetores
-        return Vetor2D(self.get_x() + outro.get_x(), self.get_y() + outro.get_y())
+        return Vetor2D(self.x + outro.x, self.y + outro.y)
 
     def __sub__(self, outro: 'Vetor2D') -> 'Vetor2D':
-        return Vetor2D(self.get_x() - outro.get_x(), self.get_y() - outro.get_y())
+        return Vetor2D(self.x - outro.x, self.y - outro.y)
 
     def __mul__(self, escalar: float) -> 'Vetor2D':
-        return Vetor2D(self.get_x() * escalar, self.get_y() * escalar)
+        return Vetor2D(self.x * escalar, self.y * escalar)
     
     def __rmul__(self, escalar: float) -> 'Vetor2D':
-        # Esta chamada já usa o __mul__ modificado
         return self.__mul__(escalar)
 
     def __neg__(self):
-        return Vetor2D(-self.get_x(), -self.get_y())
+        return Vetor2D(-self.x, -self.y)
 
     def __truediv__(self, escalar: float) -> 'Vetor2D':
         if escalar == 0:
             raise ZeroDivisionError("Divisão de Vetor2D por zero.")
-        return Vetor2D(self.get_x() / escalar, self.get_y() / escalar)
+        return Vetor2D(self.x / escalar, self.y / escalar)
 
     def magnitude(self) -> float:
-        return math.hypot(self.get_x(), self.get_y())
+        return math.hypot(self.x, self.y)
 
     def normalizar(self) -> 'Vetor2D':
         mag = self.magnitude()
@@ -53,27 +53,100 @@ class Vetor2D:
         cos_a = math.cos(angulo_rad)
         sin_a = math.sin(angulo_rad)
         # Ccálculos de rotação
-        novo_x = self.get_x() * cos_a - self.get_y() * sin_a
-        novo_y = self.get_x() * sin_a + self.get_y() * cos_a
+        novo_x = self.x * cos_a - self.y * sin_a
+        novo_y = self.x * sin_a + self.y * cos_a
         return Vetor2D(novo_x, novo_y)
     
     def distancia_ate(self, outro: 'Vetor2D') -> float:
-        return (self - outro).magnitude()
+        return math.hypot(self.x - outro.x, self.y - outro.y)
     
     def dot(self, outro: 'Vetor2D') -> float:
         # Produto escalar
-        return self.get_x() * outro.get_x() + self.get_y() * outro.get_y()
+        return self.x * outro.x + self.y * outro.y
+
+    # --- Operações in-place (não alocam; retornam o próprio vetor) ---
+    # Atenção: alteram o objeto, então só devem ser usadas em vetores que não
+    # estejam compartilhados com outras entidades.
+    def iadd(self, outro: 'Vetor2D') -> 'Vetor2D':
+        self.x += outro.x
+        self.y += outro.y
+        return self
+
+    def imul(self, escalar: float) -> 'Vetor2D':
+        self.x *= escalar
+        self.y *= escalar
+        return self
+
+    def iadd_escalado(self, outro: 'Vetor2D', escalar: float) -> 'Vetor2D':
+        """Equivale a `self = self + outro * escalar`, sem criar vetores."""
+        self.x += outro.x * escalar
+        self.y += outro.y * escalar
+        return self
+
+    def envolver(self, min_x: float, max_x: float, min_y: float, max_y: float) -> 'Vetor2D':
+        """Wrap-around: quem sai por um lado do retângulo reaparece no outro."""
+        if self.x < min_x: self.x = max_x
+        elif self.x > max_x: self.x = min_x
+        if self.y < min_y: self.y = max_y
+        elif self.y > max_y: self.y = min_y
+        return self
 
     # --- Métodos de Conversão ---
     def to_dict(self) -> dict:
-        return {"x": self.get_x(), "y": self.get_y()}
+        return {"x": self.x, "y": self.y}
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Vetor2D':
         return cls(data["x"], data["y"])
     
     def para_tupla(self) -> tuple[int, int]:
-        return (int(self.get_x()), int(self.get_y()))
+        return (int(self.x), int(self.y))
 
     def copia(self) -> 'Vetor2D':
-        return Vetor2D(self.get_x(), self.get_y())
+        return Vetor2D(self.x, self.y)
+
+
+def _benchmark_alocacoes(num_entidades: int = 200, num_frames: int = 600):
+    """
+    Conta quantos Vetor2D são criados por frame no movimento de `num_entidades`
+    objetos, comparando a forma com operadores (antiga) com a forma in-place.
+    """
+    import time
+    contador = [0]
+    init_original = Vetor2D.__init__
+    def init_contando(self, x=0.0, y=0.0):
+        contador[0] += 1
+        init_original(self, x, y)
+
+    def com_operadores(posicoes, velocidades, dt):
+        for i, vel in enumerate(velocidades):
+            nova = posicoes[i] + vel * dt * 60
+            if nova.get_x() < -10: nova.set_x(810)
+            elif nova.get_x() > 810: nova.set_x(-10)
+            if nova.get_y() < -10: nova.set_y(610)
+            elif nova.get_y() > 610: nova.set_y(-10)
+            posicoes[i] = nova
+            nova.para_tupla()
+
+    def in_place(posicoes, velocidades, dt):
+        for pos, vel in zip(posicoes, velocidades):
+            pos.iadd_escalado(vel, dt * 60).envolver(-10, 810, -10, 610)
+            pos.para_tupla()
+
+    for nome, passo in (("operadores", com_operadores), ("in-place", in_place)):
+        posicoes = [Vetor2D(i % 800, i % 600) for i in range(num_entidades)]
+        velocidades = [Vetor2D(1.5, -0.5) for _ in range(num_entidades)]
+        Vetor2D.__init__ = init_contando
+        contador[0] = 0
+        try:
+            passo(posicoes, velocidades, 1 / 60)
+        finally:
+            Vetor2D.__init__ = init_original
+        inicio = time.perf_counter()
+        for _ in range(num_frames): passo(posicoes, velocidades, 1 / 60)
+        tempo_us = (time.perf_counter() - inicio) / num_frames * 1e6
+        print(f"{nome:>10}: {contador[0]:>5} Vetor2D/frame, {tempo_us:8.1f} us/frame ({num_entidades} entidades)")
+
+
+if __name__ == '__main__':
+    _benchmark_alocacoes()